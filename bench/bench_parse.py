@@ -0,0 +1,216 @@
+"""
+    Parse micro benchmarks, offline
+
+    python bench/bench_parse.py [-o results.json] [--baseline old.json] [--seconds 0.5]
+
+    bench/corpus has one whois response per file, the file name is the domain,
+    one per registry family (icann gtld, denic, nominet, jprs, tcinet, afnic, sidn, registro.br, ...).
+    The responses are made by hand in the format of those registries, with example data.
+
+    Measured separately, per tld, in operations per second with p50 and p99 per operation [us]
+    (operations of at least PER_CALL_US are timed one by one, faster ones in batches of ~1ms:
+    their p50/p99 are percentiles of batch means, marked with the batch size in the output):
+    - cleanup:      cleanupWhoisResponse()
+    - do_parse:     do_parse(), that includes cleanup
+    - str_to_date:  the uncached date parsing of the three dates of the response
+    - str_to_date_memo: the same through the memo in front of it (all hits)
+    - domain:       Domain() from the do_parse() result
+    and the time of a fresh "import whois".
+
+    The results are written as json; with --baseline the ratios to an earlier run are printed.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS = os.path.join(ROOT, "bench", "corpus")
+
+sys.path.insert(0, ROOT)
+
+import whois  # noqa: E402
+from whois._2_parse import cleanupWhoisResponse, do_parse  # noqa: E402
+from whois._3_adjust import Domain, _str_to_date, str_to_date  # noqa: E402
+
+DATE_FIELDS = ("creation_date", "expiration_date", "updated_date")
+
+# calls at least this long [us] are timed one by one, perf_counter() itself costs well under 1us
+PER_CALL_US = 20
+
+
+def load_corpus(path: str = CORPUS) -> List[Tuple[str, str, List[str], str]]:
+    # (domain, tld, domain parts, response) for every response in the corpus
+    out = []
+    for name in sorted(os.listdir(path)):
+        with open(os.path.join(path, name), "r") as f:
+            response = f.read()
+
+        prepared = whois._prepareDomain(name, server=None, slow_down=0, verbose=False, transport="subprocess")
+        if prepared is None:
+            continue
+        d, tld, _, _ = prepared
+        out.append((name, tld, d, response))
+
+    return out
+
+
+def percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    i = min(len(values) - 1, max(0, int(round(p / 100 * (len(values) - 1)))))
+    return values[i]
+
+
+def measure(fn: Callable[[], Any], seconds: float) -> Dict[str, Any]:
+    """
+    Call fn repeatedly for about `seconds`.
+    Returns ops/s and p50/p99 of the time per call [us], per call when fn takes at least PER_CALL_US,
+    otherwise of batch means (batch > 1) so the timer does not dominate fast calls.
+    """
+    fn()  # warm up, also fills lazy tables
+
+    # batch size: one call if that is well above the timer resolution, else aim at ~1ms per sample
+    t = time.perf_counter()
+    fn()
+    once = max(time.perf_counter() - t, 1e-7)
+    batch = 1 if once * 1e6 >= PER_CALL_US else max(1, int(0.001 / once))
+
+    samples = []
+    calls = 0
+    start = time.perf_counter()
+    while 1:
+        t = time.perf_counter()
+        for _ in range(batch):
+            fn()
+        elapsed = time.perf_counter() - t
+        samples.append(elapsed / batch * 1e6)
+        calls += batch
+        if time.perf_counter() - start >= seconds:
+            break
+
+    total = time.perf_counter() - start
+    return {
+        "ops_per_s": round(calls / total, 1),
+        "p50_us": round(percentile(samples, 50), 3),
+        "p99_us": round(percentile(samples, 99), 3),
+        "calls": calls,
+        "batch": batch,
+    }
+
+
+def bench_import(runs: int = 10) -> Dict[str, Any]:
+    # every run in a fresh interpreter, nothing imported before
+    code = "import time; t = time.perf_counter(); import whois; print(time.perf_counter() - t)"
+    env = dict(os.environ, PYTHONPATH=ROOT)
+
+    times = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+        times.append(float(out.stdout) * 1000)
+
+    return {
+        "p50_ms": round(statistics.median(times), 2),
+        "min_ms": round(min(times), 2),
+        "max_ms": round(max(times), 2),
+        "runs": runs,
+    }
+
+
+def bench_parse(seconds: float) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def add(stage: str, tld: str, fn: Callable[[], Any]) -> None:
+        try:
+            r = measure(fn, seconds)
+        except Exception as e:
+            r = {"error": f"{type(e).__name__}: {e}"}
+        results.setdefault(stage, {})[tld] = r
+
+    for domain, tld, d, response in load_corpus():
+        pd = do_parse(response, tld, d)
+        dates = [pd[k][0] for k in DATE_FIELDS if pd and pd.get(k) and pd[k][0]]
+
+        add("cleanup", tld, lambda: cleanupWhoisResponse(response))
+        add("do_parse", tld, lambda: do_parse(response, tld, d))
+        add("str_to_date", tld, lambda: [_str_to_date(s, tld) for s in dates])
+        add("str_to_date_memo", tld, lambda: [str_to_date(s, tld) for s in dates])
+        add("domain", tld, lambda: Domain(pd))
+
+    return results
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=ROOT
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(now: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    # ops/s now / ops/s baseline, > 1 is faster
+    print(f"{'stage':>18} {'tld':>8} {'baseline':>12} {'now':>12} {'ratio':>7}")
+    for stage, tlds in now["parse"].items():
+        for tld, r in tlds.items():
+            old = baseline.get("parse", {}).get(stage, {}).get(tld, {})
+            if "ops_per_s" in r and old.get("ops_per_s"):
+                ratio = r["ops_per_s"] / old["ops_per_s"]
+                print(f"{stage:>18} {tld:>8} {old['ops_per_s']:>12.0f} {r['ops_per_s']:>12.0f} {ratio:>7.2f}")
+
+    old_import = baseline.get("import", {}).get("p50_ms")
+    if old_import:
+        print(f"{'import whois':>27} {old_import:>12.1f} {now['import']['p50_ms']:>12.1f} ms")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="whois parse micro benchmarks")
+    parser.add_argument("-o", "--output", default="bench-results.json")
+    parser.add_argument("--baseline", default=None, help="an earlier results file to compare with")
+    parser.add_argument("--seconds", type=float, default=0.5, help="per stage and tld")
+    args = parser.parse_args(argv)
+
+    results = {
+        "environment": environment(),
+        "import": bench_import(),
+        "parse": bench_parse(args.seconds),
+    }
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"wrote {args.output}", file=sys.stderr)
+
+    for stage, tlds in results["parse"].items():
+        for tld, r in tlds.items():
+            if "error" in r:
+                print(f"{stage:>18} {tld:>8} {r['error']}")
+            else:
+                batch = r.get("batch", 1)
+                print(
+                    f"{stage:>18} {tld:>8} {r['ops_per_s']:>12.0f}/s "
+                    f"p50 {r['p50_us']:>9.2f}us p99 {r['p99_us']:>9.2f}us"
+                    + (f" (means of {batch} calls)" if batch > 1 else "")
+                )
+    print(f"{'import whois':>27} {results['import']['p50_ms']:.1f} ms (p50)")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+    End to end query benchmark against the stand-in whois server, offline
+
+    python bench/bench_query.py [-o results.json] [--concurrency 1,4,16,64] [--queries 500] [--mode thread]
+
+    Starts bench/whois_server.py in its own process (so it does not share our GIL)
+    and runs whois.query() (threads) or whois.aquery() (asyncio) with the socket transport
+    at each level of concurrency, with force=True so every query goes over the network and is parsed.
+    Reports queries/s, p50/p99 latency and the outcomes (ok, none, exceptions) per level,
+    and writes them as json; with --baseline the ratios to an earlier run are printed.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import whois  # noqa: E402
+
+from bench_parse import environment, percentile  # noqa: E402
+from whois_server import load_responses  # noqa: E402
+
+
+def start_server(args: argparse.Namespace) -> Tuple[subprocess.Popen, str]:
+    cmd = [
+        sys.executable,
+        os.path.join(ROOT, "bench", "whois_server.py"),
+        "--port=0",
+        f"--latency={args.latency}",
+        f"--jitter={args.jitter}",
+        f"--reset={args.reset}",
+        f"--quota={args.quota}",
+        f"--trickle={args.trickle}",
+    ]
+    p = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    address = p.stdout.readline().strip()  # type: ignore
+    return p, address
+
+
+def _outcome(result: Any) -> str:
+    if isinstance(result, Exception):
+        return type(result).__name__
+    return "ok" if result else "none"
+
+
+def _timed_query(domain: str, server: str, timeout: float) -> Tuple[float, str]:
+    t = time.perf_counter()
+    try:
+        r: Any = whois.query(domain, force=True, transport="socket", server=server, timeout=timeout)
+    except Exception as e:
+        r = e
+    return time.perf_counter() - t, _outcome(r)
+
+
+async def _timed_aquery(domain: str, server: str, timeout: float) -> Tuple[float, str]:
+    t = time.perf_counter()
+    try:
+        r: Any = await whois.aquery(domain, force=True, transport="socket", server=server, timeout=timeout)
+    except Exception as e:
+        r = e
+    return time.perf_counter() - t, _outcome(r)
+
+
+def run_threads(domains: List[str], server: str, concurrency: int, timeout: float) -> List[Tuple[float, str]]:
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(lambda d: _timed_query(d, server, timeout), domains))
+
+
+def run_async(domains: List[str], server: str, concurrency: int, timeout: float) -> List[Tuple[float, str]]:
+    import asyncio
+
+    async def run() -> List[Tuple[float, str]]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(d: str) -> Tuple[float, str]:
+            async with semaphore:
+                return await _timed_aquery(d, server, timeout)
+
+        return await asyncio.gather(*(one(d) for d in domains))
+
+    return asyncio.run(run())
+
+
+def bench_level(
+    domains: List[str],
+    server: str,
+    concurrency: int,
+    mode: str,
+    timeout: float,
+) -> Dict[str, Any]:
+    run = run_async if mode == "async" else run_threads
+
+    start = time.perf_counter()
+    results = run(domains, server, concurrency, timeout)
+    elapsed = time.perf_counter() - start
+
+    latencies = [r[0] * 1000 for r in results]
+    outcomes: Dict[str, int] = {}
+    for _, outcome in results:
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    return {
+        "concurrency": concurrency,
+        "queries": len(results),
+        "qps": round(len(results) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies), 2),
+        "outcomes": outcomes,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="whois end to end query benchmark")
+    parser.add_argument("-o", "--output", default="bench-query-results.json")
+    parser.add_argument("--baseline", default=None, help="an earlier results file to compare with")
+    parser.add_argument("--concurrency", default="1,4,16,64")
+    parser.add_argument("--queries", type=int, default=500, help="per level")
+    parser.add_argument("--mode", choices=["thread", "async"], default="thread")
+    parser.add_argument("--timeout", type=float, default=5)
+    parser.add_argument("--latency", type=float, default=0.02, help="server latency [s]")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--reset", type=float, default=0.01, help="fraction of connections reset")
+    parser.add_argument("--quota", type=float, default=0.01, help="fraction of quota answers")
+    parser.add_argument("--trickle", type=float, default=0.01, help="fraction of slow answers")
+    args = parser.parse_args(argv)
+
+    names = sorted(load_responses())
+    domains = [names[i % len(names)] for i in range(args.queries)]
+
+    p, server = start_server(args)
+    try:
+        levels = []
+        for c in (int(x) for x in args.concurrency.split(",")):
+            r = bench_level(domains, server, c, args.mode, args.timeout)
+            levels.append(r)
+            print(
+                f"concurrency {c:>4}: {r['qps']:>8.1f} q/s p50 {r['p50_ms']:>8.2f}ms p99 {r['p99_ms']:>8.2f}ms "
+                f"{r['outcomes']}"
+            )
+    finally:
+        p.terminate()
+        p.wait()
+
+    results = {
+        "environment": environment(),
+        "settings": {k: v for k, v in vars(args).items() if k not in ("output", "baseline")},
+        "levels": levels,
+    }
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"wrote {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            old = {r["concurrency"]: r for r in json.load(f)["levels"]}
+        for r in levels:
+            o = old.get(r["concurrency"])
+            if o:
+                print(
+                    f"concurrency {r['concurrency']:>4}: q/s {o['qps']:.1f} -> {r['qps']:.1f} "
+                    f"({r['qps'] / o['qps']:.2f}x), p99 {o['p99_ms']:.1f} -> {r['p99_ms']:.1f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
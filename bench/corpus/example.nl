@@ -0,0 +1,44 @@
+Domain name: example.nl
+Status:      active
+
+Registrar:
+   Example Registrar B.V.
+   Voorbeeldstraat 1
+   1234AB Amsterdam
+   Netherlands
+
+Abuse Contact:
+   +31.205550100
+   abuse@example-registrar.nl
+
+Creation Date: 1999-05-27
+
+Updated Date: 2023-03-14
+
+DNSSEC:      yes
+
+Domain nameservers:
+   ns1.example-dns.nl
+   ns2.example-dns.nl
+
+Record maintained by: NL Domain Registry
+
+Copyright notice
+No part of this publication may be reproduced, published, stored in a
+retrieval system, or transmitted, in any form or by any means,
+electronic, mechanical, recording, or otherwise, without prior
+permission of the Foundation for Internet Domain Registration in the
+Netherlands (SIDN).
+These restrictions apply equally to registrars, except in that
+reproductions and publications are permitted insofar as they are
+reasonable, necessary and solely in the context of the registration
+activities referred to in the General Terms and Conditions for .nl
+Registrars.
+Any use of this material for advertising, targeting commercial offers or
+similar activities is explicitly forbidden and liable to result in legal
+action. Anyone who is aware or suspects that such activities are taking
+place is asked to inform the Foundation for Internet Domain Registration
+in the Netherlands.
+(c) The Foundation for Internet Domain Registration in the Netherlands
+(SIDN) Dutch Copyright Act, protection of authors' rights (Section 10,
+subsection 1, clause 1).
@@ -0,0 +1,189 @@
+"""
+    A local stand-in for a port 43 whois server, for tests and benchmarks
+
+    python bench/whois_server.py [--port 4343] [--latency 0.02] [--reset 0.01] [--quota 0.01] [--trickle 0.01]
+
+    Replays the recorded responses of bench/corpus (file name = domain),
+    unknown domains get "No entries found". Faults are injected at random (seeded, repeatable):
+    - latency:  seconds before the answer, plus up to `jitter` seconds
+    - reset:    fraction of connections closed with a tcp reset instead of an answer
+    - quota:    fraction answered with a rate limit message ("% Quota exceeded", "try again later")
+    - trickle:  fraction answered in small chunks with a pause between them
+
+    Use it with: whois.query(domain, transport="socket", server="127.0.0.1:<port>")
+"""
+import argparse
+import os
+import random
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+
+from typing import Dict, Optional
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+NOT_FOUND = "No entries found for the selected source(s).\n"
+QUOTA_MESSAGES = [
+    "% Quota exceeded, please come back later\n",
+    "Your connection limit is reached, try again later\n",
+]
+
+
+def load_responses(path: str = CORPUS) -> Dict[str, str]:
+    out = {}
+    for name in os.listdir(path):
+        with open(os.path.join(path, name), "r") as f:
+            out[name.lower()] = f.read()
+    return out
+
+
+def query_domain(line: str) -> str:
+    # the domain out of the query line, also with the extra flags some servers need (see SOCKET_QUERY_FORMAT)
+    parts = line.strip().split()
+    domain = parts[-1] if parts else ""
+    if domain.endswith("/e"):
+        domain = domain[:-2]
+    return domain.lower()
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "StandInServer"
+
+    def handle(self) -> None:
+        srv = self.server
+        try:
+            line = self.request.makefile("rb").readline(1024).decode(errors="ignore")
+        except OSError:
+            return
+
+        fault = srv.pick_fault()
+        srv.count(fault)
+
+        delay = srv.latency + srv.rng_uniform(0, srv.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if fault == "reset":
+            # SO_LINGER 0: close() sends a RST instead of a FIN
+            self.request.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+            self.request.close()
+            return
+
+        if fault == "quota":
+            data = QUOTA_MESSAGES[srv.counts["quota"] % len(QUOTA_MESSAGES)].encode()
+        else:
+            domain = query_domain(line)
+            data = srv.responses.get(domain, NOT_FOUND).encode()
+
+        try:
+            if fault == "trickle":
+                for i in range(0, len(data), srv.trickle_chunk):
+                    self.request.sendall(data[i : i + srv.trickle_chunk])
+                    time.sleep(srv.trickle_delay)
+            else:
+                self.request.sendall(data)
+        except OSError:
+            pass
+
+
+class StandInServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        port: int = 0,
+        host: str = "127.0.0.1",
+        responses: Optional[Dict[str, str]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        reset: float = 0.0,
+        quota: float = 0.0,
+        trickle: float = 0.0,
+        trickle_chunk: int = 64,
+        trickle_delay: float = 0.005,
+        seed: int = 1,
+    ):
+        super().__init__((host, port), _Handler)
+        self.responses = load_responses() if responses is None else responses
+        self.latency = latency
+        self.jitter = jitter
+        self.faults = [("reset", reset), ("quota", quota), ("trickle", trickle)]
+        self.trickle_chunk = trickle_chunk
+        self.trickle_delay = trickle_delay
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {"queries": 0, "ok": 0, "reset": 0, "quota": 0, "trickle": 0}
+
+    @property
+    def address(self) -> str:
+        host, port = self.server_address[:2]
+        return f"{host}:{port}"
+
+    def rng_uniform(self, a: float, b: float) -> float:
+        if b <= a:
+            return a
+        with self._lock:
+            return self._rng.uniform(a, b)
+
+    def pick_fault(self) -> str:
+        with self._lock:
+            x = self._rng.random()
+        for name, p in self.faults:
+            if x < p:
+                return name
+            x -= p
+        return "ok"
+
+    def count(self, fault: str) -> None:
+        with self._lock:
+            self.counts["queries"] += 1
+            self.counts[fault] += 1
+
+    def start(self) -> "StandInServer":
+        # serve in a background thread
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="stand-in whois server replaying bench/corpus")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4343, help="0: any free port")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--reset", type=float, default=0.0)
+    parser.add_argument("--quota", type=float, default=0.0)
+    parser.add_argument("--trickle", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    server = StandInServer(
+        port=args.port,
+        host=args.host,
+        latency=args.latency,
+        jitter=args.jitter,
+        reset=args.reset,
+        quota=args.quota,
+        trickle=args.trickle,
+        seed=args.seed,
+    )
+    # the first line on stdout is the address, for scripts that start us with --port 0
+    print(server.address, flush=True)
+    print(f"serving {len(server.responses)} responses", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(server.counts, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,15 @@
+import subprocess
+import sys
 from distutils.core import setup
+from distutils.command.build_py import build_py
+
+
+class build_py_with_tld_table(build_py):
+    # regenerate whois/_tld_table.py from whois/tld_regexpr.py before packaging
+    def run(self):
+        subprocess.check_call([sys.executable, "-m", "whois._make_tld_table"])
+        build_py.run(self)
+
 
 setup(
     name="whois",
@@ -11,6 +22,7 @@ setup(
     url="https://github.com/DannyCork/python-whois/",
     platforms=["any"],
     packages=["whois"],
+    cmdclass={"build_py": build_py_with_tld_table},
     keywords=["Python", "whois", "tld", "domain", "expiration", "cctld", "domainer", ".com", "registrar"],
     classifiers=[
         "License :: OSI Approved :: MIT License",
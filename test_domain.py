@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+# offline checks of Domain, no network: python3 test_domain.py (or pytest test_domain.py)
+import os
+import struct
+import sys
+
+from whois import Domain, do_parse
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench", "corpus")
+
+
+def makeDomain(name: str = "example.com") -> Domain:
+    with open(os.path.join(CORPUS, name), "r") as f:
+        response = f.read()
+
+    d = name.split(".")
+    return Domain(do_parse(response, d[-1], d))
+
+
+def test_footprint():
+    d = makeDomain()
+    # object header (refcount, type) plus gc header, two pointers each, and one pointer per slot
+    limit = struct.calcsize("P") * (len(Domain.__slots__) + 4)
+    size = sys.getsizeof(d)
+    assert size <= limit, f"Domain takes {size} bytes, expected at most {limit}"
+    assert not hasattr(d, "__weakref__")
+
+
+def test_roundtrip():
+    d = makeDomain()
+    assert Domain.from_json(d.to_json()).to_dict() == d.to_dict()
+    assert Domain.from_dict(d.to_dict()).to_dict() == d.to_dict()
+    assert d.__dict__ == d.to_dict()
+
+
+def main():
+    test_footprint()
+    test_roundtrip()
+    print(f"ok, a Domain takes {sys.getsizeof(makeDomain())} bytes")
+
+
+if __name__ == "__main__":
+    main()
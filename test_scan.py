@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+# offline check of the FieldScanner against plain findall, no network: python3 test_scan.py (or pytest test_scan.py)
+# the scanner relies on the internals of the re module (sre_parse op names), this catches a change there
+import os
+
+from whois._2_parse import TLD_RE, cleanupWhoisResponse
+from whois._scan import FieldScanner
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench", "corpus")
+
+
+def corpusTexts():
+    for name in sorted(os.listdir(CORPUS)):
+        with open(os.path.join(CORPUS, name), "r") as f:
+            response = f.read()
+
+        # what do_parse scans, plus the raw text and other letter cases
+        for text in (cleanupWhoisResponse(response), response, response.upper(), response.lower()):
+            yield name, text
+
+
+def findallPerField(table, text):
+    return {k: v.findall(text) for k, v in table.items() if k[0] != "_" and v is not None and not isinstance(v, str)}
+
+
+def test_scanner_equals_findall():
+    texts = list(corpusTexts())
+    failed = []
+    for tld in TLD_RE:
+        table = TLD_RE[tld]
+        scanner = FieldScanner(table)
+        for name, text in texts:
+            if scanner.scan(text) != findallPerField(table, text):
+                failed.append(f"{tld}: {name}")
+
+    assert not failed, f"FieldScanner differs from findall for {len(failed)} cases: {failed[:10]}"
+
+
+def main():
+    test_scanner_equals_findall()
+    print(f"ok, {len(TLD_RE)} tlds")
+
+
+if __name__ == "__main__":
+    main()
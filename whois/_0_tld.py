@@ -0,0 +1,72 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+# marks the end of a suffix in a trie node, labels are always strings
+_END = None
+
+
+class TldTrie:
+    """
+    Reversed label trie of all supported suffixes: "com.au" is stored as au -> com.
+
+    lookup() walks the labels of a domain from the right
+    and returns the tld_regexpr key of the longest supported suffix,
+    in O(number of labels) no matter how many suffixes we know.
+    A suffix only matches if there is at least one label in front of it:
+    "google.com.au" gives com_au, "com.au" itself gives au.
+    """
+
+    def __init__(self) -> None:
+        self.root: Dict[Any, Any] = {}
+        self.size = 0
+
+    def add(self, suffix: str, key: str) -> None:
+        node = self.root
+        for label in reversed(suffix.strip(".").split(".")):
+            node = node.setdefault(label, {})
+
+        if _END not in node:
+            self.size += 1
+        node[_END] = key
+
+    def lookup(self, labels: List[str]) -> Optional[str]:
+        node = self.root
+        best = None
+        n = len(labels)
+        for i in range(n - 1, 0, -1):  # never the first label, that is the domain itself
+            node = node.get(labels[i])
+            if node is None:
+                break
+            if _END in node:
+                best = node[_END]
+        return best
+
+
+def tld_key_to_suffix(key: str) -> str:
+    # the reverse of the naming used in tld_regexpr: co_uk -> co.uk, global_ -> global
+    return key.rstrip("_").replace("_", ".")
+
+
+def build_tld_trie(
+    tlds: Iterable[str],
+    *maps: Dict[str, str],
+) -> TldTrie:
+    """
+    tlds: all keys from tld_regexpr (TLD_RE),
+    maps: the explicit suffix -> key translations (Map2Underscore, PythonKeyWordMap, Utf8Map),
+    keys that are the target of a map are only reachable through that map.
+    """
+    trie = TldTrie()
+
+    mapped = set()
+    for m in maps:
+        mapped.update(m.values())
+
+    for key in tlds:
+        if key not in mapped:
+            trie.add(tld_key_to_suffix(key), key)
+
+    for m in maps:
+        for suffix, key in m.items():
+            trie.add(suffix, key)
+
+    return trie
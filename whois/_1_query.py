@@ -1,28 +1,81 @@
 import subprocess
+import socket
 import time
 import sys
 import os
 import platform
 import json
+import re
+import threading
+import contextvars
+import functools
 from .exceptions import WhoisCommandFailed
+from ._ratelimit import RATE_LIMITER
+from ._hooks import HOOKS, emit, emit_cache
+from ._cache import LruCache, sqlite_cache, SQLITE_SUFFIXES
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 PYTHON_VERSION = sys.version_info[0]
-CACHE: Dict[str, Tuple[int, str]] = {}
 CACHE_MAX_AGE = 60 * 60 * 48  # 48h
+CACHE_MAX_ENTRIES = 100000  # use CACHE.resize() to change the limits, also max_bytes is possible
+CACHE: LruCache = LruCache(max_entries=CACHE_MAX_ENTRIES, max_age=CACHE_MAX_AGE)
+CACHE_LOCK = threading.Lock()  # queries may run in parallel threads, see query_many()
+# the json cache_file as last read, path -> all its entries; not bounded, the limits above are for memory only
+CACHE_FILE_DATA: Dict[str, Dict[str, Any]] = {}
+
+# negative results: not found / free domains (do_parse gives None) per domain and tlds we can not query at all
+# (UnknownTld, WhoisPrivateRegistry) per tld, kept shorter than the responses as free domains get registered
+NEGATIVE_CACHE_MAX_AGE = 60 * 60  # 1h
+NEGATIVE_CACHE_MAX_ENTRIES = 100000
+NEGATIVE_CACHE: LruCache = LruCache(max_entries=NEGATIVE_CACHE_MAX_ENTRIES, max_age=NEGATIVE_CACHE_MAX_AGE)
+
+# parsed results: domain -> (tld fingerprint, Domain.to_dict()), so a hit needs no cleanup, regexes or dates;
+# with a sqlite cache_file they are also stored in its whois_parsed table and survive a restart.
+# An entry with an other fingerprint than the current one (tld_regexpr.py or the date formats changed)
+# is not used: the domain is parsed again from the cached response and the entry replaced
+PARSED_CACHE_MAX_ENTRIES = 100000
+PARSED_CACHE: LruCache = LruCache(max_entries=PARSED_CACHE_MAX_ENTRIES, max_age=CACHE_MAX_AGE)
+
+# RFC 3912: a whois server listens on tcp port 43,
+# the client sends the query terminated by CRLF and the server closes the connection after the answer
+WHOIS_PORT = 43
+SOCKET_TIMEOUT = 10  # seconds, for connect and for each read
+
+# some servers need extra flags in the query to return the data in a parsable (english) form,
+# the linux whois binary does the same for these servers
+SOCKET_QUERY_FORMAT: Dict[str, str] = {
+    "whois.denic.de": "-T dn,ace {}",
+    "whois.jprs.jp": "{}/e",
+    "whois.verisign-grs.com": "domain {}",
+}
+
+# transport="referral": find the authoritative server ourselves like the whois binary does,
+# ask iana for the registry of the tld, then optionally follow the registrar referral of the registry
+IANA_WHOIS_SERVER = "whois.iana.org"
+FOLLOW_REGISTRAR = False  # True: append the registrar response to the registry response, one more round trip
+
+# the discovery hops are cached for the life of the process, so a repeat lookup costs one round trip
+REFERRAL_LOCK = threading.Lock()
+REGISTRY_SERVERS: Dict[str, Optional[str]] = {}  # tld -> registry whois server, None: iana knows none
+REGISTRAR_SERVERS: Dict[str, str] = {}  # registrar name (lower case) -> registrar whois server
+
+_IANA_REFER_RE = re.compile(r"^(?:refer|whois):[ \t]*(\S+)", re.IGNORECASE | re.MULTILINE)
+_REGISTRAR_SERVER_RE = re.compile(r"^[ \t]*Registrar WHOIS Server:[ \t]*(\S+)", re.IGNORECASE | re.MULTILINE)
+_REGISTRAR_NAME_RE = re.compile(r"^[ \t]*Registrar:[ \t]*(\S.*?)[ \t]*$", re.IGNORECASE | re.MULTILINE)
 
 
 def cache_load(cf: str) -> None:
     if not os.path.isfile(cf):
         return
 
-    global CACHE
     f = open(cf, "r")
 
     try:
-        CACHE = json.load(f)
+        data = json.load(f)
+        CACHE_FILE_DATA[cf] = data
+        CACHE.update(data)
     except Exception as e:
         print(f"ignore lson load err: {e}", file=sys.stderr)
 
@@ -30,13 +83,101 @@ def cache_load(cf: str) -> None:
 
 
 def cache_save(cf: str) -> None:
-    global CACHE
-
+    # everything read from the file plus what is in memory now, eviction must not drop entries from the file
+    data = CACHE_FILE_DATA.setdefault(cf, {})
+    data.update(CACHE.items())
     f = open(cf, "w")
-    json.dump(CACHE, f)
+    json.dump(data, f)
     f.close()
 
 
+def cache_stats() -> Dict[str, Any]:
+    # hits, misses, evictions and expirations of the in memory cache
+    return CACHE.stats()
+
+
+def negative_cache_stats() -> Dict[str, Any]:
+    return NEGATIVE_CACHE.stats()
+
+
+def parsed_cache_stats() -> Dict[str, Any]:
+    return PARSED_CACHE.stats()
+
+
+def rate_limit_key(
+    dl: List[str],
+    server: Optional[str] = None,
+) -> str:
+    # without an explicit server the whois binary picks the registry server for the tld
+    return server or dl[-1]
+
+
+def _use_sqlite(
+    cache_file: str,
+    cache_backend: Optional[str] = None,
+) -> bool:
+    # an explicit backend wins, otherwise decide on the file name
+    if cache_backend:
+        if cache_backend not in ("json", "sqlite"):
+            raise ValueError(f"unknown cache_backend: {cache_backend}")
+        return cache_backend == "sqlite"
+
+    return cache_file.endswith(SQLITE_SUFFIXES)
+
+
+def _cache_get(
+    k: str,
+    force: bool = False,
+    cache_file: Optional[str] = None,
+    cache_backend: Optional[str] = None,
+) -> Optional[Tuple[int, str]]:
+    # (timestamp, response) of a fresh entry, None if there is none
+    min_ts = time.time() - CACHE_MAX_AGE
+
+    if cache_file and _use_sqlite(cache_file, cache_backend):
+        # sqlite: only read the one row we need, memory stays the first level
+        entry = CACHE.get(k)
+        if not force and (entry is None or entry[0] < min_ts):
+            entry = sqlite_cache(cache_file).get(k, min_ts=int(min_ts))
+            if entry:
+                CACHE[k] = entry
+    else:
+        if cache_file:
+            with CACHE_LOCK:
+                cache_load(cache_file)
+        entry = CACHE.get(k)
+        if entry is None and cache_file:
+            entry = CACHE_FILE_DATA.get(cache_file, {}).get(k)
+
+    # actually also whois uses cache, so if you really dont want to use cache
+    # you should also pass the --force-lookup flag (on linux)
+    if force or entry is None or entry[0] < min_ts:
+        return None
+
+    return int(entry[0]), entry[1]
+
+
+def _cache_put(
+    k: str,
+    response: str,
+    cache_file: Optional[str] = None,
+    cache_backend: Optional[str] = None,
+) -> int:
+    # populate a fresh cache entry, returns its timestamp
+    ts = int(time.time())
+
+    if cache_file and _use_sqlite(cache_file, cache_backend):
+        CACHE[k] = (ts, response)
+        sqlite_cache(cache_file).put(k, ts, response)
+        return ts
+
+    with CACHE_LOCK:
+        CACHE[k] = (ts, response)
+        if cache_file:
+            cache_save(cache_file)
+    return ts
+
+
 def do_query(
     dl: List[str],
     force: bool = False,
@@ -45,42 +186,461 @@ def do_query(
     ignore_returncode: bool = False,
     server: Optional[str] = None,
     verbose: bool = False,
+    transport: str = "subprocess",
+    timeout: float = SOCKET_TIMEOUT,
+    cache_backend: Optional[str] = None,
 ) -> str:
+    return do_query_entry(
+        dl,
+        force=force,
+        cache_file=cache_file,
+        slow_down=slow_down,
+        ignore_returncode=ignore_returncode,
+        server=server,
+        verbose=verbose,
+        transport=transport,
+        timeout=timeout,
+        cache_backend=cache_backend,
+    )[1]
+
+
+def do_query_entry(
+    dl: List[str],
+    force: bool = False,
+    cache_file: Optional[str] = None,
+    slow_down: int = 0,
+    ignore_returncode: bool = False,
+    server: Optional[str] = None,
+    verbose: bool = False,
+    transport: str = "subprocess",
+    timeout: float = SOCKET_TIMEOUT,
+    cache_backend: Optional[str] = None,
+) -> Tuple[int, str]:
+    # (timestamp, response): the time the response was received, also when it comes from the cache
     k = ".".join(dl)
 
-    if cache_file:
-        cache_load(cache_file)
+    t = time.perf_counter() if HOOKS else 0.0
+    entry = _cache_get(k, force=force, cache_file=cache_file, cache_backend=cache_backend)
+    if HOOKS and not force:
+        emit_cache("cache", t, entry is not None)
 
-    # actually also whois uses cache, so if you really dont want to use cache
-    # you should also pass the --force-lookup flag (on linux)
-    if force or k not in CACHE or CACHE[k][0] < time.time() - CACHE_MAX_AGE:
-        # slow down before so we can force individual domains at a slower tempo
-        if slow_down:
-            time.sleep(slow_down)
-
-        # populate a fresh cache entry
-        CACHE[k] = (
-            int(time.time()),
-            _do_whois_query(
+    if entry is None:
+        # slow down before so we can force individual domains at a slower tempo,
+        # the wait only counts against earlier queries to the same whois server
+        RATE_LIMITER.wait(rate_limit_key(dl, server), slow_down)
+
+        # the rate limit wait is not part of the transport time
+        t = time.perf_counter() if HOOKS else 0.0
+        try:
+            r = _do_transport_query(
+                dl=dl,
+                ignore_returncode=ignore_returncode,
+                server=server,
+                verbose=verbose,
+                transport=transport,
+                timeout=timeout,
+            )
+        except Exception as e:
+            if HOOKS:
+                emit("transport", t, error=e)
+            raise
+        if HOOKS:
+            emit("transport", t)
+
+        entry = (_cache_put(k, r, cache_file=cache_file, cache_backend=cache_backend), r)
+
+    return entry
+
+
+async def run_cache_io(
+    path: Optional[str],
+    fn: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    # with a cache_file a cache lookup or update reads or writes a file (json: all of it),
+    # run it in a thread so it does not block the event loop; memory only (no path) stays on the loop
+    if not path:
+        return fn(*args, **kwargs)
+
+    import asyncio  # only when used, asyncio is slow to import
+
+    ctx = contextvars.copy_context()  # the hooks need the QueryContext of the caller
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(ctx.run, fn, *args, **kwargs))
+
+
+async def do_query_async(
+    dl: List[str],
+    force: bool = False,
+    cache_file: Optional[str] = None,
+    slow_down: int = 0,
+    ignore_returncode: bool = False,
+    server: Optional[str] = None,
+    verbose: bool = False,
+    transport: str = "subprocess",
+    timeout: float = SOCKET_TIMEOUT,
+    cache_backend: Optional[str] = None,
+) -> str:
+    """
+    Same as do_query() but the network part runs on the event loop,
+    reading and writing a cache_file in a thread, see run_cache_io().
+    """
+    entry = await do_query_entry_async(
+        dl,
+        force=force,
+        cache_file=cache_file,
+        slow_down=slow_down,
+        ignore_returncode=ignore_returncode,
+        server=server,
+        verbose=verbose,
+        transport=transport,
+        timeout=timeout,
+        cache_backend=cache_backend,
+    )
+    return entry[1]
+
+
+async def do_query_entry_async(
+    dl: List[str],
+    force: bool = False,
+    cache_file: Optional[str] = None,
+    slow_down: int = 0,
+    ignore_returncode: bool = False,
+    server: Optional[str] = None,
+    verbose: bool = False,
+    transport: str = "subprocess",
+    timeout: float = SOCKET_TIMEOUT,
+    cache_backend: Optional[str] = None,
+) -> Tuple[int, str]:
+    k = ".".join(dl)
+
+    t = time.perf_counter() if HOOKS else 0.0
+    entry = await run_cache_io(
+        cache_file, _cache_get, k, force=force, cache_file=cache_file, cache_backend=cache_backend
+    )
+    if HOOKS and not force:
+        emit_cache("cache", t, entry is not None)
+
+    if entry is None:
+        await RATE_LIMITER.wait_async(rate_limit_key(dl, server), slow_down)
+
+        # the rate limit wait is not part of the transport time
+        t = time.perf_counter() if HOOKS else 0.0
+        try:
+            r = await _do_transport_query_async(
                 dl=dl,
                 ignore_returncode=ignore_returncode,
                 server=server,
                 verbose=verbose,
-            ),
+                transport=transport,
+                timeout=timeout,
+            )
+        except Exception as e:
+            if HOOKS:
+                emit("transport", t, error=e)
+            raise
+        if HOOKS:
+            emit("transport", t)
+
+        ts = await run_cache_io(cache_file, _cache_put, k, r, cache_file=cache_file, cache_backend=cache_backend)
+        entry = (ts, r)
+
+    return entry
+
+
+def _do_transport_query(
+    dl: List[str],
+    ignore_returncode: bool,
+    server: Optional[str] = None,
+    verbose: bool = False,
+    transport: str = "subprocess",
+    timeout: float = SOCKET_TIMEOUT,
+) -> str:
+    if transport == "referral":
+        return _do_referral_query(
+            dl=dl,
+            server=server,
+            verbose=verbose,
+            timeout=timeout,
         )
 
-        if cache_file:
-            cache_save(cache_file)
+    if transport == "socket":
+        # without a known server we have no way to know where to go, let the whois binary find out
+        if server:
+            return _do_socket_query(
+                dl=dl,
+                server=server,
+                verbose=verbose,
+                timeout=timeout,
+            )
 
-    return CACHE[k][1]
+        if verbose:
+            print(f"no whois server known for {'.'.join(dl)}, falling back to subprocess", file=sys.stderr)
 
+    elif transport != "subprocess":
+        raise ValueError(f"unknown transport: {transport}")
 
-def _do_whois_query(
+    return _do_whois_query(
+        dl=dl,
+        ignore_returncode=ignore_returncode,
+        server=server,
+        verbose=verbose,
+    )
+
+
+async def _do_transport_query_async(
     dl: List[str],
     ignore_returncode: bool,
     server: Optional[str] = None,
     verbose: bool = False,
+    transport: str = "subprocess",
+    timeout: float = SOCKET_TIMEOUT,
+) -> str:
+    if transport == "referral":
+        return await _do_referral_query_async(
+            dl=dl,
+            server=server,
+            verbose=verbose,
+            timeout=timeout,
+        )
+
+    if transport == "socket":
+        if server:
+            return await _do_socket_query_async(
+                dl=dl,
+                server=server,
+                verbose=verbose,
+                timeout=timeout,
+            )
+
+        if verbose:
+            print(f"no whois server known for {'.'.join(dl)}, falling back to subprocess", file=sys.stderr)
+
+    elif transport != "subprocess":
+        raise ValueError(f"unknown transport: {transport}")
+
+    return await _do_whois_query_async(
+        dl=dl,
+        ignore_returncode=ignore_returncode,
+        server=server,
+        verbose=verbose,
+    )
+
+
+def _split_server(server: str) -> Tuple[str, int]:
+    # allow "host:port" so we can talk to a whois server on a non standard port
+    host, sep, port = server.rpartition(":")
+    if sep and port.isdigit() and ":" not in host:
+        return host, int(port)
+    return server, WHOIS_PORT
+
+
+def _socket_query_string(domain: str, host: str) -> bytes:
+    if not domain.isascii():
+        domain = domain.encode("idna").decode("ascii")
+
+    fmt = SOCKET_QUERY_FORMAT.get(host, "{}")
+    return (fmt.format(domain) + "\r\n").encode("ascii")
+
+
+def _do_socket_query(
+    dl: List[str],
+    server: str,
+    verbose: bool = False,
+    timeout: float = SOCKET_TIMEOUT,
+) -> str:
+    """
+    Talk RFC 3912 directly to the whois server on port 43, no subprocess involved.
+    """
+    domain = ".".join(dl)
+    host, port = _split_server(server)
+    if verbose:
+        print(f"socket query {domain} at {host}:{port}", file=sys.stderr)
+
+    chunks = []
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as s:
+            s.sendall(_socket_query_string(domain, host))
+            while 1:
+                data = s.recv(4096)
+                if not data:
+                    break
+                chunks.append(data)
+    except (OSError, UnicodeError) as e:
+        raise WhoisCommandFailed(f"socket query to {host}:{port} failed: {e}")
+
+    return b"".join(chunks).decode(errors="ignore")
+
+
+async def _do_socket_query_async(
+    dl: List[str],
+    server: str,
+    verbose: bool = False,
+    timeout: float = SOCKET_TIMEOUT,
+) -> str:
+    import asyncio  # only when used, asyncio is slow to import
+
+    domain = ".".join(dl)
+    host, port = _split_server(server)
+    if verbose:
+        print(f"async socket query {domain} at {host}:{port}", file=sys.stderr)
+
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        try:
+            writer.write(_socket_query_string(domain, host))
+            await writer.drain()
+            data = await asyncio.wait_for(reader.read(), timeout)
+        finally:
+            writer.close()
+    except (OSError, UnicodeError, asyncio.TimeoutError) as e:
+        raise WhoisCommandFailed(f"socket query to {host}:{port} failed: {e!r}")
+
+    return data.decode(errors="ignore")
+
+
+def _referral_server(value: str) -> Optional[str]:
+    # "whois://whois.example.com/", "whois.example.com" -> whois.example.com; urls of web forms are no use
+    value = value.strip().lower()
+    if value.startswith("whois://"):
+        value = value[len("whois://") :]
+    value = value.rstrip("/")
+    if not value or "/" in value or "." not in value:
+        return None
+    return value
+
+
+def _iana_registry_server(response: str) -> Optional[str]:
+    m = _IANA_REFER_RE.search(response)
+    return _referral_server(m.group(1)) if m else None
+
+
+def _registrar_server(response: str, registry: str) -> Optional[str]:
+    # the referral in the registry response, else what we learned earlier for the same registrar
+    m = _REGISTRAR_SERVER_RE.search(response)
+    name = _REGISTRAR_NAME_RE.search(response)
+    registrar = name.group(1).lower() if name else None
+
+    found = _referral_server(m.group(1)) if m else None
+    with REFERRAL_LOCK:
+        if found and registrar:
+            REGISTRAR_SERVERS[registrar] = found
+        elif registrar:
+            found = REGISTRAR_SERVERS.get(registrar)
+
+    if found and found != _split_server(registry)[0]:
+        return found
+    return None
+
+
+def _cached_registry_server(tld: str) -> Tuple[bool, Optional[str]]:
+    with REFERRAL_LOCK:
+        if tld in REGISTRY_SERVERS:
+            return True, REGISTRY_SERVERS[tld]
+    return False, None
+
+
+def _remember_registry_server(tld: str, response: str, verbose: bool = False) -> Optional[str]:
+    server = _iana_registry_server(response)
+    if verbose:
+        print(f"iana refers .{tld} to {server}", file=sys.stderr)
+
+    with REFERRAL_LOCK:
+        REGISTRY_SERVERS[tld] = server
+    return server
+
+
+def registry_server(
+    tld: str,
+    verbose: bool = False,
+    timeout: float = SOCKET_TIMEOUT,
+) -> Optional[str]:
+    # the whois server of the registry of the tld, asks iana once per tld
+    known, server = _cached_registry_server(tld)
+    if known:
+        return server
+
+    r = _do_socket_query(dl=[tld], server=IANA_WHOIS_SERVER, verbose=verbose, timeout=timeout)
+    return _remember_registry_server(tld, r, verbose=verbose)
+
+
+async def registry_server_async(
+    tld: str,
+    verbose: bool = False,
+    timeout: float = SOCKET_TIMEOUT,
+) -> Optional[str]:
+    known, server = _cached_registry_server(tld)
+    if known:
+        return server
+
+    r = await _do_socket_query_async(dl=[tld], server=IANA_WHOIS_SERVER, verbose=verbose, timeout=timeout)
+    return _remember_registry_server(tld, r, verbose=verbose)
+
+
+def _do_referral_query(
+    dl: List[str],
+    server: Optional[str] = None,
+    verbose: bool = False,
+    timeout: float = SOCKET_TIMEOUT,
 ) -> str:
+    """
+    Follow the referrals ourselves over port 43: iana -> registry (-> registrar if FOLLOW_REGISTRAR).
+    An explicit server (or a _server hint) is the registry, no discovery needed.
+    Like the whois binary the registrar response is appended to the registry response.
+    """
+    registry = server or registry_server(dl[-1], verbose=verbose, timeout=timeout)
+    if registry is None:
+        raise WhoisCommandFailed(f"no whois server known for .{dl[-1]}")
+
+    r = _do_socket_query(dl=dl, server=registry, verbose=verbose, timeout=timeout)
+    if not FOLLOW_REGISTRAR:
+        return r
+
+    registrar = _registrar_server(r, registry)
+    if registrar is None:
+        return r
+
+    try:
+        return r + "\n" + _do_socket_query(dl=dl, server=registrar, verbose=verbose, timeout=timeout)
+    except WhoisCommandFailed as e:
+        # the registry data is what we parse anyway
+        if verbose:
+            print(f"registrar referral to {registrar} failed: {e}", file=sys.stderr)
+        return r
+
+
+async def _do_referral_query_async(
+    dl: List[str],
+    server: Optional[str] = None,
+    verbose: bool = False,
+    timeout: float = SOCKET_TIMEOUT,
+) -> str:
+    registry = server or await registry_server_async(dl[-1], verbose=verbose, timeout=timeout)
+    if registry is None:
+        raise WhoisCommandFailed(f"no whois server known for .{dl[-1]}")
+
+    r = await _do_socket_query_async(dl=dl, server=registry, verbose=verbose, timeout=timeout)
+    if not FOLLOW_REGISTRAR:
+        return r
+
+    registrar = _registrar_server(r, registry)
+    if registrar is None:
+        return r
+
+    try:
+        return r + "\n" + await _do_socket_query_async(dl=dl, server=registrar, verbose=verbose, timeout=timeout)
+    except WhoisCommandFailed as e:
+        if verbose:
+            print(f"registrar referral to {registrar} failed: {e}", file=sys.stderr)
+        return r
+
+
+def _whois_cmd(
+    dl: List[str],
+    server: Optional[str] = None,
+    verbose: bool = False,
+) -> List[str]:
     if platform.system() == "Windows":
         """
         Windows 'whois' command wrapper
@@ -104,18 +664,24 @@ def _do_whois_query(
             )
 
         if server:
-            cmd = [r".\whois.exe ", ".".join(dl), server]
-        else:
-            cmd = [r".\whois.exe ", ".".join(dl)]
+            return [r".\whois.exe ", ".".join(dl), server]
+        return [r".\whois.exe ", ".".join(dl)]
 
-    else:
-        """
-        Linux 'whois' command wrapper
-        """
-        if server:
-            cmd = ["whois", ".".join(dl), "-h", server]
-        else:
-            cmd = ["whois", ".".join(dl)]
+    """
+    Linux 'whois' command wrapper
+    """
+    if server:
+        return ["whois", ".".join(dl), "-h", server]
+    return ["whois", ".".join(dl)]
+
+
+def _do_whois_query(
+    dl: List[str],
+    ignore_returncode: bool,
+    server: Optional[str] = None,
+    verbose: bool = False,
+) -> str:
+    cmd = _whois_cmd(dl, server=server, verbose=verbose)
 
     # LANG=en is added to make the ".jp" output consist across all environments
     p = subprocess.Popen(
@@ -131,3 +697,27 @@ def _do_whois_query(
         raise WhoisCommandFailed(r)
 
     return r
+
+
+async def _do_whois_query_async(
+    dl: List[str],
+    ignore_returncode: bool,
+    server: Optional[str] = None,
+    verbose: bool = False,
+) -> str:
+    import asyncio
+
+    cmd = _whois_cmd(dl, server=server, verbose=verbose)
+
+    p = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        env={"LANG": "en"},
+    )
+
+    r = (await p.communicate())[0].decode(errors="ignore")
+    if ignore_returncode is False and p.returncode not in [0, 1]:
+        raise WhoisCommandFailed(r)
+
+    return r
@@ -1,61 +1,209 @@
+import hashlib
+import os
 import re
 import sys
+import time
 
-from typing import Any, Dict, Optional, List
+from collections.abc import KeysView, Mapping
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 
 from .exceptions import FailedParsingWhoisOutput
 from .exceptions import WhoisQuotaExceeded
 
-from . import tld_regexpr
+from ._scan import FieldScanner
+from ._hooks import HOOKS, emit
+from . import _3_adjust
 
 Verbose = True
 
-TLD_RE: Dict[str, Any] = {}
+# compiled tld tables, including the meta ones like _donuts and _centralnic
+_COMPILED: Dict[str, Any] = {}
 
+# one compiled object per distinct pattern, many tld's share the same patterns
+_PATTERNS: Dict[str, Any] = {}
 
-def get_tld_re(tld: str) -> Any:
-    if tld in TLD_RE:
-        return TLD_RE[tld]
+# one FieldScanner per tld, built on first use
+_SCANNERS: Dict[str, FieldScanner] = {}
 
-    if tld == "in":
-        # is this actually used ?
-        if Verbose:
-            print("Verbose: directly returning tld: in_ for tld: in", file=sys.stderr)
-        return "in_"
+_SERVER_NAME_RE = re.compile(r"Server Name:\s?(.+)", re.IGNORECASE)
+
+# a _profile.RegexProfile while profiling: every pattern runs findall and is timed, see _profile.py
+PROFILE: Any = None
+
+# part of every tld_fingerprint(), change it when a change in the parsing code changes the results
+PARSER_VERSION = 1
+
+_FINGERPRINTS: Dict[Tuple[str, Optional[str]], str] = {}
+_FINGERPRINTS_FOR: List[str] = []  # the DATE_FORMATS the fingerprints were made with
+
+# the flattened tables generated from tld_regexpr by _make_tld_table, None: not loaded yet, False: not usable
+_TABLE: Any = None
+
+
+def _load_table() -> Any:
+    # only use the generated table if it was made from the tld_regexpr we have now
+    global _TABLE
+
+    if _TABLE is None:
+        _TABLE = False
+        try:
+            from . import _tld_table
+
+            h = source_hash()
+            if h is None or h == _tld_table.SOURCE_HASH:
+                _TABLE = _tld_table
+            elif Verbose:
+                print("Verbose: _tld_table is outdated, resolving tld_regexpr at runtime", file=sys.stderr)
+        except ImportError:
+            pass
+
+    return _TABLE
+
+
+def source_hash() -> Optional[str]:
+    # sha1 of tld_regexpr.py with unix line ends (a crlf checkout is the same source),
+    # None when we only have the compiled module and cannot check
+    try:
+        with open(os.path.join(os.path.dirname(__file__), "tld_regexpr.py"), "rb") as f:
+            return hashlib.sha1(f.read().replace(b"\r\n", b"\n")).hexdigest()
+    except OSError:
+        return None
+
+
+def flatten_tld(tld: str) -> Dict[str, Any]:
+    # the definition of tld with its extend chain resolved, patterns still as strings
+    from . import tld_regexpr
 
     v = getattr(tld_regexpr, tld)
 
     extend = v.get("extend")
     if extend:
-        e = get_tld_re(extend)  # call recursive
-        tmp = e.copy()
+        tmp = flatten_tld(extend).copy()  # call recursive
         tmp.update(v)  # and merge results in tmp with caller data in v
         # The update() method updates the dictionary with the elements
         # from another dictionary object or from an iterable of key/value pairs.
     else:
-        tmp = v
+        tmp = v.copy()  # never modify the definitions in tld_regexpr
 
     # finally we dont want to propagate the extend data
     # as it is only used to recursivly populate the dataset
     if "extend" in tmp:
         del tmp["extend"]
 
-    # we want now to exclude _server hints
-    tld_re = dict(
-        (k, re.compile(v, re.IGNORECASE) if (isinstance(v, str) and k[0] != "_") else v) for k, v in tmp.items()
-    )
+    return tmp
+
+
+def _compile(pattern: str) -> Any:
+    c = _PATTERNS.get(pattern)
+    if c is None:
+        c = _PATTERNS[pattern] = re.compile(pattern, re.IGNORECASE)
+    return c
+
 
-    # meta domains start with _: examples _centralnic and _donuts
-    if tld[0] != "_":
-        TLD_RE[tld] = tld_re
+def get_tld_re(tld: str) -> Any:
+    if tld in _COMPILED:
+        return _COMPILED[tld]
+
+    if tld == "in":
+        # is this actually used ?
+        if Verbose:
+            print("Verbose: directly returning tld: in_ for tld: in", file=sys.stderr)
+        return "in_"
 
+    table = _load_table()
+    if table and tld in table.TLDS:
+        # the extend chain is already resolved, fields refer to table.PATTERNS by index
+        flat = table.TABLES[table.TLDS[tld]]
+        tmp = dict((k, table.PATTERNS[v] if k[0] != "_" and v is not None else v) for k, v in flat)
+    else:
+        tmp = flatten_tld(tld)
+
+    # we want now to exclude _server hints
+    tld_re = dict((k, _compile(v) if (isinstance(v, str) and k[0] != "_") else v) for k, v in tmp.items())
+
+    _COMPILED[tld] = tld_re
     return tld_re
 
 
-# now fetch all defined data in
-# The dir() method returns the list of valid attributes of the passed object
+def tld_fingerprint(tld: str) -> str:
+    # a short hash of everything that decides how a response of this tld is parsed:
+    # its patterns, the date formats and PARSER_VERSION
+    global _FINGERPRINTS_FOR
+
+    date_formats = _3_adjust.DATE_FORMATS
+    if _FINGERPRINTS_FOR != date_formats:
+        _FINGERPRINTS.clear()
+        _FINGERPRINTS_FOR = list(date_formats)
+
+    custom = _3_adjust.CUSTOM_DATE_FORMATS.get(tld)
+    fp = _FINGERPRINTS.get((tld, custom))
+    if fp is None:
+        items = sorted((k, getattr(v, "pattern", v)) for k, v in TLD_RE[tld].items())
+        h = hashlib.sha1(repr((PARSER_VERSION, items, date_formats, custom)).encode()).hexdigest()
+        fp = _FINGERPRINTS[(tld, custom)] = h[:16]
+    return fp
+
+
+class _LazyTldRe(Mapping):
+    """
+    All tld's defined in tld_regexpr as a read only dict: tld -> compiled table.
+
+    The keys are known up front but a table is only compiled
+    (patterns and the extend chain) the first time that tld is used,
+    so importing the package does not compile 500+ tables
+    and membership tests and validTlds() compile nothing.
+    Meta domains starting with _ (examples _centralnic and _donuts) are not part of it.
+    """
+
+    def __init__(self) -> None:
+        table = _load_table()
+        if table:
+            # sorted like dir() would give them
+            self._tlds = list(table.TLDS)
+        else:
+            from . import tld_regexpr
+
+            # The dir() method returns the list of valid attributes of the passed object
+            self._tlds = [tld for tld in dir(tld_regexpr) if tld[0] != "_"]
+        self._known = frozenset(self._tlds)
+
+    def __getitem__(self, tld: str) -> Dict[str, Any]:
+        tld_re = _COMPILED.get(tld)
+        if tld_re is not None:
+            return tld_re
+
+        if tld not in self._known:
+            raise KeyError(tld)
+        return get_tld_re(tld)
+
+    def __contains__(self, tld: object) -> bool:
+        return tld in self._known
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tlds)
+
+    def __len__(self) -> int:
+        return len(self._tlds)
+
+    def keys(self) -> KeysView:  # type: ignore
+        # keys() is used for membership tests, make sure that stays cheap
+        return KeysView(self)
+
+    def compile_all(self) -> None:
+        for tld in self._tlds:
+            self[tld]
+
+
+TLD_RE: _LazyTldRe = _LazyTldRe()
 
-[get_tld_re(tld) for tld in dir(tld_regexpr) if tld[0] != "_"]
+
+def precompile() -> None:
+    # compile every tld table and build its FieldScanner now instead of on first use,
+    # e.g. before forking worker processes that then share them copy-on-write
+    TLD_RE.compile_all()
+    for tld in TLD_RE:
+        if tld not in _SCANNERS:
+            _SCANNERS[tld] = FieldScanner(TLD_RE[tld])
 
 
 def cleanupWhoisResponse(
@@ -102,13 +250,43 @@ def do_parse(
     verbose: bool = False,
     with_cleanup_results=False,
 ) -> Optional[Dict[str, Any]]:
-    r: Dict[str, Any] = {"tld": tld}
+    if not HOOKS:
+        whois_str = cleanupWhoisResponse(
+            response=whois_str,
+            verbose=verbose,
+            with_cleanup_results=with_cleanup_results,
+        )
+        return _parse_cleaned(whois_str, tld, dl, verbose=verbose)
+
+    t = time.perf_counter()
+    try:
+        whois_str = cleanupWhoisResponse(
+            response=whois_str,
+            verbose=verbose,
+            with_cleanup_results=with_cleanup_results,
+        )
+    except Exception as e:
+        emit("cleanup", t, error=e)
+        raise
+    emit("cleanup", t)
+
+    t = time.perf_counter()
+    try:
+        r = _parse_cleaned(whois_str, tld, dl, verbose=verbose)
+    except Exception as e:
+        emit("parse", t, error=e)
+        raise
+    emit("parse", t, "ok" if r else "none")
+    return r
+
 
-    whois_str = cleanupWhoisResponse(
-        response=whois_str,
-        verbose=verbose,
-        with_cleanup_results=with_cleanup_results,
-    )
+def _parse_cleaned(
+    whois_str: str,
+    tld: str,
+    dl: List[str],
+    verbose: bool = False,
+) -> Optional[Dict[str, Any]]:
+    r: Dict[str, Any] = {"tld": tld}
 
     if whois_str.count("\n") < 5:
         if verbose:
@@ -159,25 +337,42 @@ def do_parse(
 
     # check the status of DNSSEC
     r["DNSSEC"] = False
-    whois_dnssec: Any = whois_str.split("DNSSEC:")
-    if len(whois_dnssec) >= 2:
-        whois_dnssec = whois_dnssec[1].split("\n")[0]
-        if whois_dnssec.strip() == "signedDelegation" or whois_dnssec.strip() == "yes":
+    i = whois_str.find("DNSSEC:")
+    if i >= 0:
+        whois_dnssec = whois_str[i + 7 :]
+        j = whois_dnssec.find("DNSSEC:")
+        if j >= 0:
+            whois_dnssec = whois_dnssec[:j]
+        whois_dnssec = whois_dnssec.split("\n", 1)[0].strip()
+        if whois_dnssec == "signedDelegation" or whois_dnssec == "yes":
             r["DNSSEC"] = True
 
     # this is mostly not available in many tld's anymore, should be investigated
-    # split whois_str to remove first IANA part showing info for TLD only
-    whois_splitted = whois_str.split("source:       IANA")
-    if len(whois_splitted) == 2:
-        whois_str = whois_splitted[1]
+    # split whois_str to remove first IANA part showing info for TLD only (only if there is exactly one)
+    iana = "source:       IANA"
+    i = whois_str.find(iana)
+    if i >= 0 and whois_str.find(iana, i + len(iana)) < 0:
+        whois_str = whois_str[i + len(iana) :]
 
     # also not available for many modern tld's
-    sn = re.findall(r"Server Name:\s?(.+)", whois_str, re.IGNORECASE)
-    if sn:
+    if _SERVER_NAME_RE.search(whois_str):
         whois_str = whois_str[whois_str.find("Domain Name:") :]
 
     # return TLD_RE["com"] as default if tld not exists in TLD_RE
-    for k, v in TLD_RE.get(tld, TLD_RE["com"]).items():
+    if tld not in TLD_RE:
+        tld = "com"
+
+    if PROFILE is not None:
+        found = PROFILE.scan(tld, TLD_RE[tld], whois_str)
+    else:
+        scanner = _SCANNERS.get(tld)
+        if scanner is None:
+            scanner = _SCANNERS[tld] = FieldScanner(TLD_RE[tld])
+
+        # all fields in one pass over whois_str, same result as v.findall(whois_str) per field
+        found = scanner.scan(whois_str)
+
+    for k, v in TLD_RE[tld].items():
         if k.startswith("_"):
             # skip meta element like: _server or _privateRegistry
             continue
@@ -185,7 +380,6 @@ def do_parse(
         if v is None:
             r[k] = [""]
         else:
-            r[k] = v.findall(whois_str) or [""]
-            # print("DEBUG: Keyval = " + str(r[k]))
+            r[k] = found[k] or [""]
 
     return r
@@ -25,9 +25,20 @@
 
 """
 import sys
-from ._1_query import do_query
-from ._2_parse import do_parse, TLD_RE
-from ._3_adjust import Domain
+import itertools
+import json
+import time
+from ._0_tld import TldTrie, build_tld_trie
+from ._1_query import do_query, do_query_async, do_query_entry, do_query_entry_async
+from ._1_query import cache_stats, negative_cache_stats, NEGATIVE_CACHE
+from ._1_query import parsed_cache_stats, PARSED_CACHE, CACHE_MAX_AGE, _use_sqlite, run_cache_io
+from ._cache import sqlite_cache
+from ._2_parse import do_parse, TLD_RE, tld_fingerprint
+from ._3_adjust import Domain, LEARNED_DATE_FORMATS, date_cache_stats
+from ._ratelimit import RateLimiter, RATE_LIMITER
+from ._hooks import StageEvent, add_hook, remove_hook, HOOKS
+from . import _hooks
+from ._metrics import METRICS, enable_metrics, disable_metrics, metrics_snapshot, metrics_prometheus
 from .exceptions import (
     UnknownTld,
     FailedParsingWhoisOutput,
@@ -37,11 +48,16 @@ from .exceptions import (
     WhoisQuotaExceeded,
 )
 
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List, Iterable, Iterator, AsyncIterator, Tuple, Union
+
+if TYPE_CHECKING:
+    import asyncio
 
 
 CACHE_FILE = None
+CACHE_BACKEND = None  # "json" or "sqlite", by default a cache_file ending in .sqlite, .sqlite3 or .db uses sqlite
 SLOW_DOWN = 0
+TRANSPORT = "subprocess"  # or "socket" / "referral" to talk to the whois servers directly on port 43
 
 Map2Underscore = {
     ".ac.uk": "ac_uk",
@@ -126,44 +142,69 @@ def validTlds():
     return sorted(tlds)
 
 
+_TLD_TRIE: Optional[TldTrie] = None
+
+
+def tldTrie() -> TldTrie:
+    # built once on first use from all known tld's and the translation maps above
+    global _TLD_TRIE
+    if _TLD_TRIE is None:
+        _TLD_TRIE = build_tld_trie(TLD_RE.keys(), Map2Underscore, PythonKeyWordMap, Utf8Map)
+    return _TLD_TRIE
+
+
+def tldServer(tld: str) -> Optional[str]:
+    # the registry whois server of a tld pattern (see classifyDomain) from the generated _tld_servers.py,
+    # None if not known; its header lists the sources, rebuild it with:
+    # python -m whois._make_tld_servers <dump of the iana root zone database>
+    from ._tld_servers import SERVERS
+
+    return SERVERS.get(tld)
+
+
 def filterTldToSupportedPattern(
     domain: str,
     d: List[str],
     verbose: bool = False,
 ) -> str:
-    # the moment we have a valid tld we can leave:
-    # no need for else or elif anymore
-    # that is the "leave early" paradigm
-    # also known as "dont overstay your welcome" or "don't linger"
-
-    tld = None
-
-    if len(d) > 2:
-        for i in Map2Underscore:
-            if domain.endswith(i):
-                tld = Map2Underscore[i]
-                return tld
+    # longest supported suffix wins: xxx.co.jp -> co_jp, xxx.jp -> jp
+    tld = tldTrie().lookup(d)
 
-    for i in PythonKeyWordMap:
-        if domain.endswith(i):
-            tld = PythonKeyWordMap[i]
-            return tld
-
-    for i in Utf8Map:
-        if domain.endswith(i):
-            tld = Utf8Map[i]
-            return tld
-
-    if domain.endswith(".name"):
+    if tld == "name":
         # some special case with xxx.name -> domain=xxx.name and tld is name
         d[0] = "domain=" + d[0]
-        tld = d[-1]
+        return tld
+
+    if tld:
         return tld
 
     # just take the last item as the top level
     return d[-1]
 
 
+def classifyDomain(domain: str) -> Optional[str]:
+    """
+    Return the tld pattern (a key of TLD_RE) query() would use for this domain,
+    or None if query() would not get that far: a single label or an unsupported tld.
+    No network access and no parsing, suitable for classifying large lists of domains.
+
+    >>> whois.classifyDomain("www.google.co.jp")
+    'co_jp'
+    """
+    d = domain.lower().strip().rstrip(".").split(".")
+    if d[0] == "www":
+        d = d[1:]
+
+    if len(d) < 2:
+        return None
+
+    tld = tldTrie().lookup(d)
+    if tld is None and d[-1] in TLD_RE:
+        tld = d[-1]
+
+    return tld
+
+
 def query(
     domain: str,
     force: bool = False,
@@ -173,23 +214,146 @@ def query(
     server: Optional[str] = None,
     verbose: bool = False,
     with_cleanup_results=False,
+    transport: Optional[str] = None,
+    timeout: float = 10,
+    cache_backend: Optional[str] = None,
 ) -> Optional[Domain]:
     """
-    force=True          Don't use cache.
+    force=True          Don't use cache: not the responses, not the parsed results (PARSED_CACHE)
+                        and not the negative results (NEGATIVE_CACHE).
     cache_file=<path>   Use file to store cache not only memory.
-    slow_down=0         Time [s] it will wait after you query WHOIS database.
+    cache_backend:      "json" rewrites the whole cache_file on every update,
+                        "sqlite" reads and writes single rows in a sqlite database,
+                        default: sqlite if cache_file ends in .sqlite, .sqlite3 or .db, otherwise json
+    slow_down=0         Minimal time [s] between two queries to the same WHOIS server.
                         This is useful when there is a limit to the number of requests at a time.
+                        Other servers are not slowed down, see _ratelimit.RateLimiter.
     server:             if set use the whois server explicitly for making the query:
                         propagates on linux to "whois -h <server> <domain>"
                         propagates on Windows to whois.exe <domain> <server>
     with_cleanup_results: cleanup lines starting with % and REDACTED FOR PRIVACY
+    transport:          "subprocess" (default) runs the whois binary,
+                        "socket" talks RFC 3912 directly to the whois server on port 43;
+                        without a known server it falls back to subprocess,
+                        "referral" also talks to port 43 and finds the registry server itself (via iana),
+                        the registry server per tld is cached, see _1_query.FOLLOW_REGISTRAR;
+                        both use the server from the generated _tld_servers.py table if there is one
+    timeout=10          Socket timeout [s] for connect and read when transport="socket" or "referral".
     """
+    cache_file = cache_file or CACHE_FILE
+    cache_backend = cache_backend or CACHE_BACKEND
+    transport = transport or TRANSPORT
+
+    prepared = _prepareQuery(
+        domain,
+        server=server,
+        slow_down=slow_down,
+        verbose=verbose,
+        transport=transport,
+        force=force,
+    )
+    if prepared is None:
+        return None
+
+    d, tld, server, slow_down = prepared
+
+    token = _hooks.enter(".".join(d), tld, server, transport)
+    try:
+        while 1:
+            if HOOKS:
+                _hooks.next_attempt(".".join(d))
+
+            dom = _cachedDomain(
+                d,
+                tld=tld,
+                force=force,
+                with_cleanup_results=with_cleanup_results,
+                cache_file=cache_file,
+                cache_backend=cache_backend,
+            )
+            if dom:
+                return dom
+
+            if not _knownNegative(d, force=force, verbose=verbose, with_cleanup_results=with_cleanup_results):
+                ts, q = do_query_entry(
+                    dl=d,
+                    force=force,
+                    cache_file=cache_file,
+                    slow_down=slow_down,
+                    ignore_returncode=ignore_returncode,
+                    server=server,
+                    verbose=verbose,
+                    transport=transport,
+                    timeout=timeout,
+                    cache_backend=cache_backend,
+                )
+
+                dom = _parseResponse(q, tld=tld, d=d, verbose=verbose, with_cleanup_results=with_cleanup_results)
+                if dom:
+                    _rememberDomain(
+                        d,
+                        dom,
+                        ts,
+                        tld=tld,
+                        with_cleanup_results=with_cleanup_results,
+                        cache_file=cache_file,
+                        cache_backend=cache_backend,
+                    )
+                    return dom
+                _rememberNegative(d, with_cleanup_results=with_cleanup_results)
+
+            d = _nextLevel(d, tld=tld, verbose=verbose)
+            if d is None:
+                # no result or no domain but we can not reduce any further so we have None
+                return None
+    finally:
+        _hooks.leave(token)
+
+
+def _prepareQuery(
+    domain: str,
+    server: Optional[str] = None,
+    slow_down: int = 0,
+    verbose: bool = False,
+    transport: str = "subprocess",
+    force: bool = False,
+) -> Optional[Tuple[List[str], str, Optional[str], int]]:
+    # everything we can decide before going to the network
+    # returns None if there is nothing to query, otherwise (domain_parts, tld, server, slow_down)
     assert isinstance(domain, str), Exception("`domain` - must be <str>")
 
-    cache_file = cache_file or CACHE_FILE
     slow_down = slow_down or SLOW_DOWN
 
     domain = domain.lower().strip().rstrip(".")  # Remove the trailing dot to support FQDN.
+
+    return _prepareDomain(
+        domain,
+        server=server,
+        slow_down=slow_down,
+        verbose=verbose,
+        transport=transport,
+        force=force,
+    )
+
+
+def _tldErrorKey(tld: str) -> str:
+    # NEGATIVE_CACHE key of the UnknownTld or WhoisPrivateRegistry of a tld, other keys are <domain>:<cleanup>
+    return f"tld:{tld}"
+
+
+def _rememberTldError(tld: str, e: Exception) -> Exception:
+    NEGATIVE_CACHE[_tldErrorKey(tld)] = (int(time.time()), e)
+    return e
+
+
+def _prepareDomain(
+    domain: str,
+    server: Optional[str],
+    slow_down: int,
+    verbose: bool,
+    transport: str,
+    force: bool = True,
+) -> Optional[Tuple[List[str], str, Optional[str], int]]:
     d = domain.split(".")
 
     if d[0] == "www":
@@ -200,17 +364,25 @@ def query(
 
     tld = filterTldToSupportedPattern(domain, d, verbose)
 
+    # UnknownTld and WhoisPrivateRegistry from earlier calls, they depend on the tld alone;
+    # peek first, so the tlds we support do not count as misses
+    if not force and _tldErrorKey(tld) in NEGATIVE_CACHE:
+        entry = NEGATIVE_CACHE.get(_tldErrorKey(tld))
+        if entry is not None:
+            e = entry[1]
+            raise type(e)(*e.args)
+
     if tld not in TLD_RE.keys():
         a = f"The TLD {tld} is currently not supported by this package."
         b = "Use validTlds() to see what toplevel domains are supported."
         msg = f"{a} {b}"
-        raise UnknownTld(msg)
+        raise _rememberTldError(tld, UnknownTld(msg))
 
     # allow server hints using "_server" from the tld_regexpr.py file
     thisTld = TLD_RE.get(tld)
     if thisTld.get("_privateRegistry"):
         msg = "This tld has either no whois server or responds only with minimal information"
-        raise WhoisPrivateRegistry(msg)
+        raise _rememberTldError(tld, WhoisPrivateRegistry(msg))
 
     # allow explicit whois server usage
     thisTldServer = thisTld.get("_server")
@@ -219,6 +391,12 @@ def query(
         if verbose:
             print(f"using _server hint {server} for tld: {tld}", file=sys.stderr)
 
+    # talking to port 43 ourselves we need a server, the whois binary has its own table
+    if server is None and transport != "subprocess":
+        server = tldServer(tld)
+        if verbose and server:
+            print(f"using server {server} from _tld_servers for tld: {tld}", file=sys.stderr)
+
     # allow a configrable slowdown for some tld's
     slowDown = thisTld.get("_slowdown")
     if slow_down == 0 and slowDown and slowDown > 0:
@@ -226,53 +404,375 @@ def query(
         if verbose:
             print(f"using _slowdown hint {slowDown} for tld: {tld}", file=sys.stderr)
 
+    return d, tld, server, slow_down
+
+
+def _parsedKey(
+    d: List[str],
+    with_cleanup_results: bool,
+) -> str:
+    return f"{'.'.join(d)}:{int(bool(with_cleanup_results))}"
+
+
+def _cachedDomain(
+    d: List[str],
+    tld: str,
+    force: bool = False,
+    with_cleanup_results: bool = False,
+    cache_file: Optional[str] = None,
+    cache_backend: Optional[str] = None,
+) -> Optional[Domain]:
+    if force:
+        return None
+
+    t = time.perf_counter() if HOOKS else 0.0
+    k = _parsedKey(d, with_cleanup_results)
+    fp = tld_fingerprint(tld)
+
+    data = None
+    entry = PARSED_CACHE.get(k)
+    if entry is not None and entry[1][0] == fp:
+        data = entry[1][1]
+    elif cache_file and _use_sqlite(cache_file, cache_backend):
+        row = sqlite_cache(cache_file).get_parsed(k, min_ts=int(time.time() - CACHE_MAX_AGE))
+        if row is not None and row[1] == fp:
+            data = json.loads(row[2])
+            PARSED_CACHE[k] = (row[0], (fp, data))
+
+    # an entry of an other fingerprint is a miss, the caller parses the cached response again and replaces it
+    if data is None:
+        if HOOKS:
+            _hooks.emit_cache("parsed_cache", t, False)
+        return None
+
+    # a new Domain for every caller, they may change it
+    dom = Domain.from_dict(data)
+    if HOOKS:
+        _hooks.emit_cache("parsed_cache", t, True)
+    return dom
+
+
+def _rememberDomain(
+    d: List[str],
+    dom: Domain,
+    ts: int,
+    tld: str,
+    with_cleanup_results: bool = False,
+    cache_file: Optional[str] = None,
+    cache_backend: Optional[str] = None,
+) -> None:
+    # ts: when the response was received, a result parsed from a cached response is not any newer
+    k = _parsedKey(d, with_cleanup_results)
+    fp = tld_fingerprint(tld)
+
+    PARSED_CACHE[k] = (ts, (fp, dom.to_dict()))
+    if cache_file and _use_sqlite(cache_file, cache_backend):
+        sqlite_cache(cache_file).put_parsed(k, ts, fp, dom.to_json())
+
+
+def _knownNegative(
+    d: List[str],
+    force: bool = False,
+    verbose: bool = False,
+    with_cleanup_results: bool = False,
+) -> bool:
+    # True if this level parsed to nothing not long ago, no need to query or parse it again;
+    # keyed like PARSED_CACHE, the cleanup decides if a response parses to anything
+    if force:
+        return False
+
+    k = _parsedKey(d, with_cleanup_results)
+    entry = NEGATIVE_CACHE.get(k)
+    if entry is None or entry[1] is not None:
+        return False
+
+    if verbose:
+        print(f"negative cache hit for {k}", file=sys.stderr)
+    return True
+
+
+def _rememberNegative(
+    d: List[str],
+    with_cleanup_results: bool = False,
+) -> None:
+    NEGATIVE_CACHE[_parsedKey(d, with_cleanup_results)] = (int(time.time()), None)
+
+
+def _parseResponse(
+    q: str,
+    tld: str,
+    d: List[str],
+    verbose: bool = False,
+    with_cleanup_results=False,
+) -> Optional[Domain]:
+    pd = do_parse(
+        whois_str=q,
+        tld=tld,
+        dl=d,
+        verbose=verbose,
+        with_cleanup_results=with_cleanup_results,
+    )
+
+    # do we have a result and does it have a domain name
+    if pd and pd["domain_name"][0]:
+        if not HOOKS:
+            return Domain(
+                pd,
+                verbose=verbose,
+            )
+
+        t = time.perf_counter()
+        try:
+            dom = Domain(
+                pd,
+                verbose=verbose,
+            )
+        except Exception as e:
+            _hooks.emit("domain", t, error=e)
+            raise
+        _hooks.emit("domain", t)
+        return dom
+
+    return None
+
+
+def _nextLevel(
+    d: List[str],
+    tld: str,
+    verbose: bool = False,
+) -> Optional[List[str]]:
     # if the tld is a multi level we should not move further down than the tld itself
     # we currently allow progressive lookups until we find something:
     # so xxx.yyy.zzz will try both xxx.yyy.zzz and yyy.zzz
     # but if the tld is yyy.zzz we should only try xxx.yyy.zzz
     tldLevel = tld.split("_")
 
-    while 1:
-        q = do_query(
-            dl=d,
-            force=force,
-            cache_file=cache_file,
-            slow_down=slow_down,
-            ignore_returncode=ignore_returncode,
-            server=server,
-            verbose=verbose,
-        )
-
-        pd = do_parse(
-            whois_str=q,
-            tld=tld,
-            dl=d,
-            verbose=verbose,
-            with_cleanup_results=with_cleanup_results,
-        )
-
-        # do we have a result and does it have a domain name
-        if pd and pd["domain_name"][0]:
-            return Domain(
-                pd,
-                verbose=verbose,
-            )
+    if len(d) > (len(tldLevel) + 1):
+        d = d[1:]  # strip one element from the front and try again
+        if verbose:
+            print(f"try again with {d}, {len(d)}, {len(tldLevel)+1}", file=sys.stderr)
+        return d
+
+    return None
+
+
+def query_many(
+    domains: Iterable[str],
+    max_workers: int = 8,
+    force: bool = False,
+    cache_file: Optional[str] = None,
+    slow_down: int = 0,
+    ignore_returncode: bool = False,
+    server: Optional[str] = None,
+    verbose: bool = False,
+    with_cleanup_results=False,
+    transport: Optional[str] = None,
+    timeout: float = 10,
+    cache_backend: Optional[str] = None,
+) -> Iterator[Tuple[str, Union[Optional[Domain], Exception]]]:
+    """
+    Query many domains in parallel using a pool of max_workers threads.
+
+    Yields (domain, result) tuples in the order the lookups complete,
+    result is what query() returns (a Domain or None) or the exception it raised,
+    so one failing domain (e.g. WhoisQuotaExceeded) does not stop the batch.
+    domains is consumed lazily, at most 2 * max_workers lookups are in flight.
+    All other arguments are passed on to query().
+    """
+    from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+    kwargs = {
+        "force": force,
+        "cache_file": cache_file,
+        "slow_down": slow_down,
+        "ignore_returncode": ignore_returncode,
+        "server": server,
+        "verbose": verbose,
+        "with_cleanup_results": with_cleanup_results,
+        "transport": transport,
+        "timeout": timeout,
+        "cache_backend": cache_backend,
+    }
+
+    todo = iter(domains)
+    pending = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(n: int) -> None:
+            for domain in itertools.islice(todo, n):
+                pending[executor.submit(query, domain, **kwargs)] = domain
+
+        try:
+            submit(2 * max_workers)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    domain = pending.pop(f)
+                    try:
+                        result = f.result()
+                    except Exception as e:
+                        result = e
+                    yield domain, result
 
-        if len(d) > (len(tldLevel) + 1):
-            d = d[1:]  # strip one element from the front and try again
-            if verbose:
-                print(f"try again with {d}, {len(d)}, {len(tldLevel)+1}", file=sys.stderr)
-            continue
+                submit(len(done))
+        finally:
+            # the caller stopped iterating early: dont start what is still waiting
+            for f in pending:
+                f.cancel()
 
-        # no result or no domain but we can not reduce any further so we have None
+
+async def aquery(
+    domain: str,
+    force: bool = False,
+    cache_file: Optional[str] = None,
+    slow_down: int = 0,
+    ignore_returncode: bool = False,
+    server: Optional[str] = None,
+    verbose: bool = False,
+    with_cleanup_results=False,
+    transport: Optional[str] = None,
+    timeout: float = 10,
+    cache_backend: Optional[str] = None,
+) -> Optional[Domain]:
+    """
+    asyncio version of query(), same arguments and same result.
+    The whois lookup itself (subprocess or socket) does not block the event loop,
+    nor does reading or writing a cache_file: that runs in the default executor.
+    """
+    cache_file = cache_file or CACHE_FILE
+    cache_backend = cache_backend or CACHE_BACKEND
+    transport = transport or TRANSPORT
+
+    prepared = _prepareQuery(
+        domain,
+        server=server,
+        slow_down=slow_down,
+        verbose=verbose,
+        transport=transport,
+        force=force,
+    )
+    if prepared is None:
         return None
 
-        """
-        # not a or not b == not ( a and b )
-        if len(d) > 2 and (not pd or not pd["domain_name"][0]):
-            d = d[1:]
-        else:
-            break
-        """
+    d, tld, server, slow_down = prepared
+
+    token = _hooks.enter(".".join(d), tld, server, transport)
+    try:
+        while 1:
+            if HOOKS:
+                _hooks.next_attempt(".".join(d))
+
+            dom = await run_cache_io(
+                cache_file,
+                _cachedDomain,
+                d,
+                tld=tld,
+                force=force,
+                with_cleanup_results=with_cleanup_results,
+                cache_file=cache_file,
+                cache_backend=cache_backend,
+            )
+            if dom:
+                return dom
+
+            if not _knownNegative(d, force=force, verbose=verbose, with_cleanup_results=with_cleanup_results):
+                ts, q = await do_query_entry_async(
+                    dl=d,
+                    force=force,
+                    cache_file=cache_file,
+                    slow_down=slow_down,
+                    ignore_returncode=ignore_returncode,
+                    server=server,
+                    verbose=verbose,
+                    transport=transport,
+                    timeout=timeout,
+                    cache_backend=cache_backend,
+                )
+
+                dom = _parseResponse(q, tld=tld, d=d, verbose=verbose, with_cleanup_results=with_cleanup_results)
+                if dom:
+                    await run_cache_io(
+                        cache_file,
+                        _rememberDomain,
+                        d,
+                        dom,
+                        ts,
+                        tld=tld,
+                        with_cleanup_results=with_cleanup_results,
+                        cache_file=cache_file,
+                        cache_backend=cache_backend,
+                    )
+                    return dom
+                _rememberNegative(d, with_cleanup_results=with_cleanup_results)
+
+            d = _nextLevel(d, tld=tld, verbose=verbose)
+            if d is None:
+                return None
+    finally:
+        _hooks.leave(token)
+
+
+async def aquery_many(
+    domains: Iterable[str],
+    max_concurrency: int = 100,
+    semaphore: Optional["asyncio.Semaphore"] = None,
+    force: bool = False,
+    cache_file: Optional[str] = None,
+    slow_down: int = 0,
+    ignore_returncode: bool = False,
+    server: Optional[str] = None,
+    verbose: bool = False,
+    with_cleanup_results=False,
+    transport: Optional[str] = None,
+    timeout: float = 10,
+    cache_backend: Optional[str] = None,
+) -> AsyncIterator[Tuple[str, Union[Optional[Domain], Exception]]]:
+    """
+    asyncio version of query_many(), use as: async for domain, result in aquery_many(...)
 
-    return None
+    At most max_concurrency lookups are in flight,
+    pass a shared semaphore to limit concurrency over several calls.
+    """
+    import asyncio  # only when used, asyncio is slow to import
+
+    kwargs = {
+        "force": force,
+        "cache_file": cache_file,
+        "slow_down": slow_down,
+        "ignore_returncode": ignore_returncode,
+        "server": server,
+        "verbose": verbose,
+        "with_cleanup_results": with_cleanup_results,
+        "transport": transport,
+        "timeout": timeout,
+        "cache_backend": cache_backend,
+    }
+
+    sem = semaphore or asyncio.Semaphore(max_concurrency)
+
+    async def one(domain: str) -> Union[Optional[Domain], Exception]:
+        async with sem:
+            try:
+                return await aquery(domain, **kwargs)
+            except Exception as e:
+                return e
+
+    todo = iter(domains)
+    pending = {}
+
+    def submit(n: int) -> None:
+        for domain in itertools.islice(todo, n):
+            pending[asyncio.ensure_future(one(domain))] = domain
+
+    try:
+        submit(max_concurrency)
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for f in done:
+                yield pending.pop(f), f.result()
+
+            submit(len(done))
+    finally:
+        for f in pending:
+            f.cancel()
@@ -0,0 +1,140 @@
+"""
+    Bulk lookups from the command line
+
+    python -m whois [-w 16] [-o results.jsonl] [domains.txt]
+
+    Reads one domain per line from the file (or stdin when missing or "-"),
+    empty lines and everything after a # are skipped.
+    Writes one JSON object per line as soon as a lookup finishes (not in input order):
+        {"domain": "google.com", "result": {...}, "error": null}
+        {"domain": "example.xyz", "result": null, "error": {"type": "UnknownTld", "message": "..."}}
+    The input is read as a stream, memory stays bounded whatever its size.
+    Progress and throughput go to stderr.
+"""
+import argparse
+import datetime
+import json
+import sys
+import time
+
+from typing import Any, Dict, Iterator, Optional, TextIO, Union
+
+from . import Domain, query_many
+
+
+def _read_domains(f: TextIO) -> Iterator[str]:
+    for line in f:
+        line = line.split("#", 1)[0].strip()
+        if line:
+            yield line
+
+
+def _json_default(v: Any) -> Any:
+    if isinstance(v, (datetime.datetime, datetime.date)):
+        return v.isoformat()
+    raise TypeError(f"Object of type {type(v).__name__} is not JSON serializable")
+
+
+def result_to_json(
+    domain: str,
+    result: Union[Optional[Domain], Exception],
+) -> str:
+    out: Dict[str, Any] = {"domain": domain, "result": None, "error": None}
+    if isinstance(result, Exception):
+        out["error"] = {"type": type(result).__name__, "message": str(result)}
+    elif result is not None:
+        out["result"] = result.to_dict()
+
+    return json.dumps(out, default=_json_default)
+
+
+class Progress:
+    # counts and throughput on stderr, at most every `interval` seconds
+    def __init__(self, interval: float, out: TextIO = sys.stderr):
+        self.interval = interval
+        self.out = out
+        self.start = self.last = time.monotonic()
+        self.done = 0
+        self.found = 0
+        self.errors = 0
+
+    def add(self, result: Union[Optional[Domain], Exception]) -> None:
+        self.done += 1
+        if isinstance(result, Exception):
+            self.errors += 1
+        elif result is not None:
+            self.found += 1
+
+        now = time.monotonic()
+        if self.interval > 0 and now - self.last >= self.interval:
+            self.last = now
+            self.report(now)
+
+    def report(self, now: Optional[float] = None) -> None:
+        elapsed = (now or time.monotonic()) - self.start
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        print(
+            f"{self.done} done, {self.found} found, {self.done - self.found - self.errors} none, "
+            f"{self.errors} errors, {elapsed:.1f}s, {rate:.1f}/s",
+            file=self.out,
+            flush=True,
+        )
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m whois",
+        description="Look up many domains concurrently, write JSON Lines.",
+    )
+    parser.add_argument("file", nargs="?", default="-", help="one domain per line, default stdin")
+    parser.add_argument("-o", "--output", default="-", help="JSON Lines output file, default stdout")
+    parser.add_argument("-w", "--workers", type=int, default=8, help="concurrent lookups (default 8)")
+    parser.add_argument("--progress", type=float, default=5, help="seconds between progress lines, 0: off")
+    parser.add_argument("--transport", choices=["subprocess", "socket", "referral"], default=None)
+    parser.add_argument("--server", default=None, help="whois server (host or host:port) for all queries")
+    parser.add_argument("--timeout", type=float, default=10)
+    parser.add_argument("--slow-down", type=int, default=0, help="seconds between queries to the same server")
+    parser.add_argument("--cache-file", default=None)
+    parser.add_argument("--cache-backend", choices=["json", "sqlite"], default=None)
+    parser.add_argument("--force", action="store_true", help="ignore the cache")
+    parser.add_argument("--ignore-returncode", action="store_true")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    fin = sys.stdin if args.file == "-" else open(args.file, "r")
+    fout = sys.stdout if args.output == "-" else open(args.output, "w")
+    progress = Progress(args.progress)
+
+    try:
+        results = query_many(
+            _read_domains(fin),
+            max_workers=args.workers,
+            force=args.force,
+            cache_file=args.cache_file,
+            slow_down=args.slow_down,
+            ignore_returncode=args.ignore_returncode,
+            server=args.server,
+            verbose=args.verbose,
+            transport=args.transport,
+            timeout=args.timeout,
+            cache_backend=args.cache_backend,
+        )
+        for domain, result in results:
+            fout.write(result_to_json(domain, result) + "\n")
+            fout.flush()
+            progress.add(result)
+    except KeyboardInterrupt:
+        print("interrupted", file=sys.stderr)
+        return 130
+    finally:
+        progress.report()
+        if fin is not sys.stdin:
+            fin.close()
+        if fout is not sys.stdout:
+            fout.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+def _entry_size(k: str, entry: Tuple[int, Any]) -> int:
+    # good enough estimate for (timestamp, whois response) entries
+    v = entry[1]
+    if isinstance(v, str):
+        return len(k) + len(v)
+    return len(k) + sys.getsizeof(v)
+
+
+class LruCache(MutableMapping):
+    """
+    Bounded in memory cache for (timestamp, value) entries, a drop in for a plain dict.
+
+    - max_entries and/or max_bytes: when full the least recently used entries are evicted
+    - max_age [s]: entries older than that are dropped when seen
+      and by a full sweep at most every purge_interval seconds
+    - hits, misses, evictions and expirations are counted, see stats()
+
+    None means no limit.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+        purge_interval: float = 60,
+        sizeof: Callable[[str, Tuple[int, Any]], int] = _entry_size,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.purge_interval = purge_interval
+        self.sizeof = sizeof
+
+        self._lock = threading.RLock()
+        self._data: "OrderedDict[str, Tuple[Tuple[int, Any], int]]" = OrderedDict()  # k -> (entry, size)
+        self._last_purge = time.time()
+
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expired(self, entry: Tuple[int, Any], now: float) -> bool:
+        return self.max_age is not None and entry[0] < now - self.max_age
+
+    def _remove(self, k: str) -> None:
+        _, size = self._data.pop(k)
+        self.bytes -= size
+
+    def get(self, k: str, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(k)
+            if item is None:
+                self.misses += 1
+                return default
+
+            if self._expired(item[0], time.time()):
+                self._remove(k)
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(k)
+            self.hits += 1
+            return item[0]
+
+    def __getitem__(self, k: str) -> Tuple[int, Any]:
+        entry = self.get(k)
+        if entry is None:
+            raise KeyError(k)
+        return entry
+
+    def __contains__(self, k: object) -> bool:
+        # a peek: no counters, no change in the lru order
+        with self._lock:
+            item = self._data.get(k)  # type: ignore
+            return item is not None and not self._expired(item[0], time.time())
+
+    def __setitem__(self, k: str, entry: Tuple[int, Any]) -> None:
+        size = self.sizeof(k, entry)
+        with self._lock:
+            if k in self._data:
+                self._remove(k)
+
+            self._data[k] = (entry, size)
+            self.bytes += size
+
+            now = time.time()
+            if now - self._last_purge > self.purge_interval:
+                self.purge_expired()
+
+            self._evict()
+
+    def __delitem__(self, k: str) -> None:
+        with self._lock:
+            self._remove(k)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._data))
+
+    def items(self) -> List[Tuple[str, Tuple[int, Any]]]:  # type: ignore
+        # a snapshot from least to most recently used, no counters touched
+        with self._lock:
+            return [(k, item[0]) for k, item in self._data.items()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+
+    def _evict(self) -> None:
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._data.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def purge_expired(self) -> int:
+        # drop all expired entries now, returns how many were dropped
+        with self._lock:
+            now = time.time()
+            self._last_purge = now
+            old = [k for k, item in self._data.items() if self._expired(item[0], now)]
+            for k in old:
+                self._remove(k)
+            self.expirations += len(old)
+            return len(old)
+
+    def resize(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "bytes": self.bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class SqliteCache:
+    """
+    Persistent whois response cache in a sqlite database.
+
+    One row per domain, indexed on the domain,
+    so a lookup or an update touches a single row and not the whole cache file.
+    The parsed results are kept next to the responses in whois_parsed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+        import sqlite3  # only when used, like asyncio it costs every "import whois" otherwise
+
+        # we serialize access ourselves, autocommit every statement
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS whois_cache ("
+            "domain TEXT PRIMARY KEY, "
+            "ts INTEGER NOT NULL, "
+            "response TEXT NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS whois_cache_ts ON whois_cache (ts)")
+        # parsed results, Domain.to_json() with the tld_fingerprint() it was parsed with
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS whois_parsed ("
+            "key TEXT PRIMARY KEY, "
+            "ts INTEGER NOT NULL, "
+            "fingerprint TEXT NOT NULL, "
+            "data TEXT NOT NULL)"
+        )
+
+    def get(self, k: str, min_ts: int = 0) -> Optional[Tuple[int, str]]:
+        # only return entries not older than min_ts
+        with self._lock:
+            row = self._db.execute(
+                "SELECT ts, response FROM whois_cache WHERE domain = ? AND ts >= ?",
+                (k, min_ts),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    def put(self, k: str, ts: int, response: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO whois_cache (domain, ts, response) VALUES (?, ?, ?)",
+                (k, ts, response),
+            )
+
+    def get_parsed(self, k: str, min_ts: int = 0) -> Optional[Tuple[int, str, str]]:
+        # (ts, fingerprint, data), the caller decides if the fingerprint is still the current one
+        with self._lock:
+            row = self._db.execute(
+                "SELECT ts, fingerprint, data FROM whois_parsed WHERE key = ? AND ts >= ?",
+                (k, min_ts),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return row[0], row[1], row[2]
+
+    def put_parsed(self, k: str, ts: int, fingerprint: str, data: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO whois_parsed (key, ts, fingerprint, data) VALUES (?, ?, ?, ?)",
+                (k, ts, fingerprint, data),
+            )
+
+    def purge(self, min_ts: int) -> int:
+        # remove all entries older than min_ts, returns the number of removed response rows
+        with self._lock:
+            self._db.execute("DELETE FROM whois_parsed WHERE ts < ?", (min_ts,))
+            return self._db.execute("DELETE FROM whois_cache WHERE ts < ?", (min_ts,)).rowcount
+
+    def import_json(self, cf: str) -> int:
+        # migrate a cache file written by _1_query.cache_save()
+        with open(cf, "r") as f:
+            data = json.load(f)
+
+        with self._lock:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT OR REPLACE INTO whois_cache (domain, ts, response) VALUES (?, ?, ?)",
+                ((k, int(v[0]), v[1]) for k, v in data.items()),
+            )
+            self._db.execute("COMMIT")
+
+        return len(data)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM whois_cache").fetchone()[0]
+
+    def iter_items(self, batch: int = 1000) -> Iterator[Tuple[str, int, str]]:
+        # all (domain, ts, response) rows in domain order, batch rows at a time,
+        # the lock is not held between batches
+        last = ""
+        while 1:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT domain, ts, response FROM whois_cache WHERE domain > ? ORDER BY domain LIMIT ?",
+                    (last, batch),
+                ).fetchall()
+
+            if not rows:
+                return
+            yield from rows
+            last = rows[-1][0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+SQLITE_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+
+_SQLITE_CACHES: Dict[str, SqliteCache] = {}
+_SQLITE_CACHES_LOCK = threading.Lock()
+
+
+def sqlite_cache(path: str) -> SqliteCache:
+    # one open database per path for the whole process
+    with _SQLITE_CACHES_LOCK:
+        c = _SQLITE_CACHES.get(path)
+        if c is None:
+            c = _SQLITE_CACHES[path] = SqliteCache(path)
+        return c
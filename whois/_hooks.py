@@ -0,0 +1,161 @@
+"""
+    Per stage timing hooks
+
+    >>> def hook(e: whois.StageEvent) -> None:
+    ...     print(e.stage, e.tld, e.server, e.cache_hit, e.attempt, e.outcome, f"{e.duration * 1000:.2f}ms")
+    >>> whois.add_hook(hook)
+
+    Every query() / aquery() then reports each stage it runs:
+    - cache:        lookup of the raw response (outcome hit or miss)
+    - parsed_cache: lookup of the parsed result (outcome hit or miss)
+    - transport:    the whois binary or the socket, with the server (None when the binary picks it)
+    - cleanup:      cleanupWhoisResponse()
+    - parse:        the field regexes and the rest of do_parse() (outcome ok, none or error)
+    - domain:       Domain() including the dates
+    attempt counts the levels tried for one query: a.b.com is attempt 1, b.com attempt 2.
+
+    Without a hook the cost is one truthiness test of HOOKS per stage.
+    Hooks run in the thread (or task) of the query, keep them fast; their exceptions are printed and ignored.
+"""
+import contextvars
+import sys
+import time
+
+from typing import Callable, List, Optional
+
+HOOKS: List[Callable[["StageEvent"], None]] = []
+
+
+class QueryContext:
+    # what we know about the query that is running, set by query() only when there are hooks
+    __slots__ = ("domain", "tld", "server", "transport", "attempt", "cache_hit")
+
+    def __init__(
+        self,
+        domain: str,
+        tld: str,
+        server: Optional[str],
+        transport: str,
+    ):
+        self.domain = domain
+        self.tld = tld
+        self.server = server
+        self.transport = transport
+        self.attempt = 0
+        self.cache_hit = False
+
+
+CONTEXT: "contextvars.ContextVar[Optional[QueryContext]]" = contextvars.ContextVar("whois_query", default=None)
+
+
+class StageEvent:
+    __slots__ = (
+        "stage",
+        "duration",
+        "outcome",
+        "error",
+        "domain",
+        "tld",
+        "server",
+        "transport",
+        "attempt",
+        "cache_hit",
+    )
+
+    def __init__(
+        self,
+        stage: str,
+        duration: float,
+        outcome: str,
+        error: Optional[str],
+        ctx: Optional[QueryContext],
+        domain: Optional[str] = None,
+    ):
+        self.stage = stage
+        self.duration = duration  # seconds
+        self.outcome = outcome  # ok, hit, miss, none or error
+        self.error = error  # the name of the exception if outcome is error
+        self.domain = domain or (ctx.domain if ctx else None)
+        self.tld = ctx.tld if ctx else None
+        self.server = ctx.server if ctx else None
+        self.transport = ctx.transport if ctx else None
+        self.attempt = ctx.attempt if ctx else 0
+        self.cache_hit = ctx.cache_hit if ctx else False
+
+    def __repr__(self) -> str:
+        return (
+            f"StageEvent({self.stage} {self.outcome} {self.duration * 1000:.3f}ms "
+            f"domain={self.domain} tld={self.tld} server={self.server} attempt={self.attempt} "
+            f"cache_hit={self.cache_hit})"
+        )
+
+
+def add_hook(fn: Callable[[StageEvent], None]) -> None:
+    if fn not in HOOKS:
+        HOOKS.append(fn)
+
+
+def remove_hook(fn: Callable[[StageEvent], None]) -> None:
+    if fn in HOOKS:
+        HOOKS.remove(fn)
+
+
+def enter(
+    domain: str,
+    tld: str,
+    server: Optional[str],
+    transport: str,
+) -> Optional[contextvars.Token]:
+    # start a query context, only when there are hooks; leave() with the token when the query is done
+    if not HOOKS:
+        return None
+    return CONTEXT.set(QueryContext(domain, tld, server, transport))
+
+
+def leave(token: Optional[contextvars.Token]) -> None:
+    if token is not None:
+        CONTEXT.reset(token)
+
+
+def next_attempt(domain: str) -> None:
+    # the query moves on to the next level of the domain
+    ctx = CONTEXT.get()
+    if ctx is not None:
+        ctx.domain = domain
+        ctx.attempt += 1
+        ctx.cache_hit = False
+
+
+def emit_cache(
+    stage: str,
+    start: float,
+    hit: bool,
+) -> None:
+    ctx = CONTEXT.get()
+    if ctx is not None:
+        ctx.cache_hit = hit
+    emit(stage, start, "hit" if hit else "miss")
+
+
+def emit(
+    stage: str,
+    start: float,
+    outcome: str = "ok",
+    error: Optional[BaseException] = None,
+    domain: Optional[str] = None,
+) -> None:
+    # only call this if HOOKS, start is time.perf_counter() at the beginning of the stage
+    duration = time.perf_counter() - start
+    event = StageEvent(
+        stage,
+        duration,
+        "error" if error is not None else outcome,
+        type(error).__name__ if error is not None else None,
+        CONTEXT.get(),
+        domain=domain,
+    )
+    for fn in list(HOOKS):
+        try:
+            fn(event)
+        except Exception as e:
+            print(f"ignore hook err: {e!r}", file=sys.stderr)
@@ -0,0 +1,225 @@
+"""
+    Generate _tld_servers.py: the whois server for every tld in tld_regexpr.py
+
+    python -m whois._make_tld_servers [--version V] [dump ...]
+
+    A dump is a saved copy of the IANA root zone database as whois.iana.org answers it:
+    a file with one or more responses (domain: / whois: lines), or a directory of such files,
+    e.g. made with: for t in $(cat tlds); do whois -h whois.iana.org $t > dump/$t; done
+    No network access is needed to refresh the table.
+
+    For each tld the server is taken from, in this order:
+    the _server hint in tld_regexpr.py, the dumps, KNOWN_SERVERS (hand kept, not from iana).
+    Tlds without a server are written as None. The output depends on these inputs only,
+    every entry is marked with its source and the header names the dumps,
+    so a table built without a dump says so.
+"""
+import argparse
+import datetime
+import json
+import os
+import re
+import sys
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ._0_tld import tld_key_to_suffix
+
+TABLE_FILE = os.path.join(os.path.dirname(__file__), "_tld_servers.py")
+
+# registry servers that were well known when the table was first made, kept by hand and not taken from iana,
+# the lowest priority source, a dump overrides them
+KNOWN_SERVERS: Dict[str, Optional[str]] = {
+    "com": "whois.verisign-grs.com",
+    "net": "whois.verisign-grs.com",
+    "cc": "ccwhois.verisign-grs.com",
+    "org": "whois.publicinterestregistry.org",
+    "info": "whois.nic.info",
+    "biz": "whois.nic.biz",
+    "name": "whois.nic.name",
+    "mobi": "whois.nic.mobi",
+    "pro": "whois.nic.pro",
+    "tel": "whois.nic.tel",
+    "asia": "whois.nic.asia",
+    "edu": "whois.educause.edu",
+    "top": "whois.nic.top",
+    "app": "whois.nic.google",
+    "dev": "whois.nic.google",
+    "cloud": "whois.nic.cloud",
+    "shop": "whois.nic.shop",
+    "ac": "whois.nic.ac",
+    "ai": "whois.nic.ai",
+    "at": "whois.nic.at",
+    "au": "whois.auda.org.au",
+    "be": "whois.dns.be",
+    "br": "whois.registro.br",
+    "by": "whois.cctld.by",
+    "ca": "whois.cira.ca",
+    "ch": "whois.nic.ch",
+    "cl": "whois.nic.cl",
+    "cn": "whois.cnnic.cn",
+    "cz": "whois.nic.cz",
+    "de": "whois.denic.de",
+    "dk": "whois.punktum.dk",
+    "ee": "whois.tld.ee",
+    "es": "whois.nic.es",
+    "eu": "whois.eu",
+    "fi": "whois.fi",
+    "fr": "whois.nic.fr",
+    "hk": "whois.hkirc.hk",
+    "hu": "whois.nic.hu",
+    "il": "whois.isoc.org.il",
+    "in": "whois.registry.in",
+    "io": "whois.nic.io",
+    "ir": "whois.nic.ir",
+    "is": "whois.isnic.is",
+    "it": "whois.nic.it",
+    "jp": "whois.jprs.jp",
+    "kr": "whois.kr",
+    "kz": "whois.nic.kz",
+    "li": "whois.nic.li",
+    "lt": "whois.domreg.lt",
+    "lv": "whois.nic.lv",
+    "me": "whois.nic.me",
+    "mx": "whois.mx",
+    "nl": "whois.domain-registry.nl",
+    "no": "whois.norid.no",
+    "nu": "whois.iis.nu",
+    "pl": "whois.dns.pl",
+    "pt": "whois.dns.pt",
+    "re": "whois.nic.re",
+    "ro": "whois.rotld.ro",
+    "ru": "whois.tcinet.ru",
+    "se": "whois.iis.se",
+    "sh": "whois.nic.sh",
+    "sk": "whois.sk-nic.sk",
+    "su": "whois.tcinet.ru",
+    "tw": "whois.twnic.net.tw",
+    "ua": "whois.ua",
+    "uk": "whois.nic.uk",
+    "us": "whois.nic.us",
+    "ws": "whois.website.ws",
+    "xn--p1ai": "whois.tcinet.ru",
+}
+
+_DOMAIN_RE = re.compile(r"^domain:[ \t]*(\S+)", re.IGNORECASE | re.MULTILINE)
+_WHOIS_RE = re.compile(r"^whois:[ \t]*(\S*)", re.IGNORECASE | re.MULTILINE)
+
+
+def parse_iana_dump(text: str) -> Dict[str, Optional[str]]:
+    # tld -> whois server (None if iana lists none), for every response in the text
+    out: Dict[str, Optional[str]] = {}
+    starts = [m for m in _DOMAIN_RE.finditer(text)]
+    for i, m in enumerate(starts):
+        end = starts[i + 1].start() if i + 1 < len(starts) else len(text)
+        w = _WHOIS_RE.search(text, m.end(), end)
+        server = w.group(1).strip().lower() if w else ""
+        out[m.group(1).strip(".").lower()] = server or None
+
+    return out
+
+
+def _dump_files(paths: Iterable[str]) -> List[str]:
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(os.path.join(path, f) for f in os.listdir(path))
+        else:
+            files.append(path)
+    return files
+
+
+def read_dumps(paths: Iterable[str]) -> Dict[str, Optional[str]]:
+    out: Dict[str, Optional[str]] = {}
+    for path in _dump_files(paths):
+        with open(path, "r", errors="ignore") as f:
+            out.update(parse_iana_dump(f.read()))
+    return out
+
+
+def _root_label(key: str, maps: Dict[str, str]) -> str:
+    # the root zone label of a tld_regexpr key as iana knows it: co_jp -> jp, ru_rf -> xn--p1ai
+    for suffix, k in maps.items():
+        if k == key:
+            return suffix.strip(".").split(".")[-1]
+
+    label = tld_key_to_suffix(key).split(".")[-1]
+    if not label.isascii():
+        label = label.encode("idna").decode("ascii")
+    return label
+
+
+def make_servers(dump: Dict[str, Optional[str]]) -> Dict[str, Tuple[Optional[str], str]]:
+    # tld_regexpr key -> (server, source), source is "hint", "dump", "known" or "none"
+    from . import Map2Underscore, PythonKeyWordMap, Utf8Map
+    from ._2_parse import TLD_RE
+
+    maps = {**Map2Underscore, **PythonKeyWordMap, **Utf8Map}
+
+    servers: Dict[str, Tuple[Optional[str], str]] = {}
+    for key in sorted(TLD_RE.keys()):
+        hint = TLD_RE[key].get("_server")
+        if hint and "." in hint:
+            servers[key] = (hint, "hint")
+            continue
+
+        label = _root_label(key, maps)
+        if label in dump:
+            servers[key] = (dump[label], "dump")
+        elif KNOWN_SERVERS.get(label):
+            servers[key] = (KNOWN_SERVERS[label], "known")
+        else:
+            servers[key] = (None, "none")
+
+    return servers
+
+
+def make_table(
+    servers: Dict[str, Tuple[Optional[str], str]],
+    version: str,
+    dumps: List[str],
+) -> str:
+    counts: Dict[str, int] = {}
+    for _, source in servers.values():
+        counts[source] = counts.get(source, 0) + 1
+
+    out = [
+        "# generated by: python -m whois._make_tld_servers",
+        "# do not edit, refresh it from a dump of the iana root zone database",
+        "# sources: " + ", ".join(f"{k} {v}" for k, v in sorted(counts.items())),
+        "# (hint: _server in tld_regexpr.py, dump: iana dump, known: KNOWN_SERVERS, none: not known)",
+    ]
+    if dumps:
+        out += [f"# dump: {os.path.basename(d)}" for d in dumps]
+    else:
+        out.append("# built without an iana dump")
+    out += [
+        "",
+        f"VERSION = {json.dumps(version)}",
+        "",
+        "# tld_regexpr key -> whois server of the registry, None: not known",
+        "SERVERS = {",
+    ]
+    out += [f"    {json.dumps(k)}: {json.dumps(v) if v else 'None'},  # {source}" for k, (v, source) in servers.items()]
+    out += ["}", ""]
+
+    return "\n".join(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m whois._make_tld_servers")
+    parser.add_argument("dumps", nargs="*", help="saved whois.iana.org responses, files or directories")
+    parser.add_argument("--version", default=None, help="default: today (utc)")
+    args = parser.parse_args()
+
+    version = args.version or datetime.datetime.utcnow().strftime("%Y-%m-%d")
+    servers = make_servers(read_dumps(args.dumps))
+    with open(TABLE_FILE, "w") as f:
+        f.write(make_table(servers, version, _dump_files(args.dumps)))
+
+    known = sum(1 for v, _ in servers.values() if v)
+    print(f"wrote {TABLE_FILE}: {known} of {len(servers)} tlds have a server", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
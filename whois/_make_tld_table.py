@@ -0,0 +1,101 @@
+"""
+    Generate _tld_table.py from tld_regexpr.py
+
+    python -m whois._make_tld_table [--check]
+
+    The generated module holds every tld with its extend chain already resolved
+    and every distinct pattern and every distinct flattened table only once, all as constants,
+    so _2_parse can build a tld table without importing tld_regexpr or walking the inheritance graph.
+    Run it after changing tld_regexpr.py (setup.py does it on every build),
+    an outdated table is detected and ignored; --check exits 1 if the table is outdated.
+"""
+import argparse
+import json
+import os
+import sys
+
+from typing import Any, Dict, List, Tuple
+
+TABLE_FILE = os.path.join(os.path.dirname(__file__), "_tld_table.py")
+
+
+def _literal(v: Any) -> str:
+    # double quoted like the rest of the code base (black)
+    if isinstance(v, str):
+        return json.dumps(v)
+    return repr(v)
+
+
+def make_table() -> str:
+    from . import tld_regexpr
+    from ._2_parse import flatten_tld, source_hash
+
+    patterns: List[str] = []
+    index: Dict[str, int] = {}
+    tables: List[Tuple[Tuple[str, Any], ...]] = []
+    table_index: Dict[Tuple[Tuple[str, Any], ...], int] = {}
+    tlds: Dict[str, int] = {}
+
+    for tld in dir(tld_regexpr):
+        if tld[0] == "_":
+            continue
+
+        flat = []
+        for k, v in flatten_tld(tld).items():
+            if k[0] != "_" and isinstance(v, str):
+                if v not in index:
+                    index[v] = len(patterns)
+                    patterns.append(v)
+                v = index[v]
+            flat.append((k, v))
+
+        t = tuple(flat)
+        if t not in table_index:
+            table_index[t] = len(tables)
+            tables.append(t)
+        tlds[tld] = table_index[t]
+
+    out = [
+        "# generated by: python -m whois._make_tld_table",
+        "# do not edit, change tld_regexpr.py and generate again",
+        "",
+        f'SOURCE_HASH = "{source_hash()}"',
+        "",
+        "PATTERNS = (",
+    ]
+    out += [f"    {_literal(p)}," for p in patterns]
+    out += [")", "", "# the distinct flattened tables: (field, index in PATTERNS or meta value) pairs", "TABLES = ("]
+    for t in tables:
+        out.append("    (")
+        out += [f"        ({_literal(k)}, {_literal(v)})," for k, v in t]
+        out.append("    ),")
+    out += [")", "", "# tld -> index in TABLES", "TLDS = {"]
+    out += [f"    {_literal(tld)}: {i}," for tld, i in tlds.items()]
+    out += ["}", ""]
+
+    return "\n".join(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m whois._make_tld_table")
+    parser.add_argument("--check", action="store_true", help="only check that the table is up to date")
+    args = parser.parse_args()
+
+    if args.check:
+        from . import _tld_table
+        from ._2_parse import source_hash
+
+        if _tld_table.SOURCE_HASH != source_hash():
+            print(f"{TABLE_FILE} is outdated, run: python -m whois._make_tld_table", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    table = make_table()
+    with open(TABLE_FILE, "w") as f:
+        f.write(table)
+
+    print(f"wrote {TABLE_FILE}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+    In-process metrics, fed by the timing hooks of _hooks.py
+
+    >>> whois.enable_metrics()
+    >>> whois.query("example.com")
+    >>> whois.metrics_snapshot()["counters"]
+    >>> print(whois.metrics_prometheus())
+
+    Recorded:
+    - whois_cache_total{stage, result}:         cache and parsed_cache lookups, result hit or miss
+    - whois_transport_seconds{server}:          histogram of the subprocess or socket time per whois server
+    - whois_errors_total{tld, error}:           WhoisQuotaExceeded and WhoisCommandFailed
+    - whois_parse_failures_total{tld, error}:   other exceptions from cleanup, parse and Domain() by type
+
+    Every thread writes to its own shard without a lock,
+    snapshot() adds the shards up (and folds those of finished threads into one).
+"""
+import bisect
+import threading
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import _hooks
+
+# seconds
+BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# these count as errors of the tld, not as parse failures
+ERRORS = ("WhoisQuotaExceeded", "WhoisCommandFailed")
+
+Labels = Tuple[Tuple[str, str], ...]
+Key = Tuple[str, Labels]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(v: float) -> str:
+    # counts exactly, not rounded to 6 digits like :g; other floats as repr()
+    if isinstance(v, int) or v.is_integer():
+        return str(int(v))
+    return repr(v)
+
+
+class _Shard:
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self) -> None:
+        self.counters: Dict[Key, float] = {}
+        # per key: a count per bucket (the last one is +Inf), then sum and count
+        self.histograms: Dict[Key, List[float]] = {}
+
+    def merge(self, other: "_Shard") -> None:
+        for k, v in dict(other.counters).items():
+            self.counters[k] = self.counters.get(k, 0) + v
+
+        for k, h in dict(other.histograms).items():
+            mine = self.histograms.get(k)
+            if mine is None:
+                self.histograms[k] = list(h)
+            else:
+                for i, v in enumerate(h):
+                    mine[i] += v
+
+
+class MetricsRegistry:
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self._local = threading.local()
+        self._lock = threading.Lock()  # only taken for a new thread and for snapshots
+        self._shards: Dict[threading.Thread, _Shard] = {}
+        self._retired = _Shard()
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards[threading.current_thread()] = shard
+            return shard
+
+    def inc(self, name: str, labels: Labels = (), value: float = 1) -> None:
+        counters = self._shard().counters
+        k = (name, labels)
+        counters[k] = counters.get(k, 0) + value
+
+    def observe(self, name: str, value: float, labels: Labels = ()) -> None:
+        histograms = self._shard().histograms
+        k = (name, labels)
+        h = histograms.get(k)
+        if h is None:
+            h = histograms[k] = [0.0] * (len(self.buckets) + 3)
+        h[bisect.bisect_left(self.buckets, value)] += 1
+        h[-2] += value
+        h[-1] += 1
+
+    def _merged(self) -> _Shard:
+        with self._lock:
+            for t, shard in list(self._shards.items()):
+                if not t.is_alive():
+                    self._retired.merge(shard)
+                    del self._shards[t]
+
+            total = _Shard()
+            total.merge(self._retired)
+            for shard in self._shards.values():
+                total.merge(shard)
+        return total
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = self._merged()
+
+        counters: Dict[str, List[Dict[str, Any]]] = {}
+        for (name, labels), v in sorted(total.counters.items()):
+            counters.setdefault(name, []).append({"labels": dict(labels), "value": v})
+
+        histograms: Dict[str, List[Dict[str, Any]]] = {}
+        for (name, labels), h in sorted(total.histograms.items()):
+            histograms.setdefault(name, []).append(
+                {
+                    "labels": dict(labels),
+                    "buckets": dict(zip([*self.buckets, float("inf")], h[:-2])),
+                    "sum": h[-2],
+                    "count": int(h[-1]),
+                }
+            )
+
+        return {"counters": counters, "histograms": histograms}
+
+    def prometheus(self) -> str:
+        # the text exposition format, version 0.0.4
+        total = self._merged()
+        lines: List[str] = []
+        typed = set()
+
+        def labelstr(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+            items = list(labels) + ([extra] if extra else [])
+            if not items:
+                return ""
+            return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+        for (name, labels), v in sorted(total.counters.items()):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{labelstr(labels)} {_number(v)}")
+
+        for (name, labels), h in sorted(total.histograms.items()):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            cumulative = 0.0
+            for le, n in zip([*(repr(float(b)) for b in self.buckets), "+Inf"], h[:-2]):
+                cumulative += n
+                lines.append(f"{name}_bucket{labelstr(labels, ('le', le))} {_number(cumulative)}")
+            lines.append(f"{name}_sum{labelstr(labels)} {repr(h[-2])}")
+            lines.append(f"{name}_count{labelstr(labels)} {_number(h[-1])}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            for shard in self._shards.values():
+                shard.counters.clear()
+                shard.histograms.clear()
+            self._retired = _Shard()
+
+    def record(self, e: _hooks.StageEvent) -> None:
+        # the hook: one StageEvent to counters and histograms
+        if e.outcome == "hit" or e.outcome == "miss":
+            self.inc("whois_cache_total", (("stage", e.stage), ("result", e.outcome)))
+
+        elif e.stage == "transport":
+            self.observe("whois_transport_seconds", e.duration, (("server", e.server or "default"),))
+            if e.error in ERRORS:
+                self.inc("whois_errors_total", (("tld", e.tld or ""), ("error", e.error)))
+
+        elif e.error is not None:
+            if e.error in ERRORS:
+                self.inc("whois_errors_total", (("tld", e.tld or ""), ("error", e.error)))
+            else:
+                self.inc("whois_parse_failures_total", (("tld", e.tld or ""), ("error", e.error)))
+
+
+METRICS = MetricsRegistry()
+
+
+def enable_metrics() -> None:
+    _hooks.add_hook(METRICS.record)
+
+
+def disable_metrics() -> None:
+    _hooks.remove_hook(METRICS.record)
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    return METRICS.snapshot()
+
+
+def metrics_prometheus() -> str:
+    return METRICS.prometheus()
@@ -0,0 +1,193 @@
+"""
+    Cost of every pattern of tld_regexpr, measured over a corpus of stored responses
+
+    python -m whois._profile [--by pattern] [--top 30] [--repeat 3] [-o profile.json] corpus [corpus ...]
+
+    The corpus is read like _reparse does (json or sqlite cache, .jsonl, tar archive or directory).
+    While profiling, do_parse() runs pattern.findall() per field, the way it did before the FieldScanner,
+    and records per tld and field: the cumulative time, the number of calls and the number of matches.
+    That is the cost of the pattern itself, the one a rewrite of the pattern changes;
+    in production the FieldScanner only runs keyword patterns where the keyword occurs.
+
+    --by field ranks tld/field pairs, --by pattern adds up all tld's that share a pattern.
+
+    From python:
+    >>> from whois import _profile
+    >>> p = _profile.enable()
+    >>> ...  # query() or do_parse() as usual
+    >>> _profile.disable()
+    >>> print(p.format_report(by="pattern"))
+"""
+import argparse
+import itertools
+import json
+import sys
+import threading
+import time
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import _2_parse
+
+
+class RegexProfile:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # (tld, field) -> [seconds, calls, matches]
+        self.stats: Dict[Tuple[str, str], List[float]] = {}
+        self.patterns: Dict[Tuple[str, str], str] = {}
+        self.responses = 0
+
+    def scan(self, tld: str, table: Dict[str, Any], text: str) -> Dict[str, List[Any]]:
+        # same result as FieldScanner(table).scan(text), one timed findall per field
+        found: Dict[str, List[Any]] = {}
+        timings = []
+        for k, v in table.items():
+            if k[0] == "_" or v is None or isinstance(v, str):
+                continue
+
+            t = time.perf_counter()
+            found[k] = v.findall(text)
+            timings.append((k, v.pattern, time.perf_counter() - t, len(found[k])))
+
+        with self._lock:
+            self.responses += 1
+            for k, pattern, seconds, matches in timings:
+                s = self.stats.get((tld, k))
+                if s is None:
+                    s = self.stats[(tld, k)] = [0.0, 0, 0]
+                    self.patterns[(tld, k)] = pattern
+                s[0] += seconds
+                s[1] += 1
+                s[2] += matches
+
+        return found
+
+    def rows(self, by: str = "field") -> List[Dict[str, Any]]:
+        # ranked, most expensive first
+        with self._lock:
+            items = [(key, list(s), self.patterns[key]) for key, s in self.stats.items()]
+
+        if by == "pattern":
+            grouped: Dict[str, Dict[str, Any]] = {}
+            for (tld, field), (seconds, calls, matches), pattern in items:
+                g = grouped.get(pattern)
+                if g is None:
+                    g = grouped[pattern] = {"pattern": pattern, "fields": set(), "tlds": set()}
+                    g.update(seconds=0.0, calls=0, matches=0)
+                g["fields"].add(field)
+                g["tlds"].add(tld)
+                g["seconds"] += seconds
+                g["calls"] += calls
+                g["matches"] += matches
+
+            rows = []
+            for g in grouped.values():
+                g["fields"] = sorted(g["fields"])
+                g["tlds"] = sorted(g["tlds"])
+                rows.append(g)
+
+        elif by == "field":
+            rows = [
+                {"tld": tld, "field": field, "pattern": pattern, "seconds": seconds, "calls": calls, "matches": matches}
+                for (tld, field), (seconds, calls, matches), pattern in items
+            ]
+
+        else:
+            raise ValueError(f"unknown grouping: {by}")
+
+        for r in rows:
+            r["us_per_call"] = r["seconds"] / r["calls"] * 1e6 if r["calls"] else 0.0
+
+        rows.sort(key=lambda r: r["seconds"], reverse=True)
+        return rows
+
+    def format_report(self, by: str = "field", top: Optional[int] = 30) -> str:
+        rows = self.rows(by)
+        total = sum(r["seconds"] for r in rows)
+
+        lines = [f"{self.responses} responses, {total * 1000:.1f}ms in findall"]
+        total = total or 1.0
+        where = "tld/field" if by == "field" else "tlds"
+        lines.append(f"{'ms':>9} {'%':>5} {'us/call':>9} {'calls':>7} {'matches':>8}  {where}")
+        for r in rows[:top]:
+            if by == "field":
+                where = f"{r['tld']}/{r['field']}"
+            else:
+                tlds = r["tlds"]
+                where = f"{len(tlds)} tlds ({', '.join(tlds[:5])}{', ...' if len(tlds) > 5 else ''})"
+            lines.append(
+                f"{r['seconds'] * 1000:>9.2f} {r['seconds'] / total * 100:>5.1f} {r['us_per_call']:>9.1f} "
+                f"{r['calls']:>7} {r['matches']:>8}  {where}"
+            )
+            lines.append(f"{'':>44}{r['pattern']}")
+
+        return "\n".join(lines)
+
+
+def enable(profile: Optional[RegexProfile] = None) -> RegexProfile:
+    # from now on do_parse() records into profile, everywhere in this process
+    _2_parse.PROFILE = profile or RegexProfile()
+    return _2_parse.PROFILE
+
+
+def disable() -> None:
+    _2_parse.PROFILE = None
+
+
+def profile_corpus(
+    corpus: Iterable[Tuple[str, str]],
+    repeat: int = 1,
+    profile: Optional[RegexProfile] = None,
+) -> RegexProfile:
+    from . import _prepareDomain
+    from ._2_parse import do_parse
+
+    items = []
+    for domain, response in corpus:
+        try:
+            prepared = _prepareDomain(domain, server=None, slow_down=0, verbose=False, transport="subprocess")
+        except Exception:
+            continue  # UnknownTld, WhoisPrivateRegistry: nothing to parse
+        if prepared is not None:
+            d, tld, _, _ = prepared
+            items.append((tld, d, response))
+
+    profile = enable(profile)
+    try:
+        for _ in range(repeat):
+            for tld, d, response in items:
+                try:
+                    do_parse(response, tld, d)
+                except Exception:
+                    pass  # the parse failures are the business of _reparse
+    finally:
+        disable()
+
+    return profile
+
+
+def main() -> None:
+    from ._reparse import iter_corpus
+
+    parser = argparse.ArgumentParser(prog="python -m whois._profile", description="Cost of every tld_regexpr pattern")
+    parser.add_argument("corpus", nargs="+", help="json or sqlite cache, .jsonl, tar archive or directory")
+    parser.add_argument("--by", choices=["field", "pattern"], default="field")
+    parser.add_argument("--top", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=1, help="parse the corpus this many times")
+    parser.add_argument("-o", "--output", default=None, help="write all rows as json")
+    args = parser.parse_args()
+
+    corpus = itertools.chain.from_iterable(iter_corpus(path) for path in args.corpus)
+    profile = profile_corpus(corpus, repeat=args.repeat)
+
+    print(profile.format_report(by=args.by, top=args.top))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(profile.rows(args.by), f, indent=1)
+        print(f"wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import threading
+import time
+
+from typing import Dict, Optional
+
+
+class RateLimiter:
+    """
+    Token bucket per whois server (GCRA style: we only remember when the next token is due).
+
+    Queries to different servers never wait for each other,
+    queries to the same server are spaced at least `interval` seconds apart,
+    counted from the last time that server was contacted, not from now.
+    burst > 1 allows that many queries back to back before the spacing kicks in.
+
+    The interval comes with each call (slow_down or the _slowdown hint from tld_regexpr.py)
+    or from set_interval() for servers you know are strict.
+    """
+
+    def __init__(self, burst: int = 1):
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._due: Dict[str, float] = {}  # server -> theoretical arrival time of the next query
+        self._intervals: Dict[str, float] = {}
+
+    def set_interval(self, key: str, interval: float) -> None:
+        with self._lock:
+            self._intervals[key] = interval
+
+    def reserve(self, key: str, interval: Optional[float] = None) -> float:
+        # claim the next slot for this server and return how long [s] to wait for it
+        with self._lock:
+            interval = interval or self._intervals.get(key, 0)
+            if not interval or interval <= 0:
+                return 0.0
+
+            now = time.monotonic()
+            due = max(self._due.get(key, now), now)
+            self._due[key] = due + interval
+            return max(0.0, due - (self.burst - 1) * interval - now)
+
+    def wait(self, key: str, interval: Optional[float] = None) -> float:
+        delay = self.reserve(key, interval)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def wait_async(self, key: str, interval: Optional[float] = None) -> float:
+        import asyncio  # only when used, asyncio is slow to import
+
+        delay = self.reserve(key, interval)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def reset(self) -> None:
+        with self._lock:
+            self._due.clear()
+
+
+RATE_LIMITER = RateLimiter()
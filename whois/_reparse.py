@@ -0,0 +1,242 @@
+"""
+    Parse stored whois responses again, offline, with a pool of processes
+
+    python -m whois._reparse [-p 8] [-o results.jsonl] corpus [corpus ...]
+
+    A corpus is any of:
+    - a cache_file written by the json cache (domain -> [timestamp, response])
+    - a sqlite cache (.sqlite, .sqlite3, .db)
+    - a JSON Lines file (.jsonl) with {"domain": ..., "response": ...} per line
+    - a tar archive (.tar, .tar.gz, .tgz, ...) or a directory, one response per file named after the domain
+
+    Run it after improving tld_regexpr.py or DATE_FORMATS. There is no network access:
+    only do_parse() and Domain run, in worker processes forked after all tld tables are compiled,
+    so the workers share them copy-on-write. Chunks of results are written as soon as they are ready,
+    at most 2 chunks per process are in flight so memory stays bounded.
+    At the end the parse failures per tld and the throughput go to stderr.
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import tarfile
+import time
+
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from ._cache import SqliteCache, SQLITE_SUFFIXES
+
+CHUNK_SIZE = 500
+
+# outcomes of one response besides the name of the exception
+OK = "ok"
+NONE = "none"
+
+
+def _iter_json(path: str) -> Iterator[Tuple[str, str]]:
+    # the json cache is one object, it has to be loaded as a whole
+    with open(path, "r") as f:
+        data = json.load(f)
+    for k, v in data.items():
+        yield k, v[1]
+
+
+def _iter_jsonl(path: str) -> Iterator[Tuple[str, str]]:
+    with open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                yield item["domain"], item["response"]
+
+
+def _iter_sqlite(path: str) -> Iterator[Tuple[str, str]]:
+    db = SqliteCache(path)
+    try:
+        for k, _, response in db.iter_items():
+            yield k, response
+    finally:
+        db.close()
+
+
+def _iter_tar(path: str) -> Iterator[Tuple[str, str]]:
+    with tarfile.open(path, "r|*") as tar:  # streaming, no index of the members
+        for member in tar:
+            f = tar.extractfile(member) if member.isfile() else None
+            if f is not None:
+                yield os.path.basename(member.name), f.read().decode(errors="ignore")
+
+
+def _iter_dir(path: str) -> Iterator[Tuple[str, str]]:
+    for root, _, files in os.walk(path):
+        for name in sorted(files):
+            with open(os.path.join(root, name), "r", errors="ignore") as f:
+                yield name, f.read()
+
+
+def iter_corpus(path: str) -> Iterator[Tuple[str, str]]:
+    # (domain, response) for every stored response in path
+    if os.path.isdir(path):
+        return _iter_dir(path)
+    if path.endswith(SQLITE_SUFFIXES):
+        return _iter_sqlite(path)
+    if path.endswith(".jsonl"):
+        return _iter_jsonl(path)
+    if tarfile.is_tarfile(path):
+        return _iter_tar(path)
+    return _iter_json(path)
+
+
+def reparse_one(domain: str, response: str) -> Tuple[str, str, str]:
+    """
+    Parse one stored response like query() would, returns (tld, outcome, json line);
+    outcome is "ok", "none" (no domain found) or the name of the exception.
+    """
+    from . import _prepareDomain, _parseResponse
+
+    tld = ""
+    result = None
+    error = None
+    try:
+        prepared = _prepareDomain(domain, server=None, slow_down=0, verbose=False, transport="subprocess")
+        if prepared is not None:
+            d, tld, _, _ = prepared
+            result = _parseResponse(response, tld=tld, d=d)
+    except Exception as e:
+        error = {"type": type(e).__name__, "message": str(e)}
+
+    outcome = error["type"] if error else (OK if result else NONE)
+    line = '{"domain": %s, "tld": %s, "result": %s, "error": %s}' % (
+        json.dumps(domain),
+        json.dumps(tld),
+        result.to_json() if result else "null",
+        json.dumps(error),
+    )
+    return tld, outcome, line
+
+
+def _reparse_chunk(chunk: List[Tuple[str, str]]) -> List[Tuple[str, str, str]]:
+    return [reparse_one(domain, response) for domain, response in chunk]
+
+
+def _chunks(items: Iterable[Tuple[str, str]], size: int) -> Iterator[List[Tuple[str, str]]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ReparseStats:
+    def __init__(self) -> None:
+        self.start = time.monotonic()
+        self.total = 0
+        self.by_tld: Dict[str, Dict[str, int]] = {}  # tld -> outcome -> count
+
+    def add(self, tld: str, outcome: str) -> None:
+        self.total += 1
+        counts = self.by_tld.setdefault(tld, {})
+        counts[outcome] = counts.get(outcome, 0) + 1
+
+    def failures(self) -> List[Tuple[str, int, Dict[str, int]]]:
+        # (tld, failed, failures by exception) with the most failures first
+        out = []
+        for tld, counts in self.by_tld.items():
+            failed = {k: v for k, v in counts.items() if k not in (OK, NONE)}
+            if failed:
+                out.append((tld, sum(failed.values()), failed))
+        return sorted(out, key=lambda x: -x[1])
+
+    def report(self, out: TextIO = sys.stderr) -> None:
+        elapsed = time.monotonic() - self.start
+        count = {OK: 0, NONE: 0}
+        for counts in self.by_tld.values():
+            for k in count:
+                count[k] += counts.get(k, 0)
+        failed = self.total - count[OK] - count[NONE]
+        rate = self.total / elapsed if elapsed > 0 else 0.0
+
+        print(
+            f"{self.total} responses, {count[OK]} parsed, {count[NONE]} none, {failed} failed, "
+            f"{elapsed:.1f}s, {rate:.0f}/s",
+            file=out,
+        )
+        for tld, n, failures in self.failures():
+            detail = ", ".join(f"{k}: {v}" for k, v in sorted(failures.items(), key=lambda x: -x[1]))
+            print(f"{tld or '-':>16} {n:8} failed ({detail})", file=out)
+
+
+def reparse(
+    corpus: Iterable[Tuple[str, str]],
+    processes: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[List[Tuple[str, str, str]]]:
+    """
+    Yields the results of reparse_one() a chunk at a time, in the order the chunks complete.
+    """
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+    from ._2_parse import precompile
+    from ._3_adjust import _shape_formats
+    from . import tldTrie
+
+    # everything the workers need, built once before the fork
+    precompile()
+    _shape_formats()
+    tldTrie()
+
+    processes = processes or os.cpu_count() or 1
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+
+    todo = _chunks(corpus, chunk_size)
+    pending = set()
+
+    with ProcessPoolExecutor(max_workers=processes, mp_context=ctx) as executor:
+
+        def submit(n: int) -> None:
+            for chunk in itertools.islice(todo, n):
+                pending.add(executor.submit(_reparse_chunk, chunk))
+
+        try:
+            submit(2 * processes)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    pending.discard(f)
+                    yield f.result()
+                submit(len(done))
+        finally:
+            for f in pending:
+                f.cancel()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m whois._reparse", description="Parse stored whois responses again")
+    parser.add_argument("corpus", nargs="+", help="json or sqlite cache, .jsonl, tar archive or directory")
+    parser.add_argument("-o", "--output", default=None, help="JSON Lines output file, default: only the summary")
+    parser.add_argument("-p", "--processes", type=int, default=None, help="default: number of cpus")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    corpus = itertools.chain.from_iterable(iter_corpus(path) for path in args.corpus)
+    out = None if args.output is None else (sys.stdout if args.output == "-" else open(args.output, "w"))
+    stats = ReparseStats()
+
+    try:
+        for chunk in reparse(corpus, processes=args.processes, chunk_size=args.chunk_size):
+            for tld, outcome, line in chunk:
+                stats.add(tld, outcome)
+                if out is not None:
+                    out.write(line + "\n")
+    finally:
+        if out is not None and out is not sys.stdout:
+            out.close()
+        stats.report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+    Single pass field extraction for one tld table.
+
+    do_parse used to run pattern.findall(whois_str) for every field of the tld table,
+    that is a full scan of the response per field (and with re.IGNORECASE
+    the re module can not use its fast literal prefix search).
+
+    Almost all patterns start with a literal keyword ("Creation Date:", "nserver:", ...).
+    A FieldScanner collects these keywords in one alternation and scans the lowercased response once;
+    only where a keyword occurs the patterns of that keyword are tried with pattern.match().
+    The matches of a field are then taken left to right without overlap,
+    exactly what findall does, so the result is the same as calling findall per field.
+
+    Patterns without a keyword are handled in two ways:
+    - when they can not match a newline and need a literal character (the "emails" pattern needs "@")
+      findall only runs over the lines that have that character
+    - otherwise findall runs over the whole response as before
+"""
+import re
+
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from re import _parser as sre_parse  # type: ignore
+except ImportError:  # before python 3.11
+    import sre_parse  # type: ignore
+
+
+# characters that re.IGNORECASE matches against an ascii letter but str.lower() does not map to it,
+# if one of these is in the response we fall back to plain findall to stay exact
+_CASE_SPECIALS = "ſKİı"
+
+# keywords shorter than this do not help to skip text
+_MIN_KEYWORD = 3
+
+# categories that can never match a newline
+_SINGLE_LINE_CATEGORIES = {
+    "CATEGORY_DIGIT",
+    "CATEGORY_WORD",
+    "CATEGORY_NOT_LINEBREAK",
+    "CATEGORY_UNI_DIGIT",
+    "CATEGORY_UNI_WORD",
+    "CATEGORY_UNI_NOT_LINEBREAK",
+}
+
+
+def _name(op: Any) -> str:
+    return getattr(op, "name", str(op))
+
+
+def _parse(pattern: str) -> Any:
+    return sre_parse.parse(pattern, re.IGNORECASE)
+
+
+def literal_prefix(pattern: str) -> str:
+    # the lowercased literal text every match of the pattern starts with
+    out = []
+    for op, av in _parse(pattern):
+        if _name(op) != "LITERAL":
+            break
+        out.append(chr(av))
+
+    return "".join(out).lower()
+
+
+def _single_line(items: Any) -> bool:
+    # True if nothing in the parsed (sub)pattern can match a newline
+    for op, av in items:
+        name = _name(op)
+        if name == "LITERAL":
+            if av == 10:
+                return False
+        elif name == "ANY":
+            pass  # no DOTALL in our patterns
+        elif name == "IN":
+            for iop, iav in av:
+                iname = _name(iop)
+                if iname == "LITERAL" and iav != 10:
+                    continue
+                if iname == "RANGE" and not (iav[0] <= 10 <= iav[1]):
+                    continue
+                if iname == "CATEGORY" and _name(iav) in _SINGLE_LINE_CATEGORIES:
+                    continue
+                return False
+        elif name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"):
+            if not _single_line(av[2]):
+                return False
+        elif name == "SUBPATTERN":
+            if not _single_line(av[-1]):
+                return False
+        elif name == "BRANCH":
+            if not all(_single_line(b) for b in av[1]):
+                return False
+        else:
+            # anchors, lookarounds, backreferences, ...: dont guess
+            return False
+
+    return True
+
+
+def required_char(pattern: str) -> Optional[str]:
+    # a character every match contains, if the pattern can not match across lines
+    items = _parse(pattern)
+    if not _single_line(items):
+        return None
+
+    for op, av in items:
+        if _name(op) == "LITERAL":
+            c = chr(av)
+            if c.lower() == c.upper():  # no case issues
+                return c
+
+    return None
+
+
+class FieldScanner:
+    """
+    Extract all fields of one tld table, same result as {k: v.findall(text)}.
+    """
+
+    def __init__(self, table: Dict[str, Any]):
+        # only the fields with a pattern, meta keys and None are handled by the caller
+        self.fields: List[Tuple[str, Any]] = [
+            (k, v) for k, v in table.items() if k[0] != "_" and v is not None and not isinstance(v, str)
+        ]
+
+        self.by_keyword: Dict[str, List[int]] = {}  # keyword -> field indexes
+        self.by_char: Dict[str, List[int]] = {}  # required char -> field indexes
+        # all other fields use findall as before
+
+        for i, (_, v) in enumerate(self.fields):
+            kw = literal_prefix(v.pattern)
+            if len(kw) >= _MIN_KEYWORD:
+                self.by_keyword.setdefault(kw, []).append(i)
+                continue
+
+            c = required_char(v.pattern)
+            if c:
+                self.by_char.setdefault(c, []).append(i)
+
+        keywords = sorted(self.by_keyword, key=len, reverse=True)
+        self.gate = re.compile("|".join(re.escape(kw) for kw in keywords)) if keywords else None
+
+        # all keywords starting at the same position are checked, grouped on the first character
+        self.by_first: Dict[str, List[str]] = {}
+        for kw in keywords:
+            self.by_first.setdefault(kw[0], []).append(kw)
+
+        # the gate consumes a keyword, keywords starting inside it would be missed:
+        # remember for every keyword at which offsets another keyword may start
+        self.inner: Dict[str, List[Tuple[int, str]]] = {}
+        for a in keywords:
+            for i in range(1, len(a)):
+                tail = a[i:]
+                for b in keywords:
+                    if tail.startswith(b) or b.startswith(tail):
+                        self.inner.setdefault(a, []).append((i, b))
+
+    @staticmethod
+    def _value(m: Any, groups: int) -> Any:
+        # what findall returns for one match
+        if groups == 0:
+            return m.group(0)
+        if groups == 1:
+            return m.group(1) or ""
+        return tuple(g or "" for g in m.groups())
+
+    def _exact_lower(self, text: str) -> Optional[str]:
+        if text.isascii():
+            return text.lower()
+
+        low = text.lower()
+        if len(low) != len(text):
+            return None
+        for c in _CASE_SPECIALS:
+            if c in text:
+                return None
+        return low
+
+    def scan(self, text: str) -> Dict[str, List[Any]]:
+        found: List[Any] = [None] * len(self.fields)
+
+        low = self._exact_lower(text) if self.gate else None
+        if low is not None:
+            self._scan_keywords(text, low, found)
+
+        for c, idx in self.by_char.items():
+            lines = "\n".join(line for line in text.split("\n") if c in line) if c in text else ""
+            for i in idx:
+                found[i] = self.fields[i][1].findall(lines)
+
+        # no keyword or we could not use the lowercase text: as before
+        for i, (_, v) in enumerate(self.fields):
+            if found[i] is None:
+                found[i] = v.findall(text)
+
+        return dict((k, found[i]) for i, (k, _) in enumerate(self.fields))
+
+    def _scan_keywords(self, text: str, low: str, found: List[List[Any]]) -> None:
+        for idx in self.by_keyword.values():
+            for i in idx:
+                found[i] = []
+
+        # positions where a keyword starts, in order, each keyword at most once per position
+        positions: Dict[int, List[str]] = {}
+
+        for m in self.gate.finditer(low):  # type: ignore
+            pos = m.start()
+            kws = [kw for kw in self.by_first[low[pos]] if low.startswith(kw, pos)]
+            positions.setdefault(pos, []).extend(kws)
+            for kw in kws:
+                for offset, other in self.inner.get(kw, ()):
+                    if low.startswith(other, pos + offset):
+                        positions.setdefault(pos + offset, []).append(other)
+
+        ends = [-1] * len(self.fields)
+        for pos in sorted(positions):
+            for kw in set(positions[pos]):
+                for i in self.by_keyword[kw]:
+                    if pos < ends[i]:
+                        continue  # findall does not overlap matches
+                    v = self.fields[i][1]
+                    m = v.match(text, pos)
+                    if m is None:
+                        continue
+                    if m.end() == pos:
+                        ends[i] = pos + 1  # an empty match, findall moves on by one
+                    else:
+                        ends[i] = m.end()
+                    found[i].append(self._value(m, v.groups))
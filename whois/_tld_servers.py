@@ -0,0 +1,521 @@
+# generated by: python -m whois._make_tld_servers
+# do not edit, refresh it from a dump of the iana root zone database
+# sources: hint 328, known 85, none 97
+# (hint: _server in tld_regexpr.py, dump: iana dump, known: KNOWN_SERVERS, none: not known)
+# built without an iana dump
+
+VERSION = "2026-10-18"
+
+# tld_regexpr key -> whois server of the registry, None: not known
+SERVERS = {
+    "ac": "whois.nic.ac",  # known
+    "ac_jp": "whois.jprs.jp",  # known
+    "ac_th": "whois.thnic.co.th",  # hint
+    "ac_uk": "whois.nic.uk",  # known
+    "academy": "whois.donuts.co",  # hint
+    "accountants": "whois.donuts.co",  # hint
+    "actor": "whois.donuts.co",  # hint
+    "ad_jp": "whois.jprs.jp",  # known
+    "ae": None,  # none
+    "aero": "whois.aero",  # hint
+    "af": None,  # none
+    "ag": None,  # none
+    "agency": "whois.donuts.co",  # hint
+    "ai": "whois.nic.ai",  # known
+    "airforce": "whois.donuts.co",  # hint
+    "al": None,  # none
+    "am": None,  # none
+    "amsterdam": None,  # none
+    "apartments": "whois.donuts.co",  # hint
+    "app": "whois.nic.google",  # known
+    "ar": None,  # none
+    "army": "whois.donuts.co",  # hint
+    "art": "whois.centralnic.com",  # hint
+    "asia": "whois.nic.asia",  # known
+    "associates": "whois.donuts.co",  # hint
+    "at": "whois.nic.at",  # hint
+    "attorney": "whois.donuts.co",  # hint
+    "au": "whois.auda.org.au",  # known
+    "auction": "whois.donuts.co",  # hint
+    "auto": "whois.centralnic.com",  # hint
+    "autos": "whois.centralnic.com",  # hint
+    "aw": None,  # none
+    "ax": None,  # none
+    "az": None,  # none
+    "ba": None,  # none
+    "baby": "whois.centralnic.com",  # hint
+    "band": "whois.donuts.co",  # hint
+    "bank": None,  # none
+    "bar": "whois.centralnic.com",  # hint
+    "bargains": "whois.donuts.co",  # hint
+    "be": "whois.dns.be",  # known
+    "beauty": "whois.centralnic.com",  # hint
+    "best": "whois.centralnic.com",  # hint
+    "bet": "whois.nic.bet",  # hint
+    "bg": "whois.register.bg",  # hint
+    "bid": "whois.nic.bid",  # hint
+    "bike": "whois.donuts.co",  # hint
+    "bingo": "whois.donuts.co",  # hint
+    "biz": "whois.nic.biz",  # known
+    "bj": "whois.nic.bj",  # hint
+    "blog": "whois.centralnic.com",  # hint
+    "bo": None,  # none
+    "boats": "whois.centralnic.com",  # hint
+    "bond": "whois.centralnic.com",  # hint
+    "boutique": "whois.donuts.co",  # hint
+    "br": "whois.registro.br",  # known
+    "build": "whois.centralnic.com",  # hint
+    "builders": "whois.donuts.co",  # hint
+    "business": "whois.donuts.co",  # hint
+    "buzz": None,  # none
+    "by": "whois.cctld.by",  # known
+    "bzh": None,  # none
+    "ca": "whois.cira.ca",  # known
+    "ca_ug": "whois.co.ug",  # hint
+    "cab": "whois.donuts.co",  # hint
+    "cafe": "whois.donuts.co",  # hint
+    "cam": "whois.centralnic.com",  # hint
+    "camera": "whois.donuts.co",  # hint
+    "camp": "whois.donuts.co",  # hint
+    "capital": "whois.donuts.co",  # hint
+    "car": "whois.centralnic.com",  # hint
+    "cards": "whois.donuts.co",  # hint
+    "care": "whois.donuts.co",  # hint
+    "careers": "whois.donuts.co",  # hint
+    "cars": "whois.centralnic.com",  # hint
+    "casa": None,  # none
+    "cash": "whois.donuts.co",  # hint
+    "casino": "whois.donuts.co",  # hint
+    "cat": "whois.nic.cat",  # hint
+    "catering": "whois.donuts.co",  # hint
+    "cc": "ccwhois.verisign-grs.com",  # known
+    "cd": "whois.nic.cd",  # hint
+    "center": "whois.donuts.co",  # hint
+    "ceo": "whois.centralnic.com",  # hint
+    "cf": None,  # none
+    "cfd": "whois.centralnic.com",  # hint
+    "ch": "whois.nic.ch",  # known
+    "charity": "whois.donuts.co",  # hint
+    "chat": "whois.donuts.co",  # hint
+    "cheap": "whois.donuts.co",  # hint
+    "church": "whois.donuts.co",  # hint
+    "city": "whois.donuts.co",  # hint
+    "cl": "whois.nic.cl",  # known
+    "claims": "whois.donuts.co",  # hint
+    "cleaning": "whois.donuts.co",  # hint
+    "click": None,  # none
+    "clinic": "whois.donuts.co",  # hint
+    "clothing": "whois.donuts.co",  # hint
+    "cloud": "whois.nic.cloud",  # known
+    "club": None,  # none
+    "cn": "whois.cnnic.cn",  # known
+    "co": None,  # none
+    "co_il": "whois.isoc.org.il",  # known
+    "co_jp": "whois.jprs.jp",  # known
+    "co_ke": None,  # none
+    "co_th": "whois.thnic.co.th",  # hint
+    "co_ug": "whois.co.ug",  # hint
+    "coach": "whois.donuts.co",  # hint
+    "codes": "whois.donuts.co",  # hint
+    "coffee": "whois.donuts.co",  # hint
+    "college": "whois.centralnic.com",  # hint
+    "com": "whois.verisign-grs.com",  # known
+    "com_au": "whois.auda.org.au",  # known
+    "com_bo": None,  # none
+    "com_ec": None,  # none
+    "com_ly": "whois.nic.ly",  # hint
+    "com_np": None,  # none
+    "com_sg": None,  # none
+    "com_tr": None,  # none
+    "com_tw": "whois.twnic.net.tw",  # known
+    "com_zw": None,  # none
+    "community": "whois.donuts.co",  # hint
+    "company": "whois.donuts.co",  # hint
+    "computer": "whois.donuts.co",  # hint
+    "condos": "whois.donuts.co",  # hint
+    "construction": "whois.donuts.co",  # hint
+    "consulting": "whois.donuts.co",  # hint
+    "contact": "whois.donuts.co",  # hint
+    "contractors": "whois.donuts.co",  # hint
+    "cool": "whois.donuts.co",  # hint
+    "coop": "whois.centralnic.com",  # hint
+    "coupons": "whois.donuts.co",  # hint
+    "courses": None,  # none
+    "cr": None,  # none
+    "credit": "whois.donuts.co",  # hint
+    "creditcard": "whois.donuts.co",  # hint
+    "cruises": "whois.donuts.co",  # hint
+    "cw": None,  # none
+    "cyou": "whois.centralnic.com",  # hint
+    "cz": "whois.nic.cz",  # known
+    "dance": "whois.donuts.co",  # hint
+    "dating": "whois.donuts.co",  # hint
+    "de": "whois.denic.de",  # known
+    "dealer": "whois.centralnic.com",  # hint
+    "deals": "whois.donuts.co",  # hint
+    "degree": "whois.donuts.co",  # hint
+    "delivery": "whois.donuts.co",  # hint
+    "democrat": "whois.donuts.co",  # hint
+    "dental": "whois.donuts.co",  # hint
+    "dentist": "whois.donuts.co",  # hint
+    "desi": "whois.centralnic.com",  # hint
+    "design": None,  # none
+    "dev": "whois.nic.google",  # known
+    "diamonds": "whois.donuts.co",  # hint
+    "digital": "whois.donuts.co",  # hint
+    "direct": "whois.donuts.co",  # hint
+    "directory": "whois.donuts.co",  # hint
+    "discount": "whois.donuts.co",  # hint
+    "dk": "whois.punktum.dk",  # known
+    "doctor": "whois.donuts.co",  # hint
+    "dog": "whois.donuts.co",  # hint
+    "domains": "whois.donuts.co",  # hint
+    "download": None,  # none
+    "duckdns_org": "whois.publicinterestregistry.org",  # known
+    "ec": None,  # none
+    "ed_jp": "whois.jprs.jp",  # known
+    "edu": "whois.educause.edu",  # known
+    "edu_tr": None,  # none
+    "edu_ua": "whois.ua",  # known
+    "education": "whois.donuts.co",  # hint
+    "ee": "whois.tld.ee",  # known
+    "email": "whois.donuts.co",  # hint
+    "energy": "whois.donuts.co",  # hint
+    "engineer": "whois.donuts.co",  # hint
+    "engineering": "whois.donuts.co",  # hint
+    "enterprises": "whois.donuts.co",  # hint
+    "equipment": "whois.donuts.co",  # hint
+    "es": "whois.nic.es",  # known
+    "estate": "whois.donuts.co",  # hint
+    "eu": "whois.eu",  # known
+    "eus": None,  # none
+    "events": "whois.donuts.co",  # hint
+    "exchange": "whois.donuts.co",  # hint
+    "expert": "whois.donuts.co",  # hint
+    "exposed": "whois.donuts.co",  # hint
+    "express": "whois.donuts.co",  # hint
+    "fail": "whois.donuts.co",  # hint
+    "family": "whois.donuts.co",  # hint
+    "fan": "whois.donuts.co",  # hint
+    "fans": "whois.centralnic.com",  # hint
+    "farm": "whois.donuts.co",  # hint
+    "feedback": "whois.centralnic.com",  # hint
+    "fi": "whois.fi",  # known
+    "finance": "whois.donuts.co",  # hint
+    "financial": "whois.donuts.co",  # hint
+    "fish": "whois.donuts.co",  # hint
+    "fit": None,  # none
+    "fitness": "whois.donuts.co",  # hint
+    "flights": "whois.donuts.co",  # hint
+    "florist": "whois.donuts.co",  # hint
+    "fm": None,  # none
+    "football": "whois.donuts.co",  # hint
+    "forsale": "whois.donuts.co",  # hint
+    "forum": "whois.centralnic.com",  # hint
+    "foundation": "whois.donuts.co",  # hint
+    "fr": "whois.nic.fr",  # known
+    "frl": "whois.centralnic.com",  # hint
+    "fun": "whois.centralnic.com",  # hint
+    "fund": "whois.donuts.co",  # hint
+    "furniture": "whois.donuts.co",  # hint
+    "futbol": "whois.donuts.co",  # hint
+    "fyi": "whois.donuts.co",  # hint
+    "ga": None,  # none
+    "gallery": "whois.donuts.co",  # hint
+    "game": None,  # none
+    "games": "whois.donuts.co",  # hint
+    "ge": "whois.nic.ge",  # hint
+    "gent": "whois.centralnic.com",  # hint
+    "geo_jp": "whois.jprs.jp",  # known
+    "gifts": "whois.donuts.co",  # hint
+    "gives": "whois.donuts.co",  # hint
+    "glass": "whois.donuts.co",  # hint
+    "global_": None,  # none
+    "gmbh": "whois.donuts.co",  # hint
+    "go_jp": "whois.jprs.jp",  # known
+    "go_th": "whois.thnic.co.th",  # hint
+    "gob_ec": None,  # none
+    "gold": "whois.donuts.co",  # hint
+    "golf": "whois.donuts.co",  # hint
+    "gq": "whois.domino.gq",  # hint
+    "gr": None,  # none
+    "gr_jp": "whois.jprs.jp",  # known
+    "graphics": "whois.donuts.co",  # hint
+    "gratis": "whois.donuts.co",  # hint
+    "gripe": "whois.donuts.co",  # hint
+    "group": "whois.donuts.co",  # hint
+    "guide": "whois.donuts.co",  # hint
+    "guru": "whois.donuts.co",  # hint
+    "gy": None,  # none
+    "hair": "whois.centralnic.com",  # hint
+    "haus": "whois.donuts.co",  # hint
+    "healthcare": "whois.donuts.co",  # hint
+    "hk": "whois.hkirc.hk",  # known
+    "hn": None,  # none
+    "hockey": "whois.donuts.co",  # hint
+    "holdings": "whois.donuts.co",  # hint
+    "holiday": "whois.donuts.co",  # hint
+    "homes": "whois.centralnic.com",  # hint
+    "hopto_org": "whois.publicinterestregistry.org",  # known
+    "hospital": "whois.donuts.co",  # hint
+    "host": "whois.centralnic.com",  # hint
+    "house": "whois.donuts.co",  # hint
+    "hr": None,  # none
+    "hu": "whois.nic.hu",  # known
+    "icu": "whois.centralnic.com",  # hint
+    "id_": None,  # none
+    "ie": None,  # none
+    "im": None,  # none
+    "immo": "whois.donuts.co",  # hint
+    "immobilien": "whois.donuts.co",  # hint
+    "in_": "whois.registry.in",  # known
+    "in_th": "whois.thnic.co.th",  # hint
+    "inc": "whois.centralnic.com",  # hint
+    "industries": "whois.donuts.co",  # hint
+    "info": "whois.nic.info",  # known
+    "ink": None,  # none
+    "institute": "whois.donuts.co",  # hint
+    "insure": "whois.donuts.co",  # hint
+    "international": "whois.donuts.co",  # hint
+    "investments": "whois.donuts.co",  # hint
+    "io": "whois.nic.io",  # known
+    "ir": "whois.nic.ir",  # known
+    "irish": "whois.donuts.co",  # hint
+    "is_": "whois.isnic.is",  # known
+    "it": "whois.nic.it",  # known
+    "jetzt": "whois.donuts.co",  # hint
+    "jewelry": "whois.donuts.co",  # hint
+    "jp": "whois.jprs.jp",  # known
+    "kaufen": "whois.donuts.co",  # hint
+    "ke": None,  # none
+    "kitchen": "whois.donuts.co",  # hint
+    "kiwi": None,  # none
+    "kr": "whois.kr",  # known
+    "kred": "whois.centralnic.com",  # hint
+    "kz": "whois.nic.kz",  # known
+    "la": None,  # none
+    "land": "whois.donuts.co",  # hint
+    "lawyer": "whois.donuts.co",  # hint
+    "lease": "whois.donuts.co",  # hint
+    "legal": "whois.donuts.co",  # hint
+    "lg_jp": "whois.jprs.jp",  # known
+    "li": "whois.nic.li",  # known
+    "life": "whois.donuts.co",  # hint
+    "lighting": "whois.donuts.co",  # hint
+    "limited": "whois.donuts.co",  # hint
+    "limo": "whois.donuts.co",  # hint
+    "link": None,  # none
+    "live": "whois.donuts.co",  # hint
+    "loans": "whois.donuts.co",  # hint
+    "lol": None,  # none
+    "london": "whois.centralnic.com",  # hint
+    "love": None,  # none
+    "lt": "whois.domreg.lt",  # known
+    "ltd": "whois.donuts.co",  # hint
+    "luxury": "whois.centralnic.com",  # hint
+    "lv": "whois.nic.lv",  # known
+    "ly": "whois.nic.ly",  # hint
+    "ma": "whois.registre.ma",  # hint
+    "maison": "whois.donuts.co",  # hint
+    "makeup": "whois.centralnic.com",  # hint
+    "management": "whois.donuts.co",  # hint
+    "market": "whois.donuts.co",  # hint
+    "marketing": "whois.donuts.co",  # hint
+    "mba": "whois.donuts.co",  # hint
+    "me": "whois.nic.me",  # known
+    "media": "whois.donuts.co",  # hint
+    "memorial": "whois.donuts.co",  # hint
+    "mg": None,  # none
+    "ml": None,  # none
+    "mobi": "whois.nic.mobi",  # known
+    "moda": "whois.donuts.co",  # hint
+    "moe": None,  # none
+    "money": "whois.donuts.co",  # hint
+    "monster": "whois.centralnic.com",  # hint
+    "mortgage": "whois.donuts.co",  # hint
+    "motorcycles": "whois.centralnic.com",  # hint
+    "movie": "whois.donuts.co",  # hint
+    "mp": None,  # none
+    "mu": None,  # none
+    "mx": "whois.mx",  # known
+    "my": None,  # none
+    "name": "whois.nic.name",  # known
+    "navy": "whois.donuts.co",  # hint
+    "nc": None,  # none
+    "ne_jp": "whois.jprs.jp",  # known
+    "net": "whois.verisign-grs.com",  # known
+    "network": "whois.donuts.co",  # hint
+    "news": "whois.donuts.co",  # hint
+    "ng": "whois.nic.net.ng",  # hint
+    "ninja": "whois.donuts.co",  # hint
+    "nl": "whois.domain-registry.nl",  # known
+    "no": "whois.norid.no",  # known
+    "np": None,  # none
+    "nu": "whois.iis.nu",  # known
+    "nyc": None,  # none
+    "nz": None,  # none
+    "ong": None,  # none
+    "onion": None,  # none
+    "online": "whois.centralnic.com",  # hint
+    "ooo": "whois.centralnic.com",  # hint
+    "or_jp": "whois.jprs.jp",  # known
+    "org": "whois.publicinterestregistry.org",  # known
+    "org_tr": None,  # none
+    "org_zw": None,  # none
+    "ovh": None,  # none
+    "partners": "whois.donuts.co",  # hint
+    "parts": "whois.donuts.co",  # hint
+    "pe": None,  # none
+    "pet": "whois.donuts.co",  # hint
+    "pharmacy": None,  # none
+    "photography": "whois.donuts.co",  # hint
+    "photos": "whois.donuts.co",  # hint
+    "pics": None,  # none
+    "pictures": "whois.donuts.co",  # hint
+    "pizza": "whois.donuts.co",  # hint
+    "pk": None,  # none
+    "pl": "whois.dns.pl",  # known
+    "place": "whois.donuts.co",  # hint
+    "plumbing": "whois.donuts.co",  # hint
+    "plus": "whois.donuts.co",  # hint
+    "press": "whois.centralnic.com",  # hint
+    "pro": "whois.nic.pro",  # known
+    "productions": "whois.donuts.co",  # hint
+    "properties": "whois.donuts.co",  # hint
+    "protection": "whois.centralnic.com",  # hint
+    "pt": "whois.dns.pt",  # known
+    "pub": "whois.donuts.co",  # hint
+    "pw": None,  # none
+    "qpon": "whois.centralnic.com",  # hint
+    "quest": "whois.centralnic.com",  # hint
+    "re": "whois.nic.re",  # known
+    "recipes": "whois.donuts.co",  # hint
+    "red": None,  # none
+    "rehab": "whois.donuts.co",  # hint
+    "reise": "whois.donuts.co",  # hint
+    "reisen": "whois.donuts.co",  # hint
+    "reit": "whois.centralnic.com",  # hint
+    "rent": "whois.centralnic.com",  # hint
+    "rentals": "whois.donuts.co",  # hint
+    "repair": "whois.donuts.co",  # hint
+    "report": "whois.donuts.co",  # hint
+    "republican": "whois.donuts.co",  # hint
+    "rest": "whois.centralnic.com",  # hint
+    "restaurant": "whois.donuts.co",  # hint
+    "reviews": "whois.donuts.co",  # hint
+    "rip": "whois.donuts.co",  # hint
+    "ro": "whois.rotld.ro",  # known
+    "rocks": "whois.donuts.co",  # hint
+    "rs": None,  # none
+    "ru": "whois.tcinet.ru",  # known
+    "ru_rf": "whois.tcinet.ru",  # known
+    "run": "whois.donuts.co",  # hint
+    "rw": None,  # none
+    "sa": None,  # none
+    "saarland": "whois.centralnic.com",  # hint
+    "sale": "whois.donuts.co",  # hint
+    "salon": "whois.donuts.co",  # hint
+    "sarl": "whois.donuts.co",  # hint
+    "sbs": "whois.centralnic.com",  # hint
+    "school": "whois.donuts.co",  # hint
+    "schule": "whois.donuts.co",  # hint
+    "se": "whois.iis.se",  # known
+    "security": "whois.centralnic.com",  # hint
+    "services": "whois.donuts.co",  # hint
+    "sg": "whois.sgnic.sg",  # hint
+    "sh": "whois.nic.sh",  # known
+    "shoes": "whois.donuts.co",  # hint
+    "shop": "whois.nic.shop",  # known
+    "shopping": "whois.donuts.co",  # hint
+    "show": "whois.donuts.co",  # hint
+    "singles": "whois.donuts.co",  # hint
+    "site": "whois.centralnic.com",  # hint
+    "sk": "whois.sk-nic.sk",  # known
+    "skin": "whois.centralnic.com",  # hint
+    "soccer": "whois.donuts.co",  # hint
+    "social": "whois.donuts.co",  # hint
+    "software": "whois.donuts.co",  # hint
+    "solar": "whois.donuts.co",  # hint
+    "solutions": "whois.donuts.co",  # hint
+    "space": "whois.centralnic.com",  # hint
+    "sr": None,  # none
+    "srl": "whois.afilias-srs.net",  # hint
+    "storage": "whois.centralnic.com",  # hint
+    "store": "whois.centralnic.com",  # hint
+    "studio": "whois.donuts.co",  # hint
+    "study": None,  # none
+    "style": "whois.donuts.co",  # hint
+    "su": "whois.tcinet.ru",  # known
+    "supplies": "whois.donuts.co",  # hint
+    "supply": "whois.donuts.co",  # hint
+    "support": "whois.donuts.co",  # hint
+    "surgery": "whois.donuts.co",  # hint
+    "systems": "whois.donuts.co",  # hint
+    "tax": "whois.donuts.co",  # hint
+    "taxi": "whois.donuts.co",  # hint
+    "td": "whois.nic.td",  # hint
+    "team": "whois.donuts.co",  # hint
+    "tech": "whois.centralnic.com",  # hint
+    "technology": "whois.donuts.co",  # hint
+    "tel": "whois.nic.tel",  # known
+    "tennis": "whois.donuts.co",  # hint
+    "theater": "whois.donuts.co",  # hint
+    "theatre": "whois.centralnic.com",  # hint
+    "tickets": "whois.centralnic.com",  # hint
+    "tienda": "whois.donuts.co",  # hint
+    "tips": "whois.donuts.co",  # hint
+    "tires": "whois.donuts.co",  # hint
+    "tk": None,  # none
+    "tn": None,  # none
+    "to": None,  # none
+    "today": "whois.donuts.co",  # hint
+    "tools": "whois.donuts.co",  # hint
+    "top": "whois.nic.top",  # known
+    "tours": "whois.donuts.co",  # hint
+    "town": "whois.donuts.co",  # hint
+    "toys": "whois.donuts.co",  # hint
+    "trade": None,  # none
+    "training": "whois.donuts.co",  # hint
+    "travel": "whois.donuts.co",  # hint
+    "tv": None,  # none
+    "tw": "whois.twnic.net.tw",  # known
+    "tz": None,  # none
+    "ua": "whois.ua",  # known
+    "ug": "whois.co.ug",  # hint
+    "uk": "whois.nic.uk",  # known
+    "university": "whois.donuts.co",  # hint
+    "uno": "whois.centralnic.com",  # hint
+    "us": "whois.nic.us",  # known
+    "uy": None,  # none
+    "uz": None,  # none
+    "va": None,  # none
+    "vacations": "whois.donuts.co",  # hint
+    "ventures": "whois.donuts.co",  # hint
+    "vet": "whois.donuts.co",  # hint
+    "viajes": "whois.donuts.co",  # hint
+    "video": "whois.donuts.co",  # hint
+    "villas": "whois.donuts.co",  # hint
+    "vin": "whois.donuts.co",  # hint
+    "vip": "whois.nic.vip",  # hint
+    "vision": "whois.donuts.co",  # hint
+    "vn": None,  # none
+    "voyage": "whois.donuts.co",  # hint
+    "vu": None,  # none
+    "watch": "whois.donuts.co",  # hint
+    "website": "whois.centralnic.com",  # hint
+    "wiki": None,  # none
+    "win": None,  # none
+    "wine": "whois.donuts.co",  # hint
+    "work": None,  # none
+    "works": "whois.donuts.co",  # hint
+    "world": "whois.donuts.co",  # hint
+    "ws": "whois.website.ws",  # known
+    "wtf": "whois.donuts.co",  # hint
+    "xin": "whois.nic.xin",  # hint
+    "xyz": "whois.centralnic.com",  # hint
+    "yachts": "whois.centralnic.com",  # hint
+    "za": None,  # none
+    "zone": "whois.donuts.co",  # hint
+    "zuerich": "whois.centralnic.com",  # hint
+    "zw": None,  # none
+}
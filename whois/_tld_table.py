@@ -0,0 +1,2167 @@
+# generated by: python -m whois._make_tld_table
+# do not edit, change tld_regexpr.py and generate again
+
+SOURCE_HASH = "c800e88174d3184b2d67e7df59f9b2cfabf0c156"
+
+PATTERNS = (
+    "Domain Name:\\s+(.+)",
+    "Registrar:\\s+(.+)",
+    "Domain Status:\\s(.+)",
+    "Name Server:\\s+(.+)",
+    "Updated Date:\\s+(.+)",
+    "Creation Date:\\s+(.+)",
+    ":Registry Expiry Date\\s+(.+)",
+    "\\[Domain Name\\]\\s?(.+)",
+    "\\[ (.+) database provides information on network administration. Its use is    \\]",
+    "\\[Registrant\\]\\s?(.+)",
+    "\\[Registered Date\\]\\s?(.+)",
+    "\\[Last Update\\]\\s?(.+)",
+    "\\[Name Server\\]\\s*(.+)",
+    "\\[State\\]\\s?(.+)",
+    "[\\w.-]+@[\\w.-]+\\.[\\w]{2,4}",
+    "Domain Name:\\s?(.+)",
+    "Registrar:\\s?(.+)",
+    "Domain Holder Organization:\\s?(.+)",
+    "Domain Holder Country:\\s?(.+)",
+    "Created date:\\s?(.+)",
+    "Exp date:\\s?(.+)",
+    "Updated date:\\s?(.+)",
+    "Name Server:\\s*(.+)\\s*",
+    "Status:\\s?(.+)",
+    "Registrar IANA ID:\\s?(.+)",
+    "Registrar Abuse Contact Email:\\s*(.+)\\s*",
+    "Domain:\\n\\s?(.+)",
+    "Registered By:\\n\\s?(.+)",
+    "Registered Contact:\\n\\s*(.+)",
+    "Registrant Country:\\s?(.+)",
+    "Entry created:\\n\\s?(.+)",
+    "Renewal date:\\n\\s*(.+)",
+    "Entry updated:\\n\\s*(.+)",
+    "Servers:\\s*(.+)\\t\\n\\s*(.+)\\t\\n",
+    "Registration status:\\n\\s*(.+)",
+    "Domain Owner:\\n\\s?(.+)",
+    "Registrant Organization:\\s?(.+)",
+    "Creation Date:\\s?(.+)",
+    "Registry Expiry Date:\\s?(.+)",
+    "Updated Date:\\s?(.+)",
+    "Domain Status:\\s?(.+)",
+    "Registrar Name:\\s+(.+)",
+    "Registrant\\s*Organi(?:s|z)ation:\\s?(.+)",
+    "Status:\\s(.+)",
+    "Registrant\\s+Country:\\s+(.+)",
+    "Domain name:\\s+(.+)",
+    "Registrant:\\s+(.+)",
+    "Registrant:\\n.+\\n.+\\n.+\\n\\s+(.+)",
+    "Registered:\\s+(.+)",
+    "Expires:\\s+(.+)",
+    "Last modified:\\s+(.+)",
+    "DNS servers.*:\\n(?:\\s+(\\S+)\\n)(?:\\s+(\\S+)\\n)?(?:\\s+(\\S+)\\n)?(?:\\s+(\\S+)\\n)\\n?",
+    "Registrar:\\s*(.+)",
+    "domain\\s*:\\s?(.+)",
+    "registrar:\\s?(.+)",
+    "registered:\\s?(.+)",
+    "expire:\\s?(.+)",
+    "changed\\s*:\\s?(.+)",
+    "nserver:\\s*(.+)\\s*",
+    "domain:\\s?(.+)",
+    "registrant:\\s?(.+)",
+    "changed:\\s?(.+)",
+    "nserver:\\s*(.+)",
+    "Registrar Name:\\s?(.+)",
+    "Last Modified:\\s?(.+)",
+    "Domain name:\\s?(.+)",
+    "(?x:\n            Domain\\ nameservers:[ \\t]*\\n\n            (?:[ \\t]+) (\\S+) (?:[ \\t]+\\S+)? \\n       # ns1.tld.nl [A?]\n            (?:(?:[ \\t]+) (\\S+) (?:[ \\t]+\\S+)? \\n)?  # opt-ns2.tld.nl [A?]\n            (?:(?:[ \\t]+) (\\S+) (?:[ \\t]+\\S+)? \\n)?  # opt-ns2.tld.nl [AAAA?]\n            (?:(?:[ \\t]+) (\\S+) (?:[ \\t]+\\S+)? \\n)?  # opt-ns3.tld.nl [A?]\n            (?:(?:[ \\t]+) (\\S+) (?:[ \\t]+\\S+)? \\n)?  # opt-ns3.tld.nl [AAAA?]\n            (?:(?:[ \\t]+) (\\S+) (?:[ \\t]+\\S+)? \\n)?  # opt-ns4.tld.nl [A?]\n            (?:(?:[ \\t]+) (\\S+) (?:[ \\t]+\\S+)? \\n)?  # opt-ns4.tld.nl [AAAA?]\n            (?:(?:[ \\t]+) (\\S+) (?:[ \\t]+\\S+)? \\n)?  # opt-ns5.tld.nl [A?]\n            (?:(?:[ \\t]+) (\\S+) (?:[ \\t]+\\S+)? \\n)?  # opt-ns5.tld.nl [AAAA?]\n            # Don't check for final LF; there might be even more records..\n        )",
+    "Reseller:\\s?(.+)",
+    "Abuse Contact:\\s?(.+)",
+    "domain...............:\\s?(.+)",
+    "registrar............:\\s?(.+)",
+    "created..............:\\s?(.+)",
+    "expires..............:\\s?(.+)",
+    "Information Updated:\\s?(.+)",
+    "\\nDomain:\\s*(.+)",
+    "Company Name:\\n?(.+)",
+    "Registrant:\\n\\s*(.+)",
+    "Registered:\\s*(.+)\\n",
+    "\\noption expiration date:\\s*(.+)\\n",
+    "\\nlast modified:\\s*(.+)\\n",
+    "\\nnameservers:\\s*(.+)\\n\\s*(.+)\\n",
+    "DOMAIN\\s+NAME:\\s+(.+)",
+    "registration\\s+status:\\s(.+)",
+    "NAME SERVER INFORMATION:\\n(?:(.+)\\n)(?:(.+)\\n)?(?:(.+)\\n)?(?:(.+)\\n)?",
+    "\\s*NOMBRE DE DOMINIO:\\s+(.+)",
+    "Pa\u00eds:\\s+(.+)",
+    "Fecha de activaci\u00f3n:\\s+(.+)",
+    "Fecha de corte:\\s+(.+)",
+    "nic.br",
+    "created:\\s?(.+)",
+    "expires:\\s?(.+)",
+    "status:\\s?(.+)",
+    "owner:\\s?(.+)",
+    "Domain Name:\\s*(.+)",
+    "\\nRegistrar:\\s*(.+)",
+    "\\nOrg:\\s*(.+)",
+    "\\nCountry:\\s*(.+)",
+    "\\nCreation Date:\\s*(.+)",
+    "\\nExpiration Date:\\s*(.+)",
+    "\\nUpdated Date:\\s*(.+)",
+    "\\nName Server:\\s*(.+)",
+    "Registrant Organization:\\s*(.+)",
+    "Registrant Country:\\s*(.*)",
+    "Creation Date:\\s*(.*)",
+    "Registry Expiry Date:\\s*(.*)",
+    "Updated Date:\\s*(.*)",
+    "Name Server:\\s*(.*)",
+    "Domain Status:\\s*(.*)",
+    "Registered On:\\s+(.+)",
+    "Expires On:\\s+(.+)",
+    "Status:\\s+(.+)",
+    "Nameserver:\\s+(.+)",
+    "Registrant Country:\\s+(.+)",
+    "Renewed On:\\s+(.+)",
+    "Domain Nameservers:\\n(?:(.+)\\n)(?:(.+)\\n)?(?:(.+)\\n)?(?:(.+)\\n)?",
+    "Record maintained by:\\s+(.+)",
+    "Domain registered:\\s?(.+)",
+    "Record will expire:\\s?(.+)",
+    "nic.cl",
+    "Expiration Date:\\s?(.+)",
+    "Sponsoring Registrar:\\s?(.+)",
+    "Registrant:\\s?(.+)",
+    "Registration Time:\\s?(.+)",
+    "Expiration Time:\\s?(.+)",
+    "domain:\\s*(.+)",
+    "registrar name:\\s*(.+)",
+    "validity:\\s*(.+)",
+    "status:\\s*(.+)",
+    "Registrant:\\n\\n\\s?Name:\\s?(.+)",
+    "Modified Date:\\s?(.+)",
+    "Name Servers:\\s*(.+)\\s*",
+    "\\*\\* Domain Name:\\s?(.+)",
+    "Organization Name\\s+:\\s?(.+)",
+    "\\*\\* Registrant:\\s+?(.+)",
+    "Created on..............:\\s?(.+).",
+    "Expires on..............:\\s?(.+).",
+    "",
+    "\\*\\* Domain Servers:\\n(?:(\\S+)\\n)(?:(\\S+)\\n)?(?:(\\S+)\\n)?(?:(\\S+)\\n)?(?:(\\S+)\\n)?(?:(\\S+)\\n)\\n?",
+    "nserver:\\s*(.+) ",
+    "\\ndomain:\\s*(.+)",
+    "\\nChanged:\\s?(.+)",
+    "Nserver:\\s*(.+)",
+    "Domain:\\s?(.+)",
+    "Registrant\\s*Handle:\\s*\\w*\\s*Name:\\s?(.+)",
+    "Country:\\s?(.+)",
+    "Registered:\\s?(.+)",
+    "Expires:\\s?(.+)",
+    "Hostname:\\s*(.+)\\s*",
+    "Name Server:\\s*(.+)\\r",
+    "Domain Status:\\s*([a-zA-z]+)",
+    "Registrant:\\s*(.+)",
+    "Domain record activated:\\s?(.+)",
+    "Domain expires:\\s?(.+)",
+    "Domain record last updated:\\s?(.+)",
+    "Name Servers:\\s?\\t(.+)\\n\\t(.+)\\n",
+    "\\nregistrar:\\s*(.+)",
+    "\\ncountry:\\s*(.+)",
+    "\\ncreated:\\s+0-UANIC\\s+(.+)",
+    "\\nexpires:\\s*(.+)",
+    "\\nmodified:\\s*(.+)",
+    "\\nnserver:\\s*(.+)",
+    "\\nstatus:\\s*(.+)",
+    "Domain:\\nname:\\s+(.+\\.ee)\\n",
+    "Registrar:\\nname:\\s+(.+)\\n",
+    "Registrant:\\nname:\\s+(.+)\\n",
+    "Registrant:(?:\\n+.+\\n*)*country:\\s+(.+)\\n",
+    "Domain:(?:\\n+.+\\n*)*registered:\\s+(.+)\\n",
+    "Domain:(?:\\n+.+\\n*)*expire:\\s+(.+)\\n",
+    "Domain:(?:\\n+.+\\n*)*changed:\\s+(.+)\\n",
+    "Domain:(?:\\n+.+\\n*)*status:\\s+(.+)\\n",
+    "Name:\\s?(.+)",
+    "Name servers:\\n(?:\\s+(\\S+)\\n)(?:\\s+(\\S+)\\n)?(?:\\s+(\\S+)\\n)?(?:\\s+(\\S+)\\n)?(?:\\s+(\\S+)\\n)?(?:\\s+(\\S+)\\n)\\n?",
+    "domain\\.+:\\s?(.+)",
+    "registrar\\.+:\\s?(.+)",
+    "created\\.+:\\s?(.+)",
+    "expires\\.+:\\s?(.+)",
+    "modified\\.+:\\s?(.+)",
+    "nserver\\.+:\\s*(.+)",
+    "status\\.+:\\s?(.+)",
+    "registrar:\\s*(.+)",
+    "contact:\\s?(.+)",
+    "Expiry Date:\\s?(.+)",
+    "last-update:\\s?(.+)",
+    "Name Server: (.+)",
+    "Domain name:\\s*([^(i|\\n)]+)",
+    "(?<=Owner contact:\\s)[\\s\\S]*?Organization:(.*)",
+    "(?<=Owner contact:\\s)[\\s\\S]*?Name:(.*)",
+    "(?<=Owner contact:\\s)[\\s\\S]*?Country:(.*)",
+    "Domain registered: *(.+)",
+    "Record will expire on: *(.+)",
+    "Domain Nameservers:\\s*(.+)\\n\\s*(.+)\\n",
+    "Company English Name.*:\\s?(.+)",
+    "Domain Name Commencement Date:\\s?(.+)",
+    "Name Servers Information:\\n\\n(?:(\\S+)\\n)(?:(\\S+)\\n)(?:(\\S+)\\n)?(?:(\\S+)\\n)?\\n?",
+    "Sponsoring Registrar Organization:\\s?(.+)",
+    "Created On:\\s?(.+)",
+    "Last Updated On:\\s?(.+)$",
+    "Name Server:(.+)",
+    "\\nRegistry Expiry Date:\\s?(.+)",
+    "nic.ir",
+    "expire-date:\\s?(.+)",
+    "last-updated:\\s?(.+)",
+    "nserver:\\s?(.+)",
+    "Registrar\\s*Organization:\\s*(.+)",
+    "Registrant\\s*Organization:\\s*(.+)",
+    "Created:\\s?(.+)",
+    "Expire Date:\\s?(.+)",
+    "Last Update:\\s?(.+)",
+    "Nameservers\\s?(.+)\\s?(.+)\\s?(.+)\\s?(.+)",
+    "\\[Created on\\]\\s?(.+)",
+    "\\[Expires on\\]\\s?(.+)",
+    "\\[Last Updated\\]\\s?(.+)",
+    "\\[Status\\]\\s?(.+)",
+    "Domain Name\\s*:\\s?(.+)",
+    "Authorized Agency\\s*:\\s*(.+)",
+    "Registrant\\s*:\\s*(.+)",
+    "Registered Date\\s*:\\s?(.+)",
+    "Expiration Date\\s*:\\s?(.+)",
+    "Last Updated Date\\s*:\\s?(.+)",
+    "status\\s*:\\s?(.+)",
+    "Domain name\\.+:\\s(.+)",
+    "Current Registar:\\s(.+)",
+    "Country\\.+:\\s?(.+)",
+    "Domain created:\\s(.+)",
+    "Last modified :\\s(.+)",
+    "server.*:\\s(.+)",
+    "Domain status :\\s?(.+)",
+    "Nameserver:\\s*(.+)\\s*",
+    "\\nStatus:\\s?(.+)",
+    "\\npaid-till:\\s*(.+)",
+    "Changed:\\s*(.+)\\n",
+    "Sponsoring Registrar:\\s*(.+)",
+    "Domain Create Date:\\s?(.+)",
+    "Domain Expiration Date:\\s?(.+)",
+    "Domain Last Updated Date:\\s?(.+)",
+    "Nameservers:\\s?(.+)",
+    "\\nUpdated Date:\\s?(.+)",
+    "Last Updated On:\\s?(.+)",
+    "\\sDNS:\\s*(.+)",
+    "Domain\\s*:\\s(.+)",
+    "Registrar\\s*:\\s(.+)",
+    "Registrant name\\s*:\\s(.+)",
+    "Created on\\s*:\\s(.*)",
+    "Expires on\\s*:\\s(.*)",
+    "Last updated on\\s*:\\s(.*)",
+    "Domain server [0-9]{1,}\\s*:\\s(.*)",
+    "Domain Name\\.+:\\s?(.+)",
+    "Registrar Handle\\.+:\\s?(.+)",
+    "Last Updated:\\s?(.+)",
+    "Name Server Handle\\.+:\\s*(.+)\\s*",
+    "modified:\\s?(.+)",
+    "domain_name:\\s?(.+)",
+    "registrar_name:\\s?(.+)",
+    "registrant_contact_name:\\s?(.+)",
+    "domain_dateregistered:\\s?(.+)",
+    "domain_datebilleduntil:\\s?(.+)",
+    "domain_datelastmodified:\\s?(.+)",
+    "ns_name_[0-9]{2}:\\s?(.+)",
+    "query_status:\\s?(.+)",
+    "\\nLast Updated On:\\s?(.+)",
+    "Name Server:\\s?(.+)\\s*",
+    "Registrant Name:\\s?(.+)",
+    "Admin Name:\\s?(.+)",
+    "\\nREGISTRAR:\\s*(.+)\\n",
+    "\\ncreated:\\s*(.+)\\n",
+    "\\nStatus:\\n\\s*(.+)",
+    "Name Server:\\s*(.+)",
+    "domain:\\s+(.+)",
+    "status:\\s+(.+)",
+    "registrar:\\s+(.+)",
+    "nserver:\\s+(.+)",
+    "created:\\s+(.+)",
+    "Expiry Date:\\s+(.+)",
+    "last-update:\\s+(.+)",
+    "\\s+Domain name:\\s+(.+)",
+    "\\s+Registrar:\\s+(.+)",
+    "\\s+Registered On:\\s+(.+)",
+    "\\s+Expires On:\\s+(.+)",
+    "\\s+Domain Status:\\s(.+)",
+    "\\s+NameServer:\\s+(.+)",
+    "Domain status:\\s(.+)",
+    "Registration date:\\s+(.+)",
+    ":Expiration date\\s+(.+)",
+    "Modification date:\\s+(.+)",
+    "DNS:\\s+(.+)",
+    "\\ncreated:\\s*(.+)",
+    "\\nstate:\\s*(.+)",
+    "Domain Name:\\s*(.+\\.sa)\\s",
+    "Registrant:\\n*(.+)\\n",
+    "Name Servers:\\s*(.+)\\s*(.+)?",
+    "\\s+Creation Date:\\s+(.+)",
+    ":\\s+Expiration Date\\s+(.+)",
+    "\\s+Modified Date:\\s+(.+)",
+    "\\nRegistrant Organization:\\s?(.+)",
+    "\\nRegistry Expiry Date:\\s*(.+)",
+    "\\nDomain Status:\\s?(.+)",
+    "Contact:\\s?(.+)",
+    "Country Code:\\s?(.+)\\nRegistrar:",
+    "Valid Until:\\s?(.+)",
+    "Updated:\\s?(.+)",
+    "Nameserver:\\s*(.+)\\r",
+    "Domain name\\.+:(.+)\\s*",
+    "Registrar\\.+:(.+)\\s*",
+    "Owner Contact\\n+Name\\.+:\\s?(.+)",
+    "Owner Contact\\n(?:.+\\n)+Country\\.+:\\s(.+)",
+    "Creation date\\.+:\\s?(.+)",
+    "DNS servers\\s?Name\\.+:\\s?(.+)\\s*Name\\.+:\\s?(.+)?",
+    "Domain status\\.+:(.+)",
+    "\\s+Record created on\\s+(.+)",
+    "\\s+Record expires on\\s+(.+)",
+    "\\s+Domain Status:\\s+(.+)",
+    "Registration\\s+Service\\s+Provider:\\s+(.+)",
+    "\\nregistrar:\\s?(.+)",
+    "\\nregistrant:\\s*(.+)",
+    "\\nchanged:\\s*(.+)",
+    "\\ncreated:\\s+(.+)",
+    "Registered on:\\s*(.+)",
+    "Expiry date:\\s*(.+)",
+    "Last updated:\\s*(.+)",
+    "Registrar Registration Expiration Date:\\s+(.+)",
+)
+
+# the distinct flattened tables: (field, index in PATTERNS or meta value) pairs
+TABLES = (
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", None),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+    ),
+    (
+        ("domain_name", 7),
+        ("registrar", 8),
+        ("registrant", 9),
+        ("registrant_country", None),
+        ("creation_date", 10),
+        ("expiration_date", None),
+        ("updated_date", 11),
+        ("name_servers", 12),
+        ("status", 13),
+        ("emails", 14),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 17),
+        ("registrant_country", 18),
+        ("creation_date", 19),
+        ("expiration_date", 20),
+        ("updated_date", 21),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("_server", "whois.thnic.co.th"),
+    ),
+    (
+        ("domain_name", 26),
+        ("registrar", 27),
+        ("registrant", 28),
+        ("registrant_country", 29),
+        ("creation_date", 30),
+        ("expiration_date", 31),
+        ("updated_date", 32),
+        ("name_servers", 33),
+        ("status", 34),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("owner", 35),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 36),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 40),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("_server", "whois.donuts.co"),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 41),
+        ("registrant", 42),
+        ("registrant_country", None),
+        ("creation_date", None),
+        ("expiration_date", None),
+        ("updated_date", None),
+        ("name_servers", 3),
+        ("status", 43),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", 44),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+        ("_server", "whois.aero"),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("_privateRegistry", True),
+    ),
+    (
+        ("domain_name", 45),
+        ("status", 43),
+        ("registrar", 1),
+        ("registrant", 46),
+        ("registrant_country", 47),
+        ("creation_date", 48),
+        ("expiration_date", 49),
+        ("updated_date", 50),
+        ("name_servers", 51),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 52),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 40),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 53),
+        ("registrar", 54),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 55),
+        ("expiration_date", 56),
+        ("updated_date", 57),
+        ("name_servers", 58),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 52),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 40),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("_server", "whois.centralnic.com"),
+    ),
+    (
+        ("domain_name", 59),
+        ("registrar", 54),
+        ("registrant", 60),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 61),
+        ("name_servers", 62),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("_server", "whois.nic.at"),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 63),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 64),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 65),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", None),
+        ("creation_date", 37),
+        ("expiration_date", None),
+        ("updated_date", 39),
+        ("name_servers", 66),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("reseller", 67),
+        ("abuse_contact", 68),
+    ),
+    (
+        ("domain_name", 69),
+        ("registrar", 70),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 71),
+        ("expiration_date", 72),
+        ("updated_date", 73),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 52),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 74),
+        ("registrar", 75),
+        ("registrant", 76),
+        ("registrant_country", 29),
+        ("creation_date", 77),
+        ("expiration_date", 78),
+        ("updated_date", 79),
+        ("name_servers", 80),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", None),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+        ("_server", "whois.nic.bet"),
+    ),
+    (
+        ("_server", "whois.register.bg"),
+        ("domain_name", 81),
+        ("status", 82),
+        ("name_servers", 83),
+        ("creation_date", None),
+        ("expiration_date", None),
+        ("updated_date", None),
+        ("registrar", None),
+        ("registrant_country", None),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", None),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+        ("_server", "whois.nic.bid"),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 36),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", None),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 52),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("_server", "whois.nic.bj"),
+    ),
+    (
+        ("domain_name", 84),
+        ("registrant_country", 85),
+        ("creation_date", 86),
+        ("expiration_date", 87),
+        ("registrar", None),
+        ("status", None),
+        ("name_servers", None),
+        ("updated_date", None),
+    ),
+    (
+        ("domain_name", 59),
+        ("registrar", 88),
+        ("registrant", None),
+        ("registrant_country", 29),
+        ("creation_date", 89),
+        ("expiration_date", 90),
+        ("updated_date", 61),
+        ("name_servers", 62),
+        ("status", 91),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("owner", 92),
+    ),
+    (
+        ("domain_name", 93),
+        ("registrar", 94),
+        ("registrant", 95),
+        ("registrant_country", 96),
+        ("creation_date", 97),
+        ("expiration_date", 98),
+        ("updated_date", 99),
+        ("name_servers", 100),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 93),
+        ("registrar", 52),
+        ("registrant", 101),
+        ("registrant_country", 102),
+        ("creation_date", 103),
+        ("expiration_date", 104),
+        ("updated_date", 105),
+        ("name_servers", 106),
+        ("status", 107),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("_server", "whois.co.ug"),
+        ("domain_name", 45),
+        ("creation_date", 108),
+        ("expiration_date", 109),
+        ("status", 110),
+        ("name_servers", 111),
+        ("registrant_country", 112),
+        ("updated_date", 113),
+        ("registrar", None),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", 112),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("_server", "whois.nic.cat"),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", 44),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+        ("_server", "whois.nic.cd"),
+    ),
+    (
+        ("domain_name", None),
+        ("name_servers", 114),
+        ("registrar", 115),
+        ("creation_date", 116),
+        ("expiration_date", 117),
+        ("updated_date", None),
+        ("registrant_country", None),
+        ("_slowdown", 5),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 118),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 119),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 120),
+        ("registrant", 121),
+        ("registrant_country", 29),
+        ("creation_date", 122),
+        ("expiration_date", 123),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 36),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 124),
+        ("registrar", 125),
+        ("registrant", None),
+        ("registrant_country", None),
+        ("creation_date", None),
+        ("expiration_date", 126),
+        ("updated_date", None),
+        ("name_servers", 62),
+        ("status", 127),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", 44),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+        ("_server", "whois.nic.ly"),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 128),
+        ("registrant_country", None),
+        ("creation_date", 37),
+        ("expiration_date", 119),
+        ("updated_date", 129),
+        ("name_servers", 130),
+        ("status", None),
+        ("emails", 14),
+    ),
+    (
+        ("domain_name", 131),
+        ("registrar", 132),
+        ("registrant", 133),
+        ("registrant_country", None),
+        ("creation_date", 134),
+        ("expiration_date", 135),
+        ("updated_date", 136),
+        ("name_servers", 137),
+        ("status", None),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("_server", "tw"),
+    ),
+    (
+        ("domain_name", 59),
+        ("registrar", 54),
+        ("registrant", 60),
+        ("registrant_country", None),
+        ("creation_date", 55),
+        ("expiration_date", 56),
+        ("updated_date", 61),
+        ("name_servers", 138),
+        ("status", 127),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 139),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 140),
+        ("name_servers", 141),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 142),
+        ("registrar", None),
+        ("registrant", 143),
+        ("registrant_country", 144),
+        ("creation_date", 145),
+        ("expiration_date", 146),
+        ("updated_date", None),
+        ("name_servers", 147),
+        ("status", 23),
+        ("emails", None),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 52),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 148),
+        ("status", 149),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 150),
+        ("registrant_country", 29),
+        ("creation_date", 151),
+        ("expiration_date", 152),
+        ("updated_date", 153),
+        ("name_servers", 154),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 139),
+        ("registrar", 155),
+        ("registrant", 42),
+        ("registrant_country", 156),
+        ("creation_date", 157),
+        ("expiration_date", 158),
+        ("updated_date", 159),
+        ("name_servers", 160),
+        ("status", 161),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 162),
+        ("registrar", 163),
+        ("registrant", 164),
+        ("registrant_country", 165),
+        ("creation_date", 166),
+        ("expiration_date", 167),
+        ("updated_date", 168),
+        ("name_servers", 62),
+        ("status", 169),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 74),
+        ("registrar", 170),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 171),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 172),
+        ("registrar", 173),
+        ("registrant_country", None),
+        ("creation_date", 174),
+        ("expiration_date", 175),
+        ("updated_date", 176),
+        ("name_servers", 177),
+        ("status", 178),
+    ),
+    (
+        ("domain_name", 59),
+        ("registrar", 179),
+        ("registrant", 180),
+        ("registrant_country", 29),
+        ("creation_date", 89),
+        ("expiration_date", 181),
+        ("updated_date", 182),
+        ("name_servers", 62),
+        ("status", 91),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", None),
+        ("updated_date", None),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+        ("_server", "whois.nic.ge"),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 52),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 183),
+        ("status", 40),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 184),
+        ("registrar", 185),
+        ("registrant", 186),
+        ("registrant_country", 187),
+        ("creation_date", 188),
+        ("expiration_date", 189),
+        ("updated_date", 39),
+        ("name_servers", 190),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("_server", "whois.domino.gq"),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 63),
+        ("registrant", 191),
+        ("registrant_country", None),
+        ("creation_date", 192),
+        ("expiration_date", 181),
+        ("updated_date", None),
+        ("name_servers", 193),
+        ("status", None),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 0),
+        ("name_servers", 3),
+        ("creation_date", 5),
+        ("updated_date", 4),
+        ("status", None),
+        ("registrar", None),
+        ("expiration_date", None),
+        ("registrant_country", None),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 194),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 195),
+        ("expiration_date", 119),
+        ("updated_date", 196),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 0),
+        ("status", None),
+        ("registrar", None),
+        ("registrant_country", None),
+        ("creation_date", 136),
+        ("expiration_date", 181),
+        ("updated_date", 136),
+        ("name_servers", 197),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 198),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 59),
+        ("registrar", 199),
+        ("registrant_country", None),
+        ("creation_date", None),
+        ("status", None),
+        ("expiration_date", 200),
+        ("updated_date", 201),
+        ("name_servers", 58),
+    ),
+    (
+        ("domain_name", 59),
+        ("registrar", None),
+        ("registrant", 60),
+        ("registrant_country", None),
+        ("creation_date", 89),
+        ("expiration_date", 90),
+        ("updated_date", None),
+        ("name_servers", 202),
+        ("status", None),
+        ("emails", 14),
+    ),
+    (
+        ("domain_name", 142),
+        ("registrar", 203),
+        ("registrant", 204),
+        ("registrant_country", 29),
+        ("creation_date", 205),
+        ("expiration_date", 206),
+        ("updated_date", 207),
+        ("name_servers", 208),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 7),
+        ("registrar", 8),
+        ("registrant", 9),
+        ("registrant_country", None),
+        ("creation_date", 209),
+        ("expiration_date", 210),
+        ("updated_date", 211),
+        ("name_servers", 12),
+        ("status", 212),
+        ("emails", 14),
+    ),
+    (
+        ("domain_name", 213),
+        ("registrar", 214),
+        ("registrant", 215),
+        ("registrant_country", 29),
+        ("creation_date", 216),
+        ("expiration_date", 217),
+        ("updated_date", 218),
+        ("name_servers", 22),
+        ("status", 219),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 220),
+        ("registrar", 221),
+        ("registrant_country", 222),
+        ("expiration_date", None),
+        ("creation_date", 223),
+        ("updated_date", 224),
+        ("name_servers", 225),
+        ("status", 226),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", 44),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+    ),
+    (
+        ("domain_name", 142),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 145),
+        ("expiration_date", 146),
+        ("updated_date", 39),
+        ("name_servers", 227),
+        ("status", 228),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 139),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 77),
+        ("expiration_date", 229),
+        ("updated_date", 230),
+        ("name_servers", 160),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 231),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", None),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+        ("_server", "whois.registre.ma"),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 36),
+        ("registrant_country", 29),
+        ("creation_date", 232),
+        ("expiration_date", 233),
+        ("updated_date", 234),
+        ("name_servers", 235),
+        ("status", 40),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 184),
+        ("registrar", 185),
+        ("registrant", 186),
+        ("registrant_country", 187),
+        ("creation_date", 188),
+        ("expiration_date", 189),
+        ("updated_date", 39),
+        ("name_servers", 190),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 198),
+        ("updated_date", 236),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("creation_date", 195),
+        ("expiration_date", 119),
+        ("updated_date", 237),
+        ("registrar", 16),
+        ("name_servers", 238),
+        ("registrant_country", None),
+        ("status", None),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 40),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 239),
+        ("registrar", 240),
+        ("registrant", 241),
+        ("registrant_country", None),
+        ("creation_date", 242),
+        ("expiration_date", 243),
+        ("updated_date", 244),
+        ("name_servers", 245),
+        ("status", None),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", 112),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+        ("_server", "whois.nic.net.ng"),
+    ),
+    (
+        ("domain_name", 246),
+        ("registrar", 247),
+        ("registrant", None),
+        ("registrant_country", None),
+        ("creation_date", 205),
+        ("expiration_date", None),
+        ("updated_date", 248),
+        ("name_servers", 249),
+        ("status", None),
+        ("emails", None),
+    ),
+    (
+        ("domain_name", 59),
+        ("registrar", 54),
+        ("registrant_country", None),
+        ("creation_date", 89),
+        ("expiration_date", 90),
+        ("updated_date", 250),
+        ("name_servers", 62),
+        ("status", 91),
+    ),
+    (
+        ("domain_name", 251),
+        ("registrar", 252),
+        ("registrant", 253),
+        ("registrant_country", None),
+        ("creation_date", 254),
+        ("expiration_date", 255),
+        ("updated_date", 256),
+        ("name_servers", 257),
+        ("status", 258),
+        ("emails", 14),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 198),
+        ("updated_date", 259),
+        ("name_servers", 260),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 261),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("admin", 262),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 52),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 91),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 263),
+        ("registrant", 76),
+        ("registrant_country", 29),
+        ("creation_date", 264),
+        ("expiration_date", 78),
+        ("updated_date", 79),
+        ("name_servers", 80),
+        ("status", 265),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 142),
+        ("registrar", None),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 119),
+        ("updated_date", None),
+        ("name_servers", 266),
+        ("status", 40),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("_privateRegistry", True),
+    ),
+    (
+        ("domain_name", 267),
+        ("status", 268),
+        ("registrar", 269),
+        ("name_servers", 270),
+        ("creation_date", 271),
+        ("expiration_date", 272),
+        ("updated_date", 273),
+        ("registrant_country", None),
+    ),
+    (
+        ("domain_name", 274),
+        ("registrar", 275),
+        ("creation_date", 276),
+        ("expiration_date", 277),
+        ("status", 278),
+        ("name_servers", 279),
+        ("registrant_country", None),
+        ("updated_date", None),
+    ),
+    (
+        ("domain_name", 45),
+        ("registrar", 1),
+        ("status", 280),
+        ("creation_date", 281),
+        ("expiration_date", 282),
+        ("updated_date", 283),
+        ("name_servers", 284),
+        ("registrant_country", None),
+    ),
+    (
+        ("domain_name", 139),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 285),
+        ("expiration_date", 229),
+        ("updated_date", 39),
+        ("name_servers", 160),
+        ("status", 286),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 287),
+        ("registrar", None),
+        ("registrant", 288),
+        ("registrant_country", None),
+        ("creation_date", None),
+        ("expiration_date", None),
+        ("updated_date", None),
+        ("name_servers", 289),
+        ("status", None),
+        ("emails", None),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("_server", "whois.sgnic.sg"),
+        ("registrar", 1),
+        ("domain_name", 274),
+        ("creation_date", 290),
+        ("expiration_date", 291),
+        ("updated_date", 292),
+        ("status", 278),
+        ("registrant_country", None),
+        ("name_servers", None),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 293),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 294),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 295),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 142),
+        ("registrar", 16),
+        ("registrant", 296),
+        ("registrant_country", 297),
+        ("creation_date", 205),
+        ("expiration_date", 298),
+        ("updated_date", 299),
+        ("name_servers", 300),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", 112),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+        ("_server", "whois.afilias-srs.net"),
+    ),
+    (
+        ("domain_name", 0),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", 112),
+        ("updated_date", 4),
+        ("creation_date", 5),
+        ("expiration_date", 6),
+        ("_server", "whois.nic.td"),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 52),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 198),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 301),
+        ("registrar", 302),
+        ("registrant", 303),
+        ("registrant_country", 304),
+        ("creation_date", 305),
+        ("expiration_date", None),
+        ("updated_date", None),
+        ("name_servers", 306),
+        ("status", 307),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 0),
+        ("creation_date", 308),
+        ("expiration_date", 309),
+        ("status", 310),
+        ("registrar", 311),
+        ("updated_date", None),
+        ("registrant_country", None),
+        ("name_servers", None),
+    ),
+    (
+        ("domain_name", 139),
+        ("registrar", 312),
+        ("registrant", 313),
+        ("registrant_country", None),
+        ("creation_date", 285),
+        ("expiration_date", 56),
+        ("updated_date", 314),
+        ("status", None),
+        ("name_servers", 160),
+    ),
+    (
+        ("domain_name", 139),
+        ("registrar", 155),
+        ("registrant", 42),
+        ("registrant_country", 156),
+        ("creation_date", 315),
+        ("expiration_date", 158),
+        ("updated_date", 159),
+        ("name_servers", 160),
+        ("status", 161),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 76),
+        ("registrant_country", 29),
+        ("creation_date", 316),
+        ("expiration_date", 317),
+        ("updated_date", 318),
+        ("name_servers", 130),
+        ("status", 34),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 52),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 119),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", None),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("_server", "whois.nic.vip"),
+    ),
+    (
+        ("domain_name", 0),
+        ("creation_date", 5),
+        ("expiration_date", 319),
+        ("updated_date", 39),
+        ("registrar", 1),
+        ("status", 2),
+        ("name_servers", 3),
+        ("registrant_country", None),
+    ),
+    (
+        ("domain_name", 15),
+        ("registrar", 16),
+        ("registrant", 42),
+        ("registrant_country", 29),
+        ("creation_date", 37),
+        ("expiration_date", 38),
+        ("updated_date", 39),
+        ("name_servers", 22),
+        ("status", 23),
+        ("emails", 14),
+        ("reg_id", 24),
+        ("reg_abuse", 25),
+        ("_server", "whois.nic.xin"),
+    ),
+)
+
+# tld -> index in TABLES
+TLDS = {
+    "ac": 0,
+    "ac_jp": 1,
+    "ac_th": 2,
+    "ac_uk": 3,
+    "academy": 4,
+    "accountants": 4,
+    "actor": 4,
+    "ad_jp": 1,
+    "ae": 5,
+    "aero": 6,
+    "af": 0,
+    "ag": 0,
+    "agency": 4,
+    "ai": 7,
+    "airforce": 4,
+    "al": 8,
+    "am": 9,
+    "amsterdam": 10,
+    "apartments": 4,
+    "app": 7,
+    "ar": 11,
+    "army": 4,
+    "art": 12,
+    "asia": 7,
+    "associates": 4,
+    "at": 13,
+    "attorney": 4,
+    "au": 14,
+    "auction": 4,
+    "auto": 12,
+    "autos": 12,
+    "aw": 15,
+    "ax": 16,
+    "az": 8,
+    "ba": 8,
+    "baby": 12,
+    "band": 4,
+    "bank": 17,
+    "bar": 12,
+    "bargains": 4,
+    "be": 18,
+    "beauty": 12,
+    "best": 12,
+    "bet": 19,
+    "bg": 20,
+    "bid": 21,
+    "bike": 4,
+    "bingo": 4,
+    "biz": 22,
+    "bj": 23,
+    "blog": 12,
+    "bo": 24,
+    "boats": 12,
+    "bond": 12,
+    "boutique": 4,
+    "br": 25,
+    "build": 12,
+    "builders": 4,
+    "business": 4,
+    "buzz": 10,
+    "by": 26,
+    "bzh": 27,
+    "ca": 17,
+    "ca_ug": 28,
+    "cab": 4,
+    "cafe": 4,
+    "cam": 12,
+    "camera": 4,
+    "camp": 4,
+    "capital": 4,
+    "car": 12,
+    "cards": 4,
+    "care": 4,
+    "careers": 4,
+    "cars": 12,
+    "casa": 29,
+    "cash": 4,
+    "casino": 4,
+    "cat": 30,
+    "catering": 4,
+    "cc": 17,
+    "cd": 31,
+    "center": 4,
+    "ceo": 12,
+    "cf": 32,
+    "cfd": 12,
+    "ch": 8,
+    "charity": 4,
+    "chat": 4,
+    "cheap": 4,
+    "church": 4,
+    "city": 4,
+    "cl": 33,
+    "claims": 4,
+    "cleaning": 4,
+    "click": 7,
+    "clinic": 4,
+    "clothing": 4,
+    "cloud": 7,
+    "club": 7,
+    "cn": 34,
+    "co": 35,
+    "co_il": 36,
+    "co_jp": 1,
+    "co_ke": 8,
+    "co_th": 2,
+    "co_ug": 28,
+    "coach": 4,
+    "codes": 4,
+    "coffee": 4,
+    "college": 12,
+    "com": 7,
+    "com_au": 14,
+    "com_bo": 24,
+    "com_ec": 8,
+    "com_ly": 37,
+    "com_np": 8,
+    "com_sg": 38,
+    "com_tr": 39,
+    "com_tw": 40,
+    "com_zw": 8,
+    "community": 4,
+    "company": 4,
+    "computer": 4,
+    "condos": 4,
+    "construction": 4,
+    "consulting": 4,
+    "contact": 4,
+    "contractors": 4,
+    "cool": 4,
+    "coop": 12,
+    "coupons": 4,
+    "courses": 7,
+    "cr": 41,
+    "credit": 4,
+    "creditcard": 4,
+    "cruises": 4,
+    "cw": 8,
+    "cyou": 12,
+    "cz": 41,
+    "dance": 4,
+    "dating": 4,
+    "de": 42,
+    "dealer": 12,
+    "deals": 4,
+    "degree": 4,
+    "delivery": 4,
+    "democrat": 4,
+    "dental": 4,
+    "dentist": 4,
+    "desi": 12,
+    "design": 0,
+    "dev": 7,
+    "diamonds": 4,
+    "digital": 4,
+    "direct": 4,
+    "directory": 4,
+    "discount": 4,
+    "dk": 43,
+    "doctor": 4,
+    "dog": 4,
+    "domains": 4,
+    "download": 44,
+    "duckdns_org": 8,
+    "ec": 8,
+    "ed_jp": 1,
+    "edu": 45,
+    "edu_tr": 39,
+    "edu_ua": 46,
+    "education": 4,
+    "ee": 47,
+    "email": 4,
+    "energy": 4,
+    "engineer": 4,
+    "engineering": 4,
+    "enterprises": 4,
+    "equipment": 4,
+    "es": 8,
+    "estate": 4,
+    "eu": 48,
+    "eus": 0,
+    "events": 4,
+    "exchange": 4,
+    "expert": 4,
+    "exposed": 4,
+    "express": 4,
+    "fail": 4,
+    "family": 4,
+    "fan": 4,
+    "fans": 12,
+    "farm": 4,
+    "feedback": 12,
+    "fi": 49,
+    "finance": 4,
+    "financial": 4,
+    "fish": 4,
+    "fit": 7,
+    "fitness": 4,
+    "flights": 4,
+    "florist": 4,
+    "fm": 7,
+    "football": 4,
+    "forsale": 4,
+    "forum": 12,
+    "foundation": 4,
+    "fr": 50,
+    "frl": 12,
+    "fun": 12,
+    "fund": 4,
+    "furniture": 4,
+    "futbol": 4,
+    "fyi": 4,
+    "ga": 8,
+    "gallery": 4,
+    "game": 10,
+    "games": 4,
+    "ge": 51,
+    "gent": 12,
+    "geo_jp": 1,
+    "gifts": 4,
+    "gives": 4,
+    "glass": 4,
+    "global_": 52,
+    "gmbh": 4,
+    "go_jp": 1,
+    "go_th": 2,
+    "gob_ec": 8,
+    "gold": 4,
+    "golf": 4,
+    "gq": 53,
+    "gr": 8,
+    "gr_jp": 1,
+    "graphics": 4,
+    "gratis": 4,
+    "gripe": 4,
+    "group": 4,
+    "guide": 4,
+    "guru": 4,
+    "gy": 7,
+    "hair": 12,
+    "haus": 4,
+    "healthcare": 4,
+    "hk": 54,
+    "hn": 7,
+    "hockey": 4,
+    "holdings": 4,
+    "holiday": 4,
+    "homes": 12,
+    "hopto_org": 8,
+    "hospital": 4,
+    "host": 12,
+    "house": 4,
+    "hr": 55,
+    "hu": 8,
+    "icu": 12,
+    "id_": 56,
+    "ie": 7,
+    "im": 57,
+    "immo": 4,
+    "immobilien": 4,
+    "in_": 7,
+    "in_th": 2,
+    "inc": 12,
+    "industries": 4,
+    "info": 7,
+    "ink": 10,
+    "institute": 4,
+    "insure": 4,
+    "international": 4,
+    "investments": 4,
+    "io": 58,
+    "ir": 59,
+    "irish": 4,
+    "is_": 60,
+    "it": 61,
+    "jetzt": 4,
+    "jewelry": 4,
+    "jp": 62,
+    "kaufen": 4,
+    "ke": 8,
+    "kitchen": 4,
+    "kiwi": 7,
+    "kr": 63,
+    "kred": 12,
+    "kz": 64,
+    "la": 7,
+    "land": 4,
+    "lawyer": 4,
+    "lease": 4,
+    "legal": 4,
+    "lg_jp": 1,
+    "li": 8,
+    "life": 4,
+    "lighting": 4,
+    "limited": 4,
+    "limo": 4,
+    "link": 10,
+    "live": 4,
+    "loans": 4,
+    "lol": 10,
+    "london": 12,
+    "love": 65,
+    "lt": 66,
+    "ltd": 4,
+    "luxury": 12,
+    "lv": 67,
+    "ly": 37,
+    "ma": 68,
+    "maison": 4,
+    "makeup": 12,
+    "management": 4,
+    "market": 4,
+    "marketing": 4,
+    "mba": 4,
+    "me": 69,
+    "media": 4,
+    "memorial": 4,
+    "mg": 65,
+    "ml": 70,
+    "mobi": 71,
+    "moda": 4,
+    "moe": 65,
+    "money": 4,
+    "monster": 12,
+    "mortgage": 4,
+    "motorcycles": 12,
+    "movie": 4,
+    "mp": 8,
+    "mu": 17,
+    "mx": 72,
+    "my": 8,
+    "name": 73,
+    "navy": 4,
+    "nc": 74,
+    "ne_jp": 1,
+    "net": 7,
+    "network": 4,
+    "news": 4,
+    "ng": 75,
+    "ninja": 4,
+    "nl": 15,
+    "no": 76,
+    "np": 8,
+    "nu": 77,
+    "nyc": 17,
+    "nz": 78,
+    "ong": 29,
+    "onion": 8,
+    "online": 12,
+    "ooo": 12,
+    "or_jp": 1,
+    "org": 79,
+    "org_tr": 39,
+    "org_zw": 8,
+    "ovh": 7,
+    "partners": 4,
+    "parts": 4,
+    "pe": 80,
+    "pet": 4,
+    "pharmacy": 81,
+    "photography": 4,
+    "photos": 4,
+    "pics": 0,
+    "pictures": 4,
+    "pizza": 4,
+    "pk": 8,
+    "pl": 82,
+    "place": 4,
+    "plumbing": 4,
+    "plus": 4,
+    "press": 12,
+    "pro": 7,
+    "productions": 4,
+    "properties": 4,
+    "protection": 12,
+    "pt": 83,
+    "pub": 4,
+    "pw": 17,
+    "qpon": 12,
+    "quest": 12,
+    "re": 84,
+    "recipes": 4,
+    "red": 7,
+    "rehab": 4,
+    "reise": 4,
+    "reisen": 4,
+    "reit": 12,
+    "rent": 12,
+    "rentals": 4,
+    "repair": 4,
+    "report": 4,
+    "republican": 4,
+    "rest": 12,
+    "restaurant": 4,
+    "reviews": 4,
+    "rip": 4,
+    "ro": 85,
+    "rocks": 4,
+    "rs": 86,
+    "ru": 87,
+    "ru_rf": 87,
+    "run": 4,
+    "rw": 17,
+    "sa": 88,
+    "saarland": 12,
+    "sale": 4,
+    "salon": 4,
+    "sarl": 4,
+    "sbs": 12,
+    "school": 4,
+    "schule": 4,
+    "se": 77,
+    "security": 12,
+    "services": 4,
+    "sg": 89,
+    "sh": 90,
+    "shoes": 4,
+    "shop": 7,
+    "shopping": 4,
+    "show": 4,
+    "singles": 4,
+    "site": 12,
+    "sk": 91,
+    "skin": 12,
+    "soccer": 4,
+    "social": 4,
+    "software": 4,
+    "solar": 4,
+    "solutions": 4,
+    "space": 12,
+    "sr": 8,
+    "srl": 92,
+    "storage": 12,
+    "store": 12,
+    "studio": 4,
+    "study": 7,
+    "style": 4,
+    "su": 87,
+    "supplies": 4,
+    "supply": 4,
+    "support": 4,
+    "surgery": 4,
+    "systems": 4,
+    "tax": 4,
+    "taxi": 4,
+    "td": 93,
+    "team": 4,
+    "tech": 12,
+    "technology": 4,
+    "tel": 94,
+    "tennis": 4,
+    "theater": 4,
+    "theatre": 12,
+    "tickets": 12,
+    "tienda": 4,
+    "tips": 4,
+    "tires": 4,
+    "tk": 8,
+    "tn": 95,
+    "to": 8,
+    "today": 4,
+    "tools": 4,
+    "top": 7,
+    "tours": 4,
+    "town": 4,
+    "toys": 4,
+    "trade": 10,
+    "training": 4,
+    "travel": 4,
+    "tv": 17,
+    "tw": 96,
+    "tz": 97,
+    "ua": 98,
+    "ug": 28,
+    "uk": 99,
+    "university": 4,
+    "uno": 12,
+    "us": 73,
+    "uy": 8,
+    "uz": 100,
+    "va": 8,
+    "vacations": 4,
+    "ventures": 4,
+    "vet": 4,
+    "viajes": 4,
+    "video": 4,
+    "villas": 4,
+    "vin": 4,
+    "vip": 101,
+    "vision": 4,
+    "vn": 8,
+    "voyage": 4,
+    "vu": 8,
+    "watch": 4,
+    "website": 12,
+    "wiki": 17,
+    "win": 7,
+    "wine": 4,
+    "work": 17,
+    "works": 4,
+    "world": 4,
+    "ws": 102,
+    "wtf": 4,
+    "xin": 103,
+    "xyz": 12,
+    "yachts": 12,
+    "za": 7,
+    "zone": 4,
+    "zuerich": 12,
+    "zw": 8,
+}